@@ -20,8 +20,13 @@ from discord.ext import tasks
 from dotenv import load_dotenv
 
 from tradingagents.graph.trading_graph import TradingAgentsGraph
+from tradingagents.graph.process_pool import AnalysisProcessPool
+from tradingagents.graph.job_queue import AnalysisJobQueue
 from tradingagents.default_config import DEFAULT_CONFIG
+from tradingagents.dataflows.feature_store import build_feature_store, get_feature_store
+from tradingagents.agents.utils.debate_transcript import render_turns
 from kis_client import KISClient, format_krw, format_usd
+from shared_cache import SharedCache
 from trade_history import (
     record_trade,
     record_pnl,
@@ -75,10 +80,25 @@ US_AUTO_SELL_TIME = os.getenv("US_AUTO_SELL_TIME", "15:50")
 _us_buy_h, _us_buy_m = (int(x) for x in US_AUTO_BUY_TIME.split(":"))
 _us_sell_h, _us_sell_m = (int(x) for x in US_AUTO_SELL_TIME.split(":"))
 
+# 장 마감 후 기술지표 사전 계산 (다음 날 분석은 저장된 지표를 바로 사용)
+FEATURE_STORE_ENABLED = os.getenv("FEATURE_STORE_ENABLED", "true").lower() == "true"
+FEATURE_STORE_KR_TIME = os.getenv("FEATURE_STORE_KR_TIME", "18:00")  # KST
+FEATURE_STORE_US_TIME = os.getenv("FEATURE_STORE_US_TIME", "17:30")  # ET
+# 순위 API 상위 종목·보유종목·US_WATCHLIST 외에 항상 포함할 종목 (쉼표 구분)
+FEATURE_STORE_KR_UNIVERSE = [
+    x.strip().upper() for x in os.getenv("FEATURE_STORE_KR_UNIVERSE", "").split(",") if x.strip()
+]
+FEATURE_STORE_US_UNIVERSE = [
+    x.strip().upper() for x in os.getenv("FEATURE_STORE_US_UNIVERSE", "").split(",") if x.strip()
+]
+_fs_kr_h, _fs_kr_m = (int(x) for x in FEATURE_STORE_KR_TIME.split(":"))
+_fs_us_h, _fs_us_m = (int(x) for x in FEATURE_STORE_US_TIME.split(":"))
+
 config = DEFAULT_CONFIG.copy()
 config["deep_think_llm"] = os.getenv("DEEP_THINK_LLM", "gemini-3-flash-preview")
 config["quick_think_llm"] = os.getenv("QUICK_THINK_LLM", "gemini-3-flash-preview")
 config["max_debate_rounds"] = int(os.getenv("MAX_DEBATE_ROUNDS", "1"))
+config["result_cache_ttl"] = int(os.getenv("RESULT_CACHE_TTL_SEC", str(6 * 60 * 60)))
 config["data_vendors"] = {
     "core_stock_apis": "yfinance",
     "technical_indicators": "yfinance",
@@ -86,6 +106,23 @@ config["data_vendors"] = {
     "news_data": "yfinance",
 }
 
+# 분석 실행 방식: 0이면 봇 프로세스의 스레드에서, 1 이상이면 해당 개수의 워커 프로세스에서 실행
+# (워커는 그래프를 한 번만 만들어 재사용하고, CPU 작업이 이벤트 루프와 GIL을 다투지 않음)
+ANALYSIS_PROCESS_WORKERS = int(os.getenv("ANALYSIS_PROCESS_WORKERS", "0"))
+_analysis_pool = (
+    AnalysisProcessPool(config, max_workers=ANALYSIS_PROCESS_WORKERS)
+    if ANALYSIS_PROCESS_WORKERS > 0
+    else None
+)
+
+# Redis 작업 큐를 지정하면 분석을 큐에 넣고, 다른 머신/프로세스의 워커가 실행
+# (워커: python -m tradingagents.graph.job_queue --redis-url <URL>)
+ANALYSIS_QUEUE_REDIS_URL = os.getenv("ANALYSIS_QUEUE_REDIS_URL", "")
+ANALYSIS_QUEUE_TIMEOUT_SEC = int(os.getenv("ANALYSIS_QUEUE_TIMEOUT_SEC", "1800"))
+_analysis_queue = (
+    AnalysisJobQueue.from_url(ANALYSIS_QUEUE_REDIS_URL) if ANALYSIS_QUEUE_REDIS_URL else None
+)
+
 
 # ─── Bot Setup ─────────────────────────────────────────────────
 intents = discord.Intents.default()
@@ -104,7 +141,13 @@ TICKER_PATTERN = re.compile(r"^[A-Z0-9][A-Z0-9.\-]{0,14}$")
 REPORTS_DIR = Path(os.getenv("REPORTS_DIR", "reports"))
 REPORTS_DIR.mkdir(parents=True, exist_ok=True)
 AUTO_REPORT_UPLOAD = os.getenv("AUTO_REPORT_UPLOAD", "true").lower() == "true"
-_analysis_symbol_cache: dict[str, str] = {}
+# KR 분석 심볼(.KS/.KQ) 판별 결과 — executor 스레드에서 공유
+_analysis_symbol_cache = SharedCache(
+    "analysis_symbols",
+    maxsize=1024,
+    ttl=7 * 24 * 3600,
+    persist_path=Path(__file__).parent / "data" / "analysis_symbols.json",
+)
 
 
 def _log(level: str, event: str, message: str):
@@ -151,8 +194,9 @@ def _resolve_analysis_symbol(
     if not (t.isdigit() and len(t) == 6):
         return t
 
-    if t in _analysis_symbol_cache:
-        return _analysis_symbol_cache[t]
+    cached = _analysis_symbol_cache.get(t)
+    if cached:
+        return cached
 
     ref = float(reference_price or 0)
     if ref <= 0 and kis.is_configured:
@@ -177,12 +221,34 @@ def _resolve_analysis_symbol(
     else:
         resolved = max(available.keys(), key=lambda sym: available[sym])
 
-    _analysis_symbol_cache[t] = resolved
+    _analysis_symbol_cache.set(t, resolved)
     if resolved != f"{t}.KS":
         _log("INFO", "ANALYSIS_SYMBOL_RESOLVED", f"ticker={t} resolved={resolved}")
     return resolved
 
 
+async def _run_analysis(
+    analysis_symbol: str, trade_date: str, use_cache: bool = True
+) -> tuple[dict, str]:
+    """TradingAgents 분석 실행 — 작업 큐 > 프로세스 풀 > 봇 프로세스 스레드 순으로 사용."""
+    if _analysis_queue is not None:
+        job_id = await asyncio.to_thread(
+            _analysis_queue.enqueue, analysis_symbol, trade_date, config, None, use_cache
+        )
+        result = await asyncio.to_thread(
+            _analysis_queue.wait, job_id, ANALYSIS_QUEUE_TIMEOUT_SEC
+        )
+        if result is None:
+            raise TimeoutError(f"분석 작업 시간 초과 (job={job_id})")
+        if result["status"] != "done":
+            raise RuntimeError(f"분석 작업 실패 (job={job_id}): {result.get('error')}")
+        return result["final_state"], result["decision"]
+    if _analysis_pool is not None:
+        return await _analysis_pool.run(analysis_symbol, trade_date, use_cache)
+    ta = TradingAgentsGraph(debug=False, config=config)
+    return await asyncio.to_thread(ta.propagate, analysis_symbol, trade_date, use_cache)
+
+
 def _yf_ticker(ticker: str, reference_price: float | None = None) -> str:
     """TradingAgents에 전달할 yfinance 심볼 반환."""
     t = (ticker or "").upper().strip()
@@ -363,11 +429,14 @@ def _build_report_text(
 
     if final_state.get("investment_debate_state"):
         debate = final_state["investment_debate_state"]
+        turns = final_state.get("investment_debate_turns")
         research_parts = []
-        if debate.get("bull_history"):
-            research_parts.append(("🟢 강세 애널리스트", debate["bull_history"]))
-        if debate.get("bear_history"):
-            research_parts.append(("🔴 약세 애널리스트", debate["bear_history"]))
+        bull_history = render_turns(turns, "Bull")
+        if bull_history:
+            research_parts.append(("🟢 강세 애널리스트", bull_history))
+        bear_history = render_turns(turns, "Bear")
+        if bear_history:
+            research_parts.append(("🔴 약세 애널리스트", bear_history))
         if debate.get("judge_decision"):
             research_parts.append(("⚖️ 리서치 매니저", debate["judge_decision"]))
         if research_parts:
@@ -381,13 +450,17 @@ def _build_report_text(
 
     if final_state.get("risk_debate_state"):
         risk = final_state["risk_debate_state"]
+        turns = final_state.get("risk_debate_turns")
         risk_parts = []
-        if risk.get("aggressive_history"):
-            risk_parts.append(("🔥 공격적 애널리스트", risk["aggressive_history"]))
-        if risk.get("conservative_history"):
-            risk_parts.append(("🛡️ 보수적 애널리스트", risk["conservative_history"]))
-        if risk.get("neutral_history"):
-            risk_parts.append(("⚖️ 중립적 애널리스트", risk["neutral_history"]))
+        aggressive_history = render_turns(turns, "Aggressive")
+        if aggressive_history:
+            risk_parts.append(("🔥 공격적 애널리스트", aggressive_history))
+        conservative_history = render_turns(turns, "Conservative")
+        if conservative_history:
+            risk_parts.append(("🛡️ 보수적 애널리스트", conservative_history))
+        neutral_history = render_turns(turns, "Neutral")
+        if neutral_history:
+            risk_parts.append(("⚖️ 중립적 애널리스트", neutral_history))
         if risk_parts:
             content = "\n\n".join(f"### {name}\n{text}" for name, text in risk_parts)
             sections.append(f"## IV. 리스크 관리팀 결정\n\n{content}")
@@ -794,10 +867,9 @@ async def _run_top5_analysis(channel: discord.abc.Messageable, trade_date: str):
             f"🔍 [{i+1}/5] **{name}** (`{ticker}`) 분석 중… (약 2~5분)"
         )
         try:
-            ta = TradingAgentsGraph(debug=False, config=config)
             analysis_symbol = _yf_ticker(ticker, reference_price=stock_info["price"])
-            final_state, decision = await loop.run_in_executor(
-                None, ta.propagate, analysis_symbol, trade_date
+            final_state, decision = await _run_analysis(
+                analysis_symbol, trade_date
             )
 
             color_map = {"BUY": 0x00FF00, "SELL": 0xFF0000, "HOLD": 0xFFAA00}
@@ -856,7 +928,6 @@ async def _run_top5_analysis(channel: discord.abc.Messageable, trade_date: str):
     # ── SELL 종목: 보유 중이면 매도 버튼 표시 ──────────────────
     if sell_targets and kis.is_configured:
         try:
-            loop = asyncio.get_running_loop()
             balance_data = await loop.run_in_executor(None, kis.get_balance, "KR")
             holdings_map = {h["ticker"]: h for h in balance_data["holdings"]}
         except Exception:
@@ -1107,11 +1178,13 @@ class SellConfirmView(discord.ui.View):
 @app_commands.describe(
     ticker="분석할 종목 티커 (예: AAPL, MSFT, 005930)",
     date="분석 기준일 (YYYY-MM-DD, 기본: 오늘)",
+    refresh="캐시된 결과를 무시하고 새로 분석 (기본: False)",
 )
 async def analyze(
     interaction: discord.Interaction,
     ticker: str,
     date: str | None = None,
+    refresh: bool = False,
 ):
     ticker = ticker.upper().strip()
     market = _market_of_ticker(ticker)
@@ -1157,7 +1230,6 @@ async def analyze(
 
         try:
             loop = asyncio.get_running_loop()
-            ta = TradingAgentsGraph(debug=False, config=config)
             analysis_ref_price = None
             if market == "KR" and kis.is_configured:
                 try:
@@ -1167,8 +1239,8 @@ async def analyze(
                 except Exception:
                     analysis_ref_price = None
             analysis_symbol = _yf_ticker(ticker, reference_price=analysis_ref_price)
-            final_state, decision = await loop.run_in_executor(
-                None, ta.propagate, analysis_symbol, trade_date
+            final_state, decision = await _run_analysis(
+                analysis_symbol, trade_date, use_cache=not refresh
             )
 
             report_text = _build_report_text(
@@ -2115,10 +2187,9 @@ async def morning_auto_buy():
                 f"**{c['name']}** (`{c['ticker']}`) AI 분석 중… (약 3~5분)"
             )
             try:
-                ta = TradingAgentsGraph(debug=False, config=config)
                 analysis_symbol = _yf_ticker(c["ticker"], reference_price=c["price"])
-                final_state, decision = await loop.run_in_executor(
-                    None, ta.propagate, analysis_symbol, trade_date
+                final_state, decision = await _run_analysis(
+                    analysis_symbol, trade_date
                 )
                 emoji = "🟢" if decision == "BUY" else "🔴" if decision == "SELL" else "🟡"
                 color_map = {"BUY": 0x00FF00, "SELL": 0xFF0000, "HOLD": 0xFFAA00}
@@ -2544,9 +2615,8 @@ async def us_morning_auto_buy():
                 f"**{c['name']}** (`{c['ticker']}`) AI 분석 중…"
             )
             try:
-                ta = TradingAgentsGraph(debug=False, config=config)
-                final_state, decision = await loop.run_in_executor(
-                    None, ta.propagate, c["ticker"], trade_date
+                final_state, decision = await _run_analysis(
+                    c["ticker"], trade_date
                 )
                 emoji = "🟢" if decision == "BUY" else "🔴" if decision == "SELL" else "🟡"
                 color_map = {"BUY": 0x00FF00, "SELL": 0xFF0000, "HOLD": 0xFFAA00}
@@ -2852,6 +2922,31 @@ async def before_us_afternoon():
 
 
 # ─── 스케줄: 보유종목 손절/익절 모니터링 ─────────────────
+# 감시 주기마다 관측한 가격으로 만든 오늘 봉 (시장, 티커) → 날짜/시가/고가/저가
+_intraday_bars: dict[tuple[str, str], dict] = {}
+
+
+def _intraday_indicators(ticker: str, market: str, price: float) -> dict | None:
+    """오늘 봉을 현재가로 갱신하고, 사전 계산된 지표 상태에 이어 붙인 장중 지표.
+
+    거래량은 알 수 없어 0으로 두므로 VWMA/MFI에는 오늘 봉이 반영되지 않는다.
+    지표 저장소에 종목이 없으면 None.
+    """
+    store = get_feature_store(config) if FEATURE_STORE_ENABLED else None
+    if store is None or price <= 0:
+        return None
+    today = datetime.datetime.now(NY_TZ if market == "US" else KST).date()
+    bar = _intraday_bars.get((market, ticker))
+    if bar is None or bar["date"] != today:
+        bar = _intraday_bars[(market, ticker)] = {
+            "date": today, "open": price, "high": price, "low": price,
+        }
+    bar["high"] = max(bar["high"], price)
+    bar["low"] = min(bar["low"], price)
+    symbol = _resolve_analysis_symbol(ticker, market, price)
+    return store.intraday(symbol, bar["open"], bar["high"], bar["low"], price, 0.0)
+
+
 @tasks.loop(minutes=MONITOR_INTERVAL_MIN)
 async def monitor_holdings():
     """보유종목 수익률 감시 → 손절/익절 라인 도달 시 자동 매도."""
@@ -2882,6 +2977,25 @@ async def monitor_holdings():
         market = h.get("market", _market_of_ticker(h["ticker"]))
         if not _is_market_open_now(market):
             continue
+        try:
+            indicators = await loop.run_in_executor(
+                None, _intraday_indicators, h["ticker"], market, h["current_price"]
+            )
+        except Exception as e:
+            indicators = None
+            _log("WARN", "MONITOR_INDICATOR_FAIL", f"ticker={h['ticker']} error={str(e)[:120]}")
+        indicator_line = ""
+        if indicators:
+            indicator_line = (
+                f"**장중 지표:** RSI {indicators['rsi']:.1f} | "
+                f"ATR {indicators['atr']:,.2f} | 10EMA {indicators['close_10_ema']:,.2f}\n"
+            )
+            _log(
+                "INFO",
+                "MONITOR_INDICATORS",
+                f"market={market} ticker={h['ticker']} rate={rate:+.2f}% "
+                f"rsi={indicators['rsi']:.1f} atr={indicators['atr']:.4g}",
+            )
         triggered = False
         title = ""
         desc_extra = ""
@@ -2939,7 +3053,8 @@ async def monitor_holdings():
                         f"**시장:** {market}\n"
                         f"**종목:** {h['name']} (`{h['ticker']}`)\n"
                         f"**매도:** {h['qty']}주 × {_format_money(sell_price, currency)}\n"
-                        f"**손익:** {_format_money(h['pnl'], currency)} ({rate:+.2f}%)\n\n"
+                        f"**손익:** {_format_money(h['pnl'], currency)} ({rate:+.2f}%)\n"
+                        f"{indicator_line}\n"
                         f"{desc_extra}"
                     ),
                     color=0xFF0000 if rate < 0 else 0x00FF00,
@@ -2968,6 +3083,90 @@ async def before_monitor():
     await bot.wait_until_ready()
 
 
+# ─── 스케줄: 장 마감 후 기술지표 사전 계산 ───────────────
+async def _feature_store_universe(market: str) -> list[str]:
+    """사전 계산 대상 yfinance 심볼 (고정 목록 + 순위 상위 + 보유종목)."""
+    loop = asyncio.get_running_loop()
+    if market == "US":
+        tickers = list(FEATURE_STORE_US_UNIVERSE) + list(kis.us_watchlist)
+    else:
+        tickers = list(FEATURE_STORE_KR_UNIVERSE)
+        if kis.is_configured:
+            for fetch in (kis.get_top_market_cap, kis.get_volume_rank):
+                try:
+                    ranked = await loop.run_in_executor(None, fetch, 30)
+                    tickers.extend(s["ticker"] for s in ranked)
+                except Exception as e:
+                    _log("WARN", "FEATURE_UNIVERSE_RANK_FAIL", f"error={str(e)[:120]}")
+    if kis.is_configured:
+        try:
+            balance = await loop.run_in_executor(None, kis.get_balance, market)
+            tickers.extend(h["ticker"] for h in balance["holdings"])
+        except Exception as e:
+            _log("WARN", "FEATURE_UNIVERSE_BALANCE_FAIL", f"market={market} error={str(e)[:120]}")
+
+    symbols: list[str] = []
+    for ticker in dict.fromkeys(tickers):
+        symbol = await loop.run_in_executor(None, _resolve_analysis_symbol, ticker, market)
+        symbols.append(symbol)
+    return list(dict.fromkeys(symbols))
+
+
+async def _refresh_features(market: str):
+    """시장 유니버스의 일봉을 증분 갱신하고 지표를 다시 계산."""
+    action = f"feature_store_{market}"
+    if is_action_done(action):
+        _log("INFO", "FEATURE_STORE_SKIP", f"market={market} 오늘 이미 완료")
+        return
+    symbols = await _feature_store_universe(market)
+    if not symbols:
+        return
+    _log("INFO", "FEATURE_STORE_START", f"market={market} symbols={len(symbols)}")
+    loop = asyncio.get_running_loop()
+    summary = await loop.run_in_executor(None, build_feature_store, symbols, config)
+    mark_action_done(
+        action, details=f"updated={len(summary['updated'])} failed={len(summary['failed'])}"
+    )
+    _log(
+        "INFO",
+        "FEATURE_STORE_DONE",
+        f"market={market} updated={len(summary['updated'])} "
+        f"failed={len(summary['failed'])} seconds={summary['seconds']}",
+    )
+
+
+@tasks.loop(time=datetime.time(hour=_fs_kr_h, minute=_fs_kr_m, tzinfo=KST))
+async def kr_feature_refresh():
+    """KR 장 마감 후(기본 18:00) 코스피/코스닥 유니버스 지표 사전 계산."""
+    if not _is_market_day("KR"):
+        return
+    try:
+        await _refresh_features("KR")
+    except Exception as e:
+        _log("ERROR", "FEATURE_STORE_ERROR", f"market=KR error={str(e)[:200]}")
+
+
+@kr_feature_refresh.before_loop
+async def before_kr_feature_refresh():
+    await bot.wait_until_ready()
+
+
+@tasks.loop(time=datetime.time(hour=_fs_us_h, minute=_fs_us_m, tzinfo=NY_TZ))
+async def us_feature_refresh():
+    """US 장 마감 후(기본 17:30 ET) 워치리스트 지표 사전 계산."""
+    if not _is_market_day("US"):
+        return
+    try:
+        await _refresh_features("US")
+    except Exception as e:
+        _log("ERROR", "FEATURE_STORE_ERROR", f"market=US error={str(e)[:200]}")
+
+
+@us_feature_refresh.before_loop
+async def before_us_feature_refresh():
+    await bot.wait_until_ready()
+
+
 # ─── Bot Events ────────────────────────────────────────────────
 @bot.event
 async def on_ready():
@@ -2982,6 +3181,10 @@ async def on_ready():
         us_afternoon_auto_sell.start()
     if not monitor_holdings.is_running():
         monitor_holdings.start()
+    if FEATURE_STORE_ENABLED and not kr_feature_refresh.is_running():
+        kr_feature_refresh.start()
+    if FEATURE_STORE_ENABLED and ENABLE_US_TRADING and not us_feature_refresh.is_running():
+        us_feature_refresh.start()
     print(f"✅ {bot.user} 로그인 완료!")
     print(f"   서버 수: {len(bot.guilds)}")
     print(f"   동기화된 슬래시 명령 수: {len(synced)}")
@@ -2997,6 +3200,8 @@ async def on_ready():
         print("   US 데이 트레이딩: 비활성화 (ENABLE_US_TRADING=false)")
     print(f"   손절: {STOP_LOSS_PCT}% | 익절: {TAKE_PROFIT_PCT}%")
     print(f"   모니터링: {MONITOR_INTERVAL_MIN}분 간격")
+    if FEATURE_STORE_ENABLED:
+        print(f"   지표 사전 계산: KR {FEATURE_STORE_KR_TIME} KST / US {FEATURE_STORE_US_TIME} ET")
     if ALLOWED_CHANNEL_IDS:
         print(f"   허용 채널: {ALLOWED_CHANNEL_IDS}")
     else:
@@ -25,6 +25,9 @@ from rich.rule import Rule
 
 from tradingagents.graph.trading_graph import TradingAgentsGraph
 from tradingagents.default_config import DEFAULT_CONFIG
+from tradingagents.dataflows.config import config_scope
+from tradingagents.dataflows.interface import vendor_call_scope
+from tradingagents.agents.utils.debate_transcript import render_turns
 from cli.models import AnalystType
 from cli.utils import *
 from cli.announcements import fetch_announcements, display_announcements
@@ -645,15 +648,18 @@ def save_report_to_disk(final_state, ticker: str, save_path: Path):
     if final_state.get("investment_debate_state"):
         research_dir = save_path / "2_research"
         debate = final_state["investment_debate_state"]
+        turns = final_state.get("investment_debate_turns")
         research_parts = []
-        if debate.get("bull_history"):
+        bull_history = render_turns(turns, "Bull")
+        if bull_history:
             research_dir.mkdir(exist_ok=True)
-            (research_dir / "bull.md").write_text(debate["bull_history"])
-            research_parts.append(("강세 애널리스트", debate["bull_history"]))
-        if debate.get("bear_history"):
+            (research_dir / "bull.md").write_text(bull_history)
+            research_parts.append(("강세 애널리스트", bull_history))
+        bear_history = render_turns(turns, "Bear")
+        if bear_history:
             research_dir.mkdir(exist_ok=True)
-            (research_dir / "bear.md").write_text(debate["bear_history"])
-            research_parts.append(("약세 애널리스트", debate["bear_history"]))
+            (research_dir / "bear.md").write_text(bear_history)
+            research_parts.append(("약세 애널리스트", bear_history))
         if debate.get("judge_decision"):
             research_dir.mkdir(exist_ok=True)
             (research_dir / "manager.md").write_text(debate["judge_decision"])
@@ -673,19 +679,23 @@ def save_report_to_disk(final_state, ticker: str, save_path: Path):
     if final_state.get("risk_debate_state"):
         risk_dir = save_path / "4_risk"
         risk = final_state["risk_debate_state"]
+        turns = final_state.get("risk_debate_turns")
         risk_parts = []
-        if risk.get("aggressive_history"):
+        aggressive_history = render_turns(turns, "Aggressive")
+        if aggressive_history:
             risk_dir.mkdir(exist_ok=True)
-            (risk_dir / "aggressive.md").write_text(risk["aggressive_history"])
-            risk_parts.append(("공격적 애널리스트", risk["aggressive_history"]))
-        if risk.get("conservative_history"):
+            (risk_dir / "aggressive.md").write_text(aggressive_history)
+            risk_parts.append(("공격적 애널리스트", aggressive_history))
+        conservative_history = render_turns(turns, "Conservative")
+        if conservative_history:
             risk_dir.mkdir(exist_ok=True)
-            (risk_dir / "conservative.md").write_text(risk["conservative_history"])
-            risk_parts.append(("보수적 애널리스트", risk["conservative_history"]))
-        if risk.get("neutral_history"):
+            (risk_dir / "conservative.md").write_text(conservative_history)
+            risk_parts.append(("보수적 애널리스트", conservative_history))
+        neutral_history = render_turns(turns, "Neutral")
+        if neutral_history:
             risk_dir.mkdir(exist_ok=True)
-            (risk_dir / "neutral.md").write_text(risk["neutral_history"])
-            risk_parts.append(("중립적 애널리스트", risk["neutral_history"]))
+            (risk_dir / "neutral.md").write_text(neutral_history)
+            risk_parts.append(("중립적 애널리스트", neutral_history))
         if risk_parts:
             content = "\n\n".join(f"### {name}\n{text}" for name, text in risk_parts)
             sections.append(f"## IV. 리스크 관리팀 결정\n\n{content}")
@@ -726,11 +736,14 @@ def display_complete_report(final_state):
     # II. Research Team Reports
     if final_state.get("investment_debate_state"):
         debate = final_state["investment_debate_state"]
+        turns = final_state.get("investment_debate_turns")
         research = []
-        if debate.get("bull_history"):
-            research.append(("강세 애널리스트", debate["bull_history"]))
-        if debate.get("bear_history"):
-            research.append(("약세 애널리스트", debate["bear_history"]))
+        bull_history = render_turns(turns, "Bull")
+        if bull_history:
+            research.append(("강세 애널리스트", bull_history))
+        bear_history = render_turns(turns, "Bear")
+        if bear_history:
+            research.append(("약세 애널리스트", bear_history))
         if debate.get("judge_decision"):
             research.append(("리서치 매니저", debate["judge_decision"]))
         if research:
@@ -746,13 +759,17 @@ def display_complete_report(final_state):
     # IV. Risk Management Team
     if final_state.get("risk_debate_state"):
         risk = final_state["risk_debate_state"]
+        turns = final_state.get("risk_debate_turns")
         risk_reports = []
-        if risk.get("aggressive_history"):
-            risk_reports.append(("공격적 애널리스트", risk["aggressive_history"]))
-        if risk.get("conservative_history"):
-            risk_reports.append(("보수적 애널리스트", risk["conservative_history"]))
-        if risk.get("neutral_history"):
-            risk_reports.append(("중립적 애널리스트", risk["neutral_history"]))
+        aggressive_history = render_turns(turns, "Aggressive")
+        if aggressive_history:
+            risk_reports.append(("공격적 애널리스트", aggressive_history))
+        conservative_history = render_turns(turns, "Conservative")
+        if conservative_history:
+            risk_reports.append(("보수적 애널리스트", conservative_history))
+        neutral_history = render_turns(turns, "Neutral")
+        if neutral_history:
+            risk_reports.append(("중립적 애널리스트", neutral_history))
         if risk_reports:
             console.print(Panel("[bold]IV. 리스크 관리팀 결정[/bold]", border_style="red"))
             for title, content in risk_reports:
@@ -1017,113 +1034,116 @@ def run_analysis():
         # (LLM tracking is handled separately via LLM constructor)
         args = graph.propagator.get_graph_args(callbacks=[stats_handler])
 
-        # Stream the analysis
-        trace = []
-        for chunk in graph.graph.stream(init_agent_state, **args):
-            # Process messages if present (skip duplicates via message ID)
-            if len(chunk["messages"]) > 0:
-                last_message = chunk["messages"][-1]
-                msg_id = getattr(last_message, "id", None)
-
-                if msg_id != message_buffer._last_message_id:
-                    message_buffer._last_message_id = msg_id
-
-                    # Add message to buffer
-                    msg_type, content = classify_message_type(last_message)
-                    if content and content.strip():
-                        message_buffer.add_message(msg_type, content)
-
-                    # Handle tool calls
-                    if hasattr(last_message, "tool_calls") and last_message.tool_calls:
-                        for tool_call in last_message.tool_calls:
-                            if isinstance(tool_call, dict):
-                                message_buffer.add_tool_call(
-                                    tool_call["name"], tool_call["args"]
-                                )
-                            else:
-                                message_buffer.add_tool_call(tool_call.name, tool_call.args)
-
-            # Update analyst statuses based on report state (runs on every chunk)
-            update_analyst_statuses(message_buffer, chunk)
-
-            # Research Team - Handle Investment Debate State
-            if chunk.get("investment_debate_state"):
-                debate_state = chunk["investment_debate_state"]
-                bull_hist = debate_state.get("bull_history", "").strip()
-                bear_hist = debate_state.get("bear_history", "").strip()
-                judge = debate_state.get("judge_decision", "").strip()
-
-                # Only update status when there's actual content
-                if bull_hist or bear_hist:
-                    update_research_team_status("in_progress")
-                if bull_hist:
-                    message_buffer.update_report_section(
-                        "investment_plan", f"### 강세 애널리스트 분석\n{bull_hist}"
-                    )
-                if bear_hist:
-                    message_buffer.update_report_section(
-                        "investment_plan", f"### 약세 애널리스트 분석\n{bear_hist}"
-                    )
-                if judge:
-                    message_buffer.update_report_section(
-                        "investment_plan", f"### 리서치 매니저 판단\n{judge}"
-                    )
-                    update_research_team_status("completed")
-                    message_buffer.update_agent_status("Trader", "in_progress")
+        # Stream the analysis with this run's config (identical vendor calls are fetched once)
+        with config_scope(graph.config), vendor_call_scope():
+            final_state = None
+            for chunk in graph.graph.stream(init_agent_state, **args):
+                # Process messages if present (skip duplicates via message ID)
+                if len(chunk["messages"]) > 0:
+                    last_message = chunk["messages"][-1]
+                    msg_id = getattr(last_message, "id", None)
+
+                    if msg_id != message_buffer._last_message_id:
+                        message_buffer._last_message_id = msg_id
+
+                        # Add message to buffer
+                        msg_type, content = classify_message_type(last_message)
+                        if content and content.strip():
+                            message_buffer.add_message(msg_type, content)
+
+                        # Handle tool calls
+                        if hasattr(last_message, "tool_calls") and last_message.tool_calls:
+                            for tool_call in last_message.tool_calls:
+                                if isinstance(tool_call, dict):
+                                    message_buffer.add_tool_call(
+                                        tool_call["name"], tool_call["args"]
+                                    )
+                                else:
+                                    message_buffer.add_tool_call(tool_call.name, tool_call.args)
+
+                # Update analyst statuses based on report state (runs on every chunk)
+                update_analyst_statuses(message_buffer, chunk)
+
+                # Research Team - Handle Investment Debate State
+                if chunk.get("investment_debate_state"):
+                    debate_state = chunk["investment_debate_state"]
+                    debate_turns = chunk.get("investment_debate_turns")
+                    bull_hist = render_turns(debate_turns, "Bull").strip()
+                    bear_hist = render_turns(debate_turns, "Bear").strip()
+                    judge = debate_state.get("judge_decision", "").strip()
+
+                    # Only update status when there's actual content
+                    if bull_hist or bear_hist:
+                        update_research_team_status("in_progress")
+                    if bull_hist:
+                        message_buffer.update_report_section(
+                            "investment_plan", f"### 강세 애널리스트 분석\n{bull_hist}"
+                        )
+                    if bear_hist:
+                        message_buffer.update_report_section(
+                            "investment_plan", f"### 약세 애널리스트 분석\n{bear_hist}"
+                        )
+                    if judge:
+                        message_buffer.update_report_section(
+                            "investment_plan", f"### 리서치 매니저 판단\n{judge}"
+                        )
+                        update_research_team_status("completed")
+                        message_buffer.update_agent_status("Trader", "in_progress")
 
-            # Trading Team
-            if chunk.get("trader_investment_plan"):
-                message_buffer.update_report_section(
-                    "trader_investment_plan", chunk["trader_investment_plan"]
-                )
-                if message_buffer.agent_status.get("Trader") != "completed":
-                    message_buffer.update_agent_status("Trader", "completed")
-                    message_buffer.update_agent_status("Aggressive Analyst", "in_progress")
-
-            # Risk Management Team - Handle Risk Debate State
-            if chunk.get("risk_debate_state"):
-                risk_state = chunk["risk_debate_state"]
-                agg_hist = risk_state.get("aggressive_history", "").strip()
-                con_hist = risk_state.get("conservative_history", "").strip()
-                neu_hist = risk_state.get("neutral_history", "").strip()
-                judge = risk_state.get("judge_decision", "").strip()
-
-                if agg_hist:
-                    if message_buffer.agent_status.get("Aggressive Analyst") != "completed":
-                        message_buffer.update_agent_status("Aggressive Analyst", "in_progress")
-                    message_buffer.update_report_section(
-                        "final_trade_decision", f"### 공격적 애널리스트 분석\n{agg_hist}"
-                    )
-                if con_hist:
-                    if message_buffer.agent_status.get("Conservative Analyst") != "completed":
-                        message_buffer.update_agent_status("Conservative Analyst", "in_progress")
+                # Trading Team
+                if chunk.get("trader_investment_plan"):
                     message_buffer.update_report_section(
-                        "final_trade_decision", f"### 보수적 애널리스트 분석\n{con_hist}"
+                        "trader_investment_plan", chunk["trader_investment_plan"]
                     )
-                if neu_hist:
-                    if message_buffer.agent_status.get("Neutral Analyst") != "completed":
-                        message_buffer.update_agent_status("Neutral Analyst", "in_progress")
-                    message_buffer.update_report_section(
-                        "final_trade_decision", f"### 중립적 애널리스트 분석\n{neu_hist}"
-                    )
-                if judge:
-                    if message_buffer.agent_status.get("Portfolio Manager") != "completed":
-                        message_buffer.update_agent_status("Portfolio Manager", "in_progress")
+                    if message_buffer.agent_status.get("Trader") != "completed":
+                        message_buffer.update_agent_status("Trader", "completed")
+                        message_buffer.update_agent_status("Aggressive Analyst", "in_progress")
+
+                # Risk Management Team - Handle Risk Debate State
+                if chunk.get("risk_debate_state"):
+                    risk_state = chunk["risk_debate_state"]
+                    risk_turns = chunk.get("risk_debate_turns")
+                    agg_hist = render_turns(risk_turns, "Aggressive").strip()
+                    con_hist = render_turns(risk_turns, "Conservative").strip()
+                    neu_hist = render_turns(risk_turns, "Neutral").strip()
+                    judge = risk_state.get("judge_decision", "").strip()
+
+                    if agg_hist:
+                        if message_buffer.agent_status.get("Aggressive Analyst") != "completed":
+                            message_buffer.update_agent_status("Aggressive Analyst", "in_progress")
                         message_buffer.update_report_section(
-                            "final_trade_decision", f"### 포트폴리오 매니저 결정\n{judge}"
+                            "final_trade_decision", f"### 공격적 애널리스트 분석\n{agg_hist}"
                         )
-                        message_buffer.update_agent_status("Aggressive Analyst", "completed")
-                        message_buffer.update_agent_status("Conservative Analyst", "completed")
-                        message_buffer.update_agent_status("Neutral Analyst", "completed")
-                        message_buffer.update_agent_status("Portfolio Manager", "completed")
-
-            # Update the display
-            update_display(layout, stats_handler=stats_handler, start_time=start_time)
-
-            trace.append(chunk)
+                    if con_hist:
+                        if message_buffer.agent_status.get("Conservative Analyst") != "completed":
+                            message_buffer.update_agent_status("Conservative Analyst", "in_progress")
+                        message_buffer.update_report_section(
+                            "final_trade_decision", f"### 보수적 애널리스트 분석\n{con_hist}"
+                        )
+                    if neu_hist:
+                        if message_buffer.agent_status.get("Neutral Analyst") != "completed":
+                            message_buffer.update_agent_status("Neutral Analyst", "in_progress")
+                        message_buffer.update_report_section(
+                            "final_trade_decision", f"### 중립적 애널리스트 분석\n{neu_hist}"
+                        )
+                    if judge:
+                        if message_buffer.agent_status.get("Portfolio Manager") != "completed":
+                            message_buffer.update_agent_status("Portfolio Manager", "in_progress")
+                            message_buffer.update_report_section(
+                                "final_trade_decision", f"### 포트폴리오 매니저 결정\n{judge}"
+                            )
+                            message_buffer.update_agent_status("Aggressive Analyst", "completed")
+                            message_buffer.update_agent_status("Conservative Analyst", "completed")
+                            message_buffer.update_agent_status("Neutral Analyst", "completed")
+                            message_buffer.update_agent_status("Portfolio Manager", "completed")
+
+                # Update the display
+                update_display(layout, stats_handler=stats_handler, start_time=start_time)
+
+                # Only the latest snapshot is needed once the stream ends
+                final_state = chunk
 
         # Get final state and decision
-        final_state = trace[-1]
         decision = graph.process_signal(final_state["final_trade_decision"])
 
         # Update all agent statuses to completed
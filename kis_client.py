@@ -10,10 +10,13 @@ import time
 import logging
 import datetime
 from typing import Any, Literal
+from pathlib import Path
 from zoneinfo import ZoneInfo
 
 import requests
 
+from shared_cache import SharedCache
+
 logger = logging.getLogger(__name__)
 
 
@@ -44,7 +47,20 @@ class KISClient:
     KST = ZoneInfo("Asia/Seoul")
     NY_TZ = ZoneInfo("America/New_York")
 
-    _holiday_cache: dict[str, bool] = {}  # KR market holiday cache
+    # KR market holiday cache (인스턴스 간 공유, 재시작 후에도 유지)
+    _holiday_cache = SharedCache(
+        "kr_holidays",
+        maxsize=512,
+        ttl=30 * 24 * 3600,
+        persist_path=Path(__file__).parent / "data" / "kr_holidays.json",
+    )
+    # US ticker → exchange cache (인스턴스 간 공유, 재시작 후에도 유지)
+    _us_exchange_cache = SharedCache(
+        "us_exchanges",
+        maxsize=2048,
+        ttl=7 * 24 * 3600,
+        persist_path=Path(__file__).parent / "data" / "us_exchanges.json",
+    )
 
     def __init__(self):
         self.app_key = os.getenv("KIS_APP_KEY", "")
@@ -57,12 +73,11 @@ class KISClient:
         self.enable_us_trading = os.getenv("ENABLE_US_TRADING", "false").lower() == "true"
         self.us_max_order_amount = float(os.getenv("US_MAX_ORDER_AMOUNT", "5000"))
 
-        # US exchange search order and cache
+        # US exchange search order
         ex_order_raw = os.getenv("US_EXCHANGE_SEARCH_ORDER", "NASD,NYSE,AMEX")
         self.us_exchange_search_order = [x.strip().upper() for x in ex_order_raw.split(",") if x.strip()]
         if not self.us_exchange_search_order:
             self.us_exchange_search_order = ["NASD", "NYSE", "AMEX"]
-        self._us_exchange_cache: dict[str, str] = {}
 
         # US scanning watchlist (fallback source)
         watchlist_raw = os.getenv(
@@ -274,14 +289,13 @@ class KISClient:
         # KIS 문서상 모의투자는 chk-holiday API 미지원.
         # 모의환경에서는 불필요한 500 오류를 피하기 위해 주말만 휴장으로 간주한다.
         if self.virtual:
-            is_open = dt.weekday() < 5
-            self._holiday_cache[key] = is_open
-            return is_open
+            return dt.weekday() < 5
 
         if dt.weekday() >= 5:
             return False
-        if key in self._holiday_cache:
-            return self._holiday_cache[key]
+        cached = self._holiday_cache.get(key)
+        if cached is not None:
+            return cached
 
         try:
             data = self._request(
@@ -293,9 +307,10 @@ class KISClient:
             for item in data.get("output", []):
                 if item.get("bass_dt") == key:
                     is_open = item.get("opnd_yn", "N") == "Y"
-                    self._holiday_cache[key] = is_open
+                    self._holiday_cache.set(key, is_open)
                     return is_open
-            self._holiday_cache[key] = True
+            # 응답에 해당 날짜가 없으면 개장으로 간주하되 캐시하지 않음 (다음 호출에서 재조회)
+            logger.warning("KIS 휴장일 응답에 %s 없음 (KR 개장으로 간주)", key)
             return True
         except Exception as e:
             logger.warning("KIS 휴장일 조회 실패 (KR 개장으로 간주): %s", e)
@@ -557,7 +572,8 @@ class KISClient:
                 continue
             px = self._get_us_price_by_exchange(ticker, exchange)
             if px > 0:
-                self._us_exchange_cache[ticker] = exchange
+                if exchange != cached_exchange:
+                    self._us_exchange_cache.set(ticker, exchange)
                 return px
 
         return 0.0
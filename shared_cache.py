@@ -0,0 +1,183 @@
+"""
+스레드 안전 공유 캐시
+- 봇 이벤트 루프와 executor 스레드가 함께 쓰는 조회 결과 캐시
+- TTL 만료 + 최대 크기 (LRU 제거)
+- 선택적 JSON 파일 영속화 (재시작 후에도 유지, 같은 파일을 쓰는 다른
+  인스턴스/프로세스의 항목과 병합해 저장)
+- 적중/미스 통계
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable
+
+try:
+    import fcntl
+except ImportError:  # Windows: 파일 병합 저장이 프로세스 간에는 직렬화되지 않음
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+
+class SharedCache:
+    """TTL과 최대 크기를 가진 스레드 안전 키-값 캐시.
+
+    만료 시각은 벽시계(time.time) 기준이라 파일에 저장했다가 재시작 후
+    불러와도 그대로 유효하다. 영속화 값은 JSON 직렬화 가능해야 한다.
+    저장할 때는 파일 잠금을 잡고 파일에 있는 다른 인스턴스의 항목을 병합하므로
+    여러 인스턴스/프로세스가 같은 파일을 써도 서로의 항목을 지우지 않는다.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        maxsize: int = 1024,
+        ttl: float | None = None,
+        persist_path: str | Path | None = None,
+    ):
+        """
+        Args:
+            name: 로그/통계용 이름
+            maxsize: 최대 항목 수 (초과 시 가장 오래 안 쓴 항목 제거)
+            ttl: 항목 유효 시간(초), None이면 만료 없음
+            persist_path: JSON 저장 경로, None이면 메모리에만 보관
+        """
+        self.name = name
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.persist_path = Path(persist_path) if persist_path else None
+        self._data: OrderedDict[str, tuple[Any, float | None]] = OrderedDict()
+        # 마지막 저장 이후 delete()로 지운 키 (파일에서 병합해 되살리지 않음)
+        self._deleted: set[str] = set()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        if self.persist_path is not None:
+            self._load()
+
+    def _read_file(self) -> dict:
+        """파일에 저장된 유효 항목 (없거나 읽을 수 없으면 빈 dict)."""
+        try:
+            raw = json.loads(self.persist_path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            logger.warning("캐시 파일 로드 실패 (%s): %s", self.persist_path, e)
+            return {}
+        now = time.time()
+        return {
+            key: (value, expires_at)
+            for key, (value, expires_at) in raw.items()
+            if expires_at is None or expires_at > now
+        }
+
+    def _load(self):
+        self._data.update(self._read_file())
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def _save(self, merge: bool = True):
+        """파일 항목을 병합해 임시 파일에 쓴 뒤 교체 (호출자가 lock 보유).
+
+        merge=False면 병합 없이 현재 항목으로 덮어쓴다 (clear).
+        """
+        if self.persist_path is None:
+            return
+        try:
+            self.persist_path.parent.mkdir(parents=True, exist_ok=True)
+            lock_path = self.persist_path.with_suffix(self.persist_path.suffix + ".lock")
+            with open(lock_path, "a") as lock_file:
+                # 다른 프로세스의 읽기-병합-쓰기와 겹치지 않도록 잠금
+                if fcntl is not None:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+                try:
+                    if merge:
+                        for key, entry in self._read_file().items():
+                            if key not in self._data and key not in self._deleted:
+                                # 다른 인스턴스가 저장한 항목은 가장 오래된 쪽에 둔다
+                                self._data[key] = entry
+                                self._data.move_to_end(key, last=False)
+                        while len(self._data) > self.maxsize:
+                            self._data.popitem(last=False)
+                    self._deleted.clear()
+                    tmp = self.persist_path.with_suffix(
+                        f"{self.persist_path.suffix}.{os.getpid()}.{threading.get_ident()}.tmp"
+                    )
+                    tmp.write_text(json.dumps(dict(self._data), ensure_ascii=False), encoding="utf-8")
+                    os.replace(tmp, self.persist_path)
+                finally:
+                    if fcntl is not None:
+                        fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+        except Exception as e:
+            logger.warning("캐시 파일 저장 실패 (%s): %s", self.persist_path, e)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """유효한 값 반환, 없거나 만료됐으면 default."""
+        with self._lock:
+            entry = self._data.get(key, _MISSING)
+            if entry is not _MISSING:
+                value, expires_at = entry
+                if expires_at is None or expires_at > time.time():
+                    self._data.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._data[key]
+            self.misses += 1
+            return default
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    def set(self, key: str, value: Any, ttl: float | None = None):
+        """값 저장. ttl을 주면 캐시 기본 TTL 대신 사용."""
+        ttl = self.ttl if ttl is None else ttl
+        expires_at = time.time() + ttl if ttl is not None else None
+        with self._lock:
+            self._data[key] = (value, expires_at)
+            self._data.move_to_end(key)
+            self._deleted.discard(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+            self._save()
+
+    def get_or_set(self, key: str, loader: Callable[[], Any]) -> Any:
+        """캐시에 없으면 loader() 결과를 저장 후 반환 (loader는 lock 밖에서 실행)."""
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = loader()
+            self.set(key, value)
+        return value
+
+    def delete(self, key: str):
+        with self._lock:
+            if self._data.pop(key, _MISSING) is not _MISSING:
+                self._deleted.add(key)
+                self._save()
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self._save(merge=False)
+
+    def stats(self) -> dict:
+        """항목 수와 적중/미스/제거 횟수."""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "name": self.name,
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / total, 3) if total else 0.0,
+            }
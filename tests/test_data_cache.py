@@ -0,0 +1,52 @@
+from tradingagents.dataflows.data_cache import SQLiteCacheBackend, VendorDataCache
+from tradingagents.dataflows.interface import is_cacheable_result
+
+
+def _counting_fetch(results):
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        return results[len(calls) - 1]
+
+    return fetch, calls
+
+
+def test_failed_results_are_not_cached(tmp_path):
+    backend = SQLiteCacheBackend(str(tmp_path / "vendor.db"))
+    cache = VendorDataCache(backend)
+    fetch, calls = _counting_fetch(
+        ["Error retrieving fundamentals for AAPL: timeout", "## AAPL fundamentals"]
+    )
+
+    first = cache.get_or_fetch("k", fetch, 60, is_cacheable_result)
+    second = cache.get_or_fetch("k", fetch, 60, is_cacheable_result)
+    third = cache.get_or_fetch("k", fetch, 60, is_cacheable_result)
+
+    assert first.startswith("Error")
+    assert second == third == "## AAPL fundamentals"
+    assert len(calls) == 2
+    assert backend.get("k") == "## AAPL fundamentals"
+
+
+def test_shared_tier_skips_failures(tmp_path):
+    backend = SQLiteCacheBackend(str(tmp_path / "vendor.db"))
+    fetch, calls = _counting_fetch(["No news found for AAPL", "No news found for AAPL"])
+
+    VendorDataCache(backend).get_or_fetch("k", fetch, 60, is_cacheable_result)
+    # A second process sees nothing in the shared tier and fetches again
+    VendorDataCache(backend).get_or_fetch("k", fetch, 60, is_cacheable_result)
+
+    assert backend.get("k") is None
+    assert len(calls) == 2
+
+
+def test_is_cacheable_result():
+    assert is_cacheable_result("## AAPL News, from 2024-01-01 to 2024-01-08:\n\n...")
+    assert not is_cacheable_result("")
+    assert not is_cacheable_result("   ")
+    assert not is_cacheable_result("Error: No data returned for rsi")
+    assert not is_cacheable_result("Error fetching global news: 429")
+    assert not is_cacheable_result("No fundamentals data found for symbol 'XYZ'")
+    assert not is_cacheable_result("No global news found for 2024-01-01")
+    assert not is_cacheable_result(None)
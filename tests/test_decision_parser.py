@@ -0,0 +1,32 @@
+import pytest
+
+from tradingagents.agents.utils.decision_parser import parse_decision
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("Strong momentum.\nFINAL TRANSACTION PROPOSAL: **BUY**", "BUY"),
+        ("final decision: sell", "SELL"),
+        ("최종 결정: **매수**", "BUY"),
+        ("최종 투자 의견은 매도입니다.", "SELL"),
+        ("최종 추천 - 보유", "HOLD"),
+        # Echoed prompt template
+        ("FINAL TRANSACTION PROPOSAL: **BUY/HOLD/SELL**", None),
+        ("최종 결정: 매수/보유/매도", None),
+        ("FINAL DECISION: BUY or SELL depending on earnings", None),
+        # Deferred actions are holds
+        ("최종 결정: 매수 보류. 당분간 관망", "HOLD"),
+        ("최종 의견은 매도 보류입니다", "HOLD"),
+        ("최종 제안: 매수를 유보합니다", "HOLD"),
+        # Action word inside a longer word is not a decision
+        ("최종 제안: 매수세가 약하므로 매도", None),
+        # Last marker wins; markers must agree
+        ("FINAL TRANSACTION PROPOSAL: **BUY/HOLD/SELL**\n...\nFINAL TRANSACTION PROPOSAL: **SELL**", "SELL"),
+        ("FINAL TRANSACTION PROPOSAL: **BUY**\n최종 결정: 매도", None),
+        ("No explicit marker, but buy looks good", None),
+        ("", None),
+    ],
+)
+def test_parse_decision(text, expected):
+    assert parse_decision(text) == expected
@@ -0,0 +1,91 @@
+import threading
+import time
+from typing import Any, List, Optional
+
+import pytest
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+
+from tradingagents.llm_clients.hedging import HedgedChatModel, LatencyTracker
+
+
+class _DelayModel(BaseChatModel):
+    """Sleeps for the next delay of the list on each call."""
+
+    delays: List[float]
+    calls: List[int] = []
+
+    @property
+    def _llm_type(self) -> str:
+        return "delay-fake"
+
+    def _generate(self, messages: List[BaseMessage], stop: Optional[List[str]] = None, run_manager: Any = None, **kwargs: Any) -> ChatResult:
+        index = len(self.calls)
+        self.calls.append(index)
+        time.sleep(self.delays[index])
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content=f"attempt-{index}"))])
+
+
+class _Counter(BaseCallbackHandler):
+    def __init__(self):
+        self.starts = 0
+        self.ends = 0
+        self.lock = threading.Lock()
+
+    def on_chat_model_start(self, *args, **kwargs):
+        with self.lock:
+            self.starts += 1
+
+    def on_llm_end(self, *args, **kwargs):
+        with self.lock:
+            self.ends += 1
+
+
+def _tracker(latency: float, samples: int = 20) -> LatencyTracker:
+    tracker = LatencyTracker()
+    for _ in range(samples):
+        tracker.record(latency)
+    return tracker
+
+
+def test_losing_attempt_callbacks_are_ignored():
+    model = _DelayModel(delays=[0.6, 0.05], calls=[])
+    tracker = _tracker(0.05)
+    hedged = HedgedChatModel(model, tracker, min_samples=20)
+    counter = _Counter()
+
+    result = hedged.invoke("hi", {"callbacks": [counter]})
+    time.sleep(0.8)  # let the slow primary finish in the background
+
+    assert result.content == "attempt-1"
+    assert tracker.stats()["hedge_wins"] == 1
+    assert (counter.starts, counter.ends) == (1, 1)
+
+
+def test_timeouts_enter_the_latency_window():
+    model = _DelayModel(delays=[0.5], calls=[])
+    tracker = LatencyTracker()
+    hedged = HedgedChatModel(model, tracker, timeout=0.1, min_samples=20)
+
+    with pytest.raises(TimeoutError):
+        hedged.invoke("hi")
+
+    assert tracker.stats()["samples"] == 1
+    assert tracker.percentile(50) == pytest.approx(0.1)
+
+
+def test_timed_out_primary_is_not_counted_with_the_fallback():
+    # No latency samples yet, so no hedge delay: only the timeout and failover apply
+    model = _DelayModel(delays=[0.5], calls=[])
+    fallback = _DelayModel(delays=[0.01], calls=[])
+    hedged = HedgedChatModel(model, LatencyTracker(), fallback=fallback, timeout=0.1)
+    counter = _Counter()
+
+    result = hedged.invoke("hi", {"callbacks": [counter]})
+    time.sleep(0.6)  # let the abandoned primary finish in the background
+
+    assert result.content == "attempt-0"
+    assert fallback.calls == [0]
+    assert (counter.starts, counter.ends) == (1, 1)
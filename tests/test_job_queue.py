@@ -0,0 +1,51 @@
+import pytest
+
+from tradingagents.graph.job_queue import AnalysisJobQueue
+
+fakeredis = pytest.importorskip("fakeredis")
+
+
+@pytest.fixture
+def queue():
+    return AnalysisJobQueue(fakeredis.FakeRedis(), visibility_timeout=60, max_attempts=2)
+
+
+def test_claim_and_ack_publish_result(queue):
+    job_id = queue.enqueue("AAPL", "2026-01-05", {"max_debate_rounds": 1})
+
+    job = queue.claim(timeout=1)
+    assert (job.id, job.ticker, job.attempts) == (job_id, "AAPL", 1)
+    assert queue.status(job_id) == "running"
+
+    queue.ack(job, {"company_of_interest": "AAPL"}, "BUY")
+
+    assert queue.get_result(job_id)["decision"] == "BUY"
+    assert queue.stats() == {"pending": 0, "running": 0}
+    assert 0 < queue.redis.ttl(queue._job_key(job_id)) <= queue.result_ttl
+
+
+def test_claim_of_evicted_job_leaves_no_record(queue):
+    job_id = queue.enqueue("AAPL", "2026-01-05")
+    queue.redis.delete(queue._job_key(job_id))
+
+    assert queue.claim(timeout=1) is None
+    assert not queue.redis.exists(queue._job_key(job_id))
+    assert queue.stats() == {"pending": 0, "running": 0}
+
+
+def test_expired_lease_is_requeued_then_failed(queue):
+    job_id = queue.enqueue("AAPL", "2026-01-05")
+
+    queue.claim(timeout=1)
+    queue.redis.hset(queue._job_key(job_id), "lease_until", 0)
+    assert queue.requeue_expired() == 1
+
+    assert queue.claim(timeout=1).attempts == 2
+    queue.redis.hset(queue._job_key(job_id), "lease_until", 0)
+    assert queue.requeue_expired() == 0
+
+    assert queue.get_result(job_id) == {
+        "status": "failed",
+        "error": "visibility timeout exceeded",
+    }
+    assert queue.status(job_id) == "failed"
@@ -0,0 +1,95 @@
+import random
+
+import numpy as np
+
+from tradingagents.agents.utils.memory import FinancialSituationMemory
+
+COMMON = [f"common{i}" for i in range(40)]
+RARE = [f"rare{i}" for i in range(5000)]
+
+
+def _memory(num_docs, **config):
+    rng = random.Random(0)
+    memory = FinancialSituationMemory("test", {"memory_decay_half_life_days": None, **config})
+    memory.add_situations(
+        [
+            (" ".join(rng.sample(COMMON, 20) + rng.sample(RARE, 5)), f"advice {i}")
+            for i in range(num_docs)
+        ]
+    )
+    return memory
+
+
+def _postings_scored(memory, query):
+    touched = []
+    get_term_arrays = memory._get_term_arrays
+
+    def counting(term):
+        arrays = get_term_arrays(term)
+        touched.append(len(arrays[0]))
+        return arrays
+
+    memory._get_term_arrays = counting
+    memory.get_memories(query, n_matches=3)
+    return sum(touched)
+
+
+def test_lookup_cost_is_bounded_by_query_term_limit():
+    query = " ".join(COMMON + RARE[:30])
+    small = _memory(1000, memory_query_terms=16)
+    large = _memory(10000, memory_query_terms=16)
+
+    assert len(small._select_query_terms(tuple((t, 1) for t in query.split()))) == 16
+    # Common terms are dropped from the query, so a lookup touches a small
+    # fraction of the postings scoring every term would
+    assert _postings_scored(large, query) < 0.05 * _postings_scored(
+        _memory(10000, memory_query_terms=None), query
+    )
+    assert _postings_scored(large, query) < 15 * _postings_scored(small, query)
+
+
+def test_capped_query_keeps_distinctive_matches():
+    capped = _memory(2000, memory_query_terms=8)
+    full = _memory(2000, memory_query_terms=None)
+    situation = capped.documents[1234]
+
+    assert capped.get_memories(situation)[0]["recommendation"] == "advice 1234"
+    assert full.get_memories(situation)[0]["recommendation"] == "advice 1234"
+
+
+def test_posting_arrays_grow_in_place_on_add():
+    memory = _memory(100, memory_query_terms=None)
+    memory.get_memories(" ".join(COMMON))
+    built = dict(memory._term_arrays)
+
+    memory.add_situations([(" ".join(COMMON), "new advice")])
+
+    assert memory.get_memories(" ".join(COMMON))[0]["recommendation"] == "new advice"
+    for term in COMMON:
+        positions, tfs = memory._get_term_arrays(term)
+        assert positions[-1] == 100
+        assert np.array_equal(positions[:-1], built[term][0][:built[term][2]])
+        assert len(positions) == len(memory._postings[term])
+
+
+def test_redundancy_eviction_drops_the_older_near_duplicate():
+    memory = _memory(200, memory_max_entries=200, memory_eviction_policy="redundancy")
+    duplicated = memory.documents[50]
+
+    memory.add_situations([(duplicated, "newer advice")])
+
+    assert duplicated in memory.documents
+    assert "advice 50" not in memory.recommendations
+    assert "newer advice" in memory.recommendations
+
+
+def test_redundancy_eviction_does_not_score_the_whole_memory():
+    memory = _memory(3000, memory_eviction_policy="redundancy")
+
+    def full_scan(query_terms):
+        raise AssertionError("eviction must only score candidate documents")
+
+    memory._get_scores = full_scan
+    order = memory._eviction_order()
+
+    assert sorted(order) == list(range(3000))
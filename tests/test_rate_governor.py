@@ -0,0 +1,81 @@
+import asyncio
+from typing import Any, List, Optional
+
+import pytest
+from langchain_core.caches import InMemoryCache
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+
+from tradingagents.llm_clients.rate_governor import (
+    PRIORITY_QUICK,
+    GovernedRateLimiter,
+    GovernorUsageHandler,
+    LLMRateGovernor,
+)
+
+
+class _UsageModel(BaseChatModel):
+    tokens: int = 1000
+    fail: bool = False
+
+    @property
+    def _llm_type(self) -> str:
+        return "usage-fake"
+
+    def _generate(self, messages: List[BaseMessage], stop: Optional[List[str]] = None, run_manager: Any = None, **kwargs: Any) -> ChatResult:
+        if self.fail:
+            raise RuntimeError("provider error")
+        message = AIMessage(
+            content="ok",
+            usage_metadata={"input_tokens": self.tokens - 10, "output_tokens": 10, "total_tokens": self.tokens},
+        )
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+
+def _model(governor, **kwargs):
+    return _UsageModel(
+        rate_limiter=GovernedRateLimiter(governor, PRIORITY_QUICK),
+        callbacks=[GovernorUsageHandler(governor)],
+        **kwargs,
+    )
+
+
+def test_usage_settles_the_calls_own_reservation():
+    governor = LLMRateGovernor(tpm=100_000)
+    _model(governor, tokens=1500).invoke("hi")
+    assert governor._reservations == {}
+    assert governor._token_total == 1500
+
+
+def test_failed_call_releases_its_reservation():
+    governor = LLMRateGovernor(tpm=100_000)
+    with pytest.raises(RuntimeError):
+        _model(governor, fail=True).invoke("hi")
+    assert governor._reservations == {}
+    assert governor._token_total == 0
+
+
+def test_cache_hit_does_not_settle_another_reservation():
+    governor = LLMRateGovernor(tpm=100_000)
+    cached = _model(governor, tokens=1500, cache=InMemoryCache())
+    cached.invoke("hi")
+    # Outstanding reservation of a call still in flight
+    governor.acquire(PRIORITY_QUICK, run_id="in-flight")
+    cached.invoke("hi")  # cache hit: no reservation, must not touch "in-flight"
+    assert list(governor._reservations) == ["in-flight"]
+    # The cache hit's run is not left pending for the next call
+    _model(governor, tokens=700).invoke("other")
+    assert list(governor._reservations) == ["in-flight"]
+
+
+def test_async_calls_settle_their_reservations():
+    governor = LLMRateGovernor(tpm=100_000)
+    model = _model(governor, tokens=800)
+
+    async def run():
+        await asyncio.gather(*(model.ainvoke(f"q{i}") for i in range(5)))
+
+    asyncio.run(run())
+    assert governor._reservations == {}
+    assert governor._token_total == 5 * 800
@@ -0,0 +1,59 @@
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
+
+from tradingagents.agents.utils import report_store
+from tradingagents.agents.utils.report_store import AnalystReportStore, create_reusable_analyst
+
+
+def _analyst(state):
+    # Calls a tool on its first turn and writes the report after the tool result
+    if isinstance(state["messages"][-1], ToolMessage):
+        report = f"{state['company_of_interest']} report"
+        return {"messages": [AIMessage(content=report)], "market_report": report}
+    tool_call = {"name": "get_stock_data", "args": {}, "id": "1"}
+    return {"messages": [AIMessage(content="", tool_calls=[tool_call])], "market_report": ""}
+
+
+def _apply(state, update):
+    return {**state, **update, "messages": state["messages"] + update["messages"]}
+
+
+def test_interleaved_runs_save_reports_under_their_own_fingerprint(tmp_path, monkeypatch):
+    store = AnalystReportStore(str(tmp_path / "reports.db"))
+    monkeypatch.setattr(
+        report_store, "fingerprint_inputs", lambda analyst, ticker, date: f"fp-{ticker}"
+    )
+    node = create_reusable_analyst(_analyst, "market", "market_report", store)
+    runs = {
+        ticker: {
+            "company_of_interest": ticker,
+            "trade_date": "2026-01-05",
+            "messages": [HumanMessage(content=ticker)],
+            "analyst_fingerprints": {},
+        }
+        for ticker in ("AAPL", "MSFT")
+    }
+
+    for ticker in runs:
+        runs[ticker] = _apply(runs[ticker], node(runs[ticker]))
+    for ticker in runs:
+        state = runs[ticker]
+        state["messages"] = state["messages"] + [ToolMessage(content="data", tool_call_id="1")]
+        node(state)
+
+    assert store.lookup("market", "AAPL", "fp-AAPL", "2026-01-05") == "AAPL report"
+    assert store.lookup("market", "MSFT", "fp-MSFT", "2026-01-05") == "MSFT report"
+    assert store.lookup("market", "AAPL", "fp-MSFT", "2026-01-05") is None
+
+
+def test_vendor_failure_text_is_not_fingerprinted(monkeypatch):
+    results = {
+        "get_balance_sheet": "No balance sheet data found for symbol 'AAPL'",
+        "get_cashflow": "cash flow",
+        "get_income_statement": "income",
+    }
+    monkeypatch.setattr(report_store, "route_to_vendor", lambda method, *args: results[method])
+
+    assert report_store.fingerprint_inputs("fundamentals", "AAPL", "2026-01-05") is None
+
+    results["get_balance_sheet"] = "balance sheet"
+    assert report_store.fingerprint_inputs("fundamentals", "AAPL", "2026-01-05") is not None
@@ -0,0 +1,43 @@
+import pytest
+
+from tradingagents.dataflows import interface
+from tradingagents.dataflows.config import config_scope
+from tradingagents.llm_clients.response_cache import LLMCacheMissError
+
+
+def _config(tmp_path, mode):
+    return {
+        "cache_dir": str(tmp_path),
+        "llm_cache_mode": mode,
+        "vendor_cache_backend": "off",
+    }
+
+
+def test_replay_serves_recorded_vendor_results_without_fetching(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        interface, "_route_to_vendor", lambda method, *args: f"{method} {args} live"
+    )
+    with config_scope(_config(tmp_path, "read-write")):
+        recorded = interface.route_to_vendor("get_stock_data", "AAPL", "2026-01-01", "2026-01-05")
+
+    def offline(method, *args):
+        raise AssertionError("replay-only must not fetch vendor data")
+
+    monkeypatch.setattr(interface, "_route_to_vendor", offline)
+    with config_scope(_config(tmp_path, "replay-only")):
+        assert (
+            interface.route_to_vendor("get_stock_data", "AAPL", "2026-01-01", "2026-01-05")
+            == recorded
+        )
+        with pytest.raises(LLMCacheMissError):
+            interface.route_to_vendor("get_stock_data", "MSFT", "2026-01-01", "2026-01-05")
+
+
+def test_read_write_fetches_live_data_again(tmp_path, monkeypatch):
+    results = iter(["first", "second"])
+    monkeypatch.setattr(interface, "_route_to_vendor", lambda method, *args: next(results))
+    with config_scope(_config(tmp_path, "read-write")):
+        assert interface.route_to_vendor("get_insider_transactions", "AAPL") == "first"
+        assert interface.route_to_vendor("get_insider_transactions", "AAPL") == "second"
+    with config_scope(_config(tmp_path, "replay-only")):
+        assert interface.route_to_vendor("get_insider_transactions", "AAPL") == "second"
@@ -0,0 +1,26 @@
+from tradingagents.default_config import DEFAULT_CONFIG
+from tradingagents.graph import result_cache
+from tradingagents.graph.result_cache import RESULT_CONFIG_KEYS, ResultCache
+
+
+def _key(**overrides):
+    return ResultCache.make_key("aapl", "2026-01-05", ["market"], {**DEFAULT_CONFIG, **overrides})
+
+
+def test_result_config_keys_exist_in_default_config():
+    assert set(RESULT_CONFIG_KEYS) <= set(DEFAULT_CONFIG)
+
+
+def test_operational_settings_do_not_split_the_cache():
+    assert _key(cache_dir="/elsewhere", some_new_knob=True, llm_hedging=True) == _key()
+
+
+def test_result_settings_change_the_key():
+    assert _key(deep_think_llm="other-model") != _key()
+    assert _key(max_debate_rounds=3) != _key()
+
+
+def test_state_schema_version_changes_the_key(monkeypatch):
+    before = _key()
+    monkeypatch.setattr(result_cache, "STATE_SCHEMA_VERSION", result_cache.STATE_SCHEMA_VERSION + 1)
+    assert _key() != before
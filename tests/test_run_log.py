@@ -0,0 +1,27 @@
+import multiprocessing
+
+from tradingagents.graph.run_log import RunLogStore
+
+
+def _append_runs(directory, worker, count):
+    store = RunLogStore(directory)
+    for i in range(count):
+        store.append("AAPL", "2024-01-02", {"worker": worker, "i": i, "pad": "x" * (i * 37 % 900)})
+
+
+def test_concurrent_process_appends_stay_readable(tmp_path):
+    directory = str(tmp_path)
+    RunLogStore(directory)
+    ctx = multiprocessing.get_context("fork")
+    procs = [ctx.Process(target=_append_runs, args=(directory, w, 60)) for w in range(4)]
+    for p in procs:
+        p.start()
+    for p in procs:
+        p.join()
+        assert p.exitcode == 0
+
+    store = RunLogStore(directory)
+    entries = store.query(limit=1000)
+    assert len(entries) == 240
+    seen = {(s["worker"], s["i"]) for s in (store.load(e["id"]) for e in entries)}
+    assert len(seen) == 240
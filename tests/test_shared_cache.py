@@ -0,0 +1,51 @@
+import datetime
+
+from kis_client import KISClient
+from shared_cache import SharedCache
+
+
+def test_instances_sharing_a_file_keep_each_others_entries(tmp_path):
+    path = tmp_path / "cache.json"
+    first = SharedCache("first", persist_path=path)
+    second = SharedCache("second", persist_path=path)
+
+    first.set("AAPL", "NASD")
+    second.set("IBM", "NYSE")
+    first.set("SPY", "AMEX")
+
+    reloaded = SharedCache("reloaded", persist_path=path)
+    assert reloaded.get("AAPL") == "NASD"
+    assert reloaded.get("IBM") == "NYSE"
+    assert reloaded.get("SPY") == "AMEX"
+
+
+def test_deleted_entry_is_not_merged_back(tmp_path):
+    path = tmp_path / "cache.json"
+    cache = SharedCache("cache", persist_path=path)
+    cache.set("AAPL", "NASD")
+    cache.set("IBM", "NYSE")
+
+    cache.delete("AAPL")
+
+    assert "AAPL" not in SharedCache("reloaded", persist_path=path)
+
+
+def test_holiday_lookup_without_the_date_is_not_cached(tmp_path, monkeypatch):
+    monkeypatch.setenv("KIS_VIRTUAL", "false")
+    monkeypatch.setattr(
+        KISClient, "_holiday_cache", SharedCache("kr_holidays", persist_path=tmp_path / "h.json")
+    )
+    client = KISClient()
+    calls = []
+
+    def request(method, path, tr_id, params=None, **kwargs):
+        calls.append(params["BASS_DT"])
+        return {"output": []}
+
+    monkeypatch.setattr(client, "_request", request)
+    monday = datetime.date(2026, 10, 19)
+
+    assert client.is_market_open(monday) is True
+    assert client.is_market_open(monday) is True
+    assert calls == ["20261019", "20261019"]
+    assert "20261019" not in SharedCache("reloaded", persist_path=tmp_path / "h.json")
@@ -2,6 +2,7 @@ from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
 import time
 import json
 from tradingagents.agents.utils.agent_utils import get_fundamentals, get_balance_sheet, get_cashflow, get_income_statement, get_insider_transactions
+from tradingagents.agents.utils.message_window import window_messages
 from tradingagents.dataflows.config import get_config
 
 
@@ -49,7 +50,10 @@ def create_fundamentals_analyst(llm):
 
         chain = prompt | llm.bind_tools(tools)
 
-        result = chain.invoke(state["messages"])
+        # Older tool results are collapsed so each round's prompt stays bounded
+        result = chain.invoke(
+            window_messages(state["messages"], get_config()["analyst_tool_window"])
+        )
 
         report = ""
 
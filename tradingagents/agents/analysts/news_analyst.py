@@ -2,6 +2,7 @@ from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
 import time
 import json
 from tradingagents.agents.utils.agent_utils import get_news, get_global_news
+from tradingagents.agents.utils.message_window import window_messages
 from tradingagents.dataflows.config import get_config
 
 
@@ -44,7 +45,10 @@ def create_news_analyst(llm):
         prompt = prompt.partial(ticker=ticker)
 
         chain = prompt | llm.bind_tools(tools)
-        result = chain.invoke(state["messages"])
+        # Older tool results are collapsed so each round's prompt stays bounded
+        result = chain.invoke(
+            window_messages(state["messages"], get_config()["analyst_tool_window"])
+        )
 
         report = ""
 
@@ -1,10 +1,11 @@
 import time
 import json
+from tradingagents.agents.utils.debate_transcript import render_turns
 
 
 def create_research_manager(llm, memory):
     def research_manager_node(state) -> dict:
-        history = state["investment_debate_state"].get("history", "")
+        history = render_turns(state.get("investment_debate_turns"))
         market_research_report = state["market_report"]
         sentiment_report = state["sentiment_report"]
         news_report = state["news_report"]
@@ -42,9 +43,6 @@ Debate History:
 
         new_investment_debate_state = {
             "judge_decision": response.content,
-            "history": investment_debate_state.get("history", ""),
-            "bear_history": investment_debate_state.get("bear_history", ""),
-            "bull_history": investment_debate_state.get("bull_history", ""),
             "current_response": response.content,
             "count": investment_debate_state["count"],
         }
@@ -1,5 +1,7 @@
 import time
 import json
+from tradingagents.agents.utils.debate_transcript import render_turns
+from tradingagents.agents.utils.decision_parser import parse_decision
 
 
 def create_risk_manager(llm, memory):
@@ -7,7 +9,7 @@ def create_risk_manager(llm, memory):
 
         company_name = state["company_of_interest"]
 
-        history = state["risk_debate_state"]["history"]
+        history = render_turns(state.get("risk_debate_turns"))
         risk_debate_state = state["risk_debate_state"]
         market_research_report = state["market_report"]
         news_report = state["news_report"]
@@ -33,6 +35,7 @@ Guidelines for Decision-Making:
 Deliverables:
 - A clear and actionable recommendation: Buy, Sell, or Hold.
 - Detailed reasoning anchored in the debate and past reflections.
+- Conclude your response with 'FINAL TRANSACTION PROPOSAL: **BUY/HOLD/SELL**'.
 
 ---
 
@@ -43,16 +46,12 @@ Deliverables:
 
 Focus on actionable insights and continuous improvement. Build on past lessons, critically evaluate all perspectives, and ensure each decision advances better outcomes.
 
-반드시 모든 분석, 추천, 의사결정을 한국어로 작성하세요."""
+반드시 모든 분석, 추천, 의사결정을 한국어로 작성하세요. 단, 'FINAL TRANSACTION PROPOSAL: **BUY/HOLD/SELL**'는 영어로 유지하세요."""
 
         response = llm.invoke(prompt)
 
         new_risk_debate_state = {
             "judge_decision": response.content,
-            "history": risk_debate_state["history"],
-            "aggressive_history": risk_debate_state["aggressive_history"],
-            "conservative_history": risk_debate_state["conservative_history"],
-            "neutral_history": risk_debate_state["neutral_history"],
             "latest_speaker": "Judge",
             "current_aggressive_response": risk_debate_state["current_aggressive_response"],
             "current_conservative_response": risk_debate_state["current_conservative_response"],
@@ -63,6 +62,7 @@ Focus on actionable insights and continuous improvement. Build on past lessons,
         return {
             "risk_debate_state": new_risk_debate_state,
             "final_trade_decision": response.content,
+            "final_decision": parse_decision(response.content) or "",
         }
 
     return risk_manager_node
@@ -1,13 +1,17 @@
 from langchain_core.messages import AIMessage
 import time
 import json
+from tradingagents.agents.utils.agent_utils import build_report_context
+from tradingagents.agents.utils.debate_transcript import compact_turns
+from tradingagents.dataflows.config import get_config
 
 
 def create_bear_researcher(llm, memory):
     def bear_node(state) -> dict:
         investment_debate_state = state["investment_debate_state"]
-        history = investment_debate_state.get("history", "")
-        bear_history = investment_debate_state.get("bear_history", "")
+        prompt_history = compact_turns(
+            state.get("investment_debate_turns", []), get_config()["debate_history_token_budget"]
+        )
 
         current_response = investment_debate_state.get("current_response", "")
         market_research_report = state["market_report"]
@@ -34,11 +38,8 @@ Key points to focus on:
 
 Resources available:
 
-Market research report: {market_research_report}
-Social media sentiment report: {sentiment_report}
-Latest world affairs news: {news_report}
-Company fundamentals report: {fundamentals_report}
-Conversation history of the debate: {history}
+The analyst team reports provided above.
+Conversation history of the debate: {prompt_history}
 Last bull argument: {current_response}
 Reflections from similar situations and lessons learned: {past_memory_str}
 Use this information to deliver a compelling bear argument, refute the bull's claims, and engage in a dynamic debate that demonstrates the risks and weaknesses of investing in the stock. You must also address reflections and learn from lessons and mistakes you made in the past.
@@ -46,18 +47,23 @@ Use this information to deliver a compelling bear argument, refute the bull's cl
 반드시 모든 분석과 토론 내용을 한국어로 작성하세요.
 """
 
-        response = llm.invoke(prompt)
+        # Shared reports first so the prompt prefix is cacheable across agents
+        messages = [
+            ("system", build_report_context(state)),
+            ("human", prompt),
+        ]
+        response = llm.invoke(messages)
 
         argument = f"Bear Analyst: {response.content}"
 
         new_investment_debate_state = {
-            "history": history + "\n" + argument,
-            "bear_history": bear_history + "\n" + argument,
-            "bull_history": investment_debate_state.get("bull_history", ""),
             "current_response": argument,
             "count": investment_debate_state["count"] + 1,
         }
 
-        return {"investment_debate_state": new_investment_debate_state}
+        return {
+            "investment_debate_state": new_investment_debate_state,
+            "investment_debate_turns": [{"speaker": "Bear", "content": response.content}],
+        }
 
     return bear_node
@@ -1,13 +1,17 @@
 from langchain_core.messages import AIMessage
 import time
 import json
+from tradingagents.agents.utils.agent_utils import build_report_context
+from tradingagents.agents.utils.debate_transcript import compact_turns
+from tradingagents.dataflows.config import get_config
 
 
 def create_bull_researcher(llm, memory):
     def bull_node(state) -> dict:
         investment_debate_state = state["investment_debate_state"]
-        history = investment_debate_state.get("history", "")
-        bull_history = investment_debate_state.get("bull_history", "")
+        prompt_history = compact_turns(
+            state.get("investment_debate_turns", []), get_config()["debate_history_token_budget"]
+        )
 
         current_response = investment_debate_state.get("current_response", "")
         market_research_report = state["market_report"]
@@ -32,11 +36,8 @@ Key points to focus on:
 - Engagement: Present your argument in a conversational style, engaging directly with the bear analyst's points and debating effectively rather than just listing data.
 
 Resources available:
-Market research report: {market_research_report}
-Social media sentiment report: {sentiment_report}
-Latest world affairs news: {news_report}
-Company fundamentals report: {fundamentals_report}
-Conversation history of the debate: {history}
+The analyst team reports provided above.
+Conversation history of the debate: {prompt_history}
 Last bear argument: {current_response}
 Reflections from similar situations and lessons learned: {past_memory_str}
 Use this information to deliver a compelling bull argument, refute the bear's concerns, and engage in a dynamic debate that demonstrates the strengths of the bull position. You must also address reflections and learn from lessons and mistakes you made in the past.
@@ -44,18 +45,23 @@ Use this information to deliver a compelling bull argument, refute the bear's co
 반드시 모든 분석과 토론 내용을 한국어로 작성하세요.
 """
 
-        response = llm.invoke(prompt)
+        # Shared reports first so the prompt prefix is cacheable across agents
+        messages = [
+            ("system", build_report_context(state)),
+            ("human", prompt),
+        ]
+        response = llm.invoke(messages)
 
         argument = f"Bull Analyst: {response.content}"
 
         new_investment_debate_state = {
-            "history": history + "\n" + argument,
-            "bull_history": bull_history + "\n" + argument,
-            "bear_history": investment_debate_state.get("bear_history", ""),
             "current_response": argument,
             "count": investment_debate_state["count"] + 1,
         }
 
-        return {"investment_debate_state": new_investment_debate_state}
+        return {
+            "investment_debate_state": new_investment_debate_state,
+            "investment_debate_turns": [{"speaker": "Bull", "content": response.content}],
+        }
 
     return bull_node
@@ -1,22 +1,21 @@
 from langchain_core.messages import AIMessage
 import time
 import json
+from tradingagents.agents.utils.agent_utils import build_report_context
+from tradingagents.agents.utils.debate_transcript import compact_turns
+from tradingagents.dataflows.config import get_config
 
 
 def create_conservative_debator(llm):
     def conservative_node(state) -> dict:
         risk_debate_state = state["risk_debate_state"]
-        history = risk_debate_state.get("history", "")
-        conservative_history = risk_debate_state.get("conservative_history", "")
+        prompt_history = compact_turns(
+            state.get("risk_debate_turns", []), get_config()["debate_history_token_budget"]
+        )
 
         current_aggressive_response = risk_debate_state.get("current_aggressive_response", "")
         current_neutral_response = risk_debate_state.get("current_neutral_response", "")
 
-        market_research_report = state["market_report"]
-        sentiment_report = state["sentiment_report"]
-        news_report = state["news_report"]
-        fundamentals_report = state["fundamentals_report"]
-
         trader_decision = state["trader_investment_plan"]
 
         prompt = f"""As the Conservative Risk Analyst, your primary objective is to protect assets, minimize volatility, and ensure steady, reliable growth. You prioritize stability, security, and risk mitigation, carefully assessing potential losses, economic downturns, and market volatility. When evaluating the trader's decision or plan, critically examine high-risk elements, pointing out where the decision may expose the firm to undue risk and where more cautious alternatives could secure long-term gains. Here is the trader's decision:
@@ -25,25 +24,23 @@ def create_conservative_debator(llm):
 
 Your task is to actively counter the arguments of the Aggressive and Neutral Analysts, highlighting where their views may overlook potential threats or fail to prioritize sustainability. Respond directly to their points, drawing from the following data sources to build a convincing case for a low-risk approach adjustment to the trader's decision:
 
-Market Research Report: {market_research_report}
-Social Media Sentiment Report: {sentiment_report}
-Latest World Affairs Report: {news_report}
-Company Fundamentals Report: {fundamentals_report}
-Here is the current conversation history: {history} Here is the last response from the aggressive analyst: {current_aggressive_response} Here is the last response from the neutral analyst: {current_neutral_response}. If there are no responses from the other viewpoints, do not hallucinate and just present your point.
+The analyst team reports provided above (market research, social media sentiment, latest world affairs and company fundamentals).
+Here is the current conversation history: {prompt_history} Here is the last response from the aggressive analyst: {current_aggressive_response} Here is the last response from the neutral analyst: {current_neutral_response}. If there are no responses from the other viewpoints, do not hallucinate and just present your point.
 
 Engage by questioning their optimism and emphasizing the potential downsides they may have overlooked. Address each of their counterpoints to showcase why a conservative stance is ultimately the safest path for the firm's assets. Focus on debating and critiquing their arguments to demonstrate the strength of a low-risk strategy over their approaches. Output conversationally as if you are speaking without any special formatting.
 
 반드시 모든 분석과 토론 내용을 한국어로 작성하세요."""
 
-        response = llm.invoke(prompt)
+        # Shared reports first so the prompt prefix is cacheable across agents
+        messages = [
+            ("system", build_report_context(state)),
+            ("human", prompt),
+        ]
+        response = llm.invoke(messages)
 
         argument = f"Conservative Analyst: {response.content}"
 
         new_risk_debate_state = {
-            "history": history + "\n" + argument,
-            "aggressive_history": risk_debate_state.get("aggressive_history", ""),
-            "conservative_history": conservative_history + "\n" + argument,
-            "neutral_history": risk_debate_state.get("neutral_history", ""),
             "latest_speaker": "Conservative",
             "current_aggressive_response": risk_debate_state.get(
                 "current_aggressive_response", ""
@@ -55,6 +52,9 @@ Engage by questioning their optimism and emphasizing the potential downsides the
             "count": risk_debate_state["count"] + 1,
         }
 
-        return {"risk_debate_state": new_risk_debate_state}
+        return {
+            "risk_debate_state": new_risk_debate_state,
+            "risk_debate_turns": [{"speaker": "Conservative", "content": response.content}],
+        }
 
     return conservative_node
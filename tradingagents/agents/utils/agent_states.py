@@ -1,4 +1,4 @@
-from typing import Annotated, Sequence
+from typing import Annotated, List, Sequence
 from datetime import date, timedelta, datetime
 from typing_extensions import TypedDict, Optional
 from langchain_openai import ChatOpenAI
@@ -7,15 +7,28 @@ from langgraph.prebuilt import ToolNode
 from langgraph.graph import END, StateGraph, START, MessagesState
 
 
+# Version of the final state's shape. Stored results (result cache) are keyed
+# by it, so bump it whenever AgentState gains, loses or changes a field.
+STATE_SCHEMA_VERSION = 1
+
+
+# One argument of a debate, appended to the turn list of its debate
+class DebateTurn(TypedDict):
+    speaker: Annotated[str, "Bull, Bear, Aggressive, Conservative or Neutral"]
+    content: Annotated[str, "Argument made in this turn"]
+
+
+def append_turns(left: list, right: list) -> list:
+    """Reducer appending the turns a node returns to the debate's turn list.
+
+    Nodes return only their new turn, so a state update is O(turn) instead
+    of re-sending the whole transcript as one growing string.
+    """
+    return (left or []) + (right or [])
+
+
 # Researcher team state
 class InvestDebateState(TypedDict):
-    bull_history: Annotated[
-        str, "Bullish Conversation history"
-    ]  # Bullish Conversation history
-    bear_history: Annotated[
-        str, "Bearish Conversation history"
-    ]  # Bullish Conversation history
-    history: Annotated[str, "Conversation history"]  # Conversation history
     current_response: Annotated[str, "Latest response"]  # Last response
     judge_decision: Annotated[str, "Final judge decision"]  # Last response
     count: Annotated[int, "Length of the current conversation"]  # Conversation length
@@ -23,16 +36,6 @@ class InvestDebateState(TypedDict):
 
 # Risk management team state
 class RiskDebateState(TypedDict):
-    aggressive_history: Annotated[
-        str, "Aggressive Agent's Conversation history"
-    ]  # Conversation history
-    conservative_history: Annotated[
-        str, "Conservative Agent's Conversation history"
-    ]  # Conversation history
-    neutral_history: Annotated[
-        str, "Neutral Agent's Conversation history"
-    ]  # Conversation history
-    history: Annotated[str, "Conversation history"]  # Conversation history
     latest_speaker: Annotated[str, "Analyst that spoke last"]
     current_aggressive_response: Annotated[
         str, "Latest response by the aggressive analyst"
@@ -60,11 +63,15 @@ class AgentState(MessagesState):
         str, "Report from the News Researcher of current world affairs"
     ]
     fundamentals_report: Annotated[str, "Report from the Fundamentals Researcher"]
+    analyst_fingerprints: Annotated[
+        dict, "Fingerprint of each analyst's tool inputs in this run, for the report store"
+    ]
 
     # researcher team discussion step
     investment_debate_state: Annotated[
         InvestDebateState, "Current state of the debate on if to invest or not"
     ]
+    investment_debate_turns: Annotated[List[DebateTurn], append_turns]
     investment_plan: Annotated[str, "Plan generated by the Analyst"]
 
     trader_investment_plan: Annotated[str, "Plan generated by the Trader"]
@@ -73,4 +80,8 @@ class AgentState(MessagesState):
     risk_debate_state: Annotated[
         RiskDebateState, "Current state of the debate on evaluating risk"
     ]
+    risk_debate_turns: Annotated[List[DebateTurn], append_turns]
     final_trade_decision: Annotated[str, "Final decision made by the Risk Analysts"]
+    final_decision: Annotated[
+        str, "BUY, SELL or HOLD parsed from the final trade decision, empty if ambiguous"
+    ]
@@ -35,4 +35,16 @@ def create_msg_delete():
     return delete_messages
 
 
-        
\ No newline at end of file
+def build_report_context(state) -> str:
+    """Shared analyst-report context placed first in downstream prompts.
+
+    Researchers and risk debaters all start with this exact text so that
+    provider prompt caches can serve it as a common prefix.
+    """
+    return (
+        f"Analyst team reports for {state['company_of_interest']} as of {state['trade_date']}.\n\n"
+        f"Market research report: {state['market_report']}\n\n"
+        f"Social media sentiment report: {state['sentiment_report']}\n\n"
+        f"Latest world affairs news: {state['news_report']}\n\n"
+        f"Company fundamentals report: {state['fundamentals_report']}"
+    )
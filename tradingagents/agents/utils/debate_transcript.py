@@ -0,0 +1,82 @@
+"""Debate transcript compaction.
+
+Researchers and risk debaters used to paste the full debate history into every
+turn, so prompt size grew quadratically with the number of rounds. The helpers
+here keep the latest turn verbatim and collapse earlier turns into a compact
+extractive summary that fits a token budget.
+
+Debates are kept in the graph state as lists of {"speaker", "content"} turns
+and only rendered to "<Speaker> Analyst: ..." text for prompts and reports.
+"""
+
+from typing import Mapping, Optional, Sequence
+
+
+def estimate_tokens(text: str) -> int:
+    """Cheap token estimate that works for both English and Korean text.
+
+    Roughly four UTF-8 bytes per token: ~4 chars for ASCII, ~1.3 chars for Hangul.
+    """
+    return len(text.encode("utf-8")) // 4
+
+
+def format_turn(turn: Mapping[str, str]) -> str:
+    """Text of one debate turn as it appears in prompts and reports."""
+    return f"{turn['speaker']} Analyst: {turn['content']}"
+
+
+def render_turns(turns: Optional[Sequence[Mapping[str, str]]], speaker: Optional[str] = None) -> str:
+    """Render a debate's turns as text, optionally only those of one speaker."""
+    return "\n".join(
+        format_turn(turn) for turn in turns or [] if speaker is None or turn["speaker"] == speaker
+    )
+
+
+def _excerpt(turn: str, token_budget: int) -> str:
+    """Head of a turn trimmed to roughly token_budget tokens."""
+    if estimate_tokens(turn) <= token_budget:
+        return turn
+    max_bytes = max(token_budget, 1) * 4
+    clipped = turn.encode("utf-8")[:max_bytes].decode("utf-8", errors="ignore")
+    return clipped.rstrip() + " …"
+
+
+def compact_turns(
+    turns: Sequence[Mapping[str, str]], token_budget: int, min_turn_tokens: int = 64
+) -> str:
+    """Render debate turns, compacted to fit within token_budget.
+
+    The latest turn is kept verbatim. Earlier turns share the remaining budget
+    as head excerpts (opening statements carry the thrust of each argument);
+    when even that does not fit, the oldest turns are dropped first.
+
+    Args:
+        turns: Debate turns as stored in the graph state
+        token_budget: Approximate token budget for the returned transcript
+        min_turn_tokens: Smallest excerpt worth keeping for an earlier turn
+
+    Returns:
+        The full transcript when it already fits, otherwise the compacted one
+    """
+    texts = [format_turn(turn) for turn in turns]
+    history = "\n".join(texts)
+    if len(texts) <= 1 or token_budget <= 0 or estimate_tokens(history) <= token_budget:
+        return history
+
+    earlier, latest = texts[:-1], texts[-1]
+    remaining = max(token_budget - estimate_tokens(latest), 0)
+
+    # Keep as many of the most recent earlier turns as the budget allows
+    keep = min(len(earlier), remaining // min_turn_tokens)
+    dropped = len(earlier) - keep
+    kept = earlier[dropped:]
+
+    lines = []
+    if dropped:
+        lines.append(f"({dropped} earlier turns omitted)")
+    if kept:
+        per_turn = remaining // len(kept)
+        lines.extend(f"- {_excerpt(turn, per_turn)}" for turn in kept)
+
+    summary = "\n".join(lines)
+    return f"[Summary of earlier turns]\n{summary}\n\n[Latest turn]\n{latest}"
@@ -0,0 +1,83 @@
+"""Deterministic extraction of the BUY/SELL/HOLD decision from agent output.
+
+Agents are asked to end with "FINAL TRANSACTION PROPOSAL: **BUY/HOLD/SELL**".
+Reports written in Korean sometimes state the decision as 매수/매도/보유
+instead, so both conventions are recognised. When the text carries no explicit
+decision marker, or the markers disagree, the parser gives up and the caller
+can fall back to an LLM.
+"""
+
+import re
+from typing import Optional
+
+DECISIONS = ("BUY", "SELL", "HOLD")
+
+_KOREAN_DECISIONS = {
+    "매수": "BUY",
+    "매도": "SELL",
+    "보유": "HOLD",
+    "관망": "HOLD",
+}
+
+_ACTION = r"(BUY|SELL|HOLD|매수|매도|보유|관망)"
+
+# Korean has no \b between a word and its particle, so an action word must be
+# followed by a particle/copula, punctuation or whitespace (매수세 is not 매수)
+_KOREAN_END = (
+    r"(?=(?:입니다|이다|임|이며|으로|로|을|를|이|가|은|는)?(?:[\s.,!?;:*_`)\]/|]|$))"
+)
+
+# FINAL TRANSACTION PROPOSAL: **BUY**  /  Final Decision: Sell
+_ENGLISH_MARKER = re.compile(
+    r"FINAL\s+(?:TRANSACTION\s+PROPOSAL|DECISION|RECOMMENDATION)\s*[:：]\s*[*_`\s]*(BUY|SELL|HOLD)\b",
+    re.IGNORECASE,
+)
+
+# 최종 결정: **매수**  /  최종 투자 의견은 매도  /  최종 추천 - 보유
+_KOREAN_MARKER = re.compile(
+    r"최종\s*(?:거래\s*)?(?:투자\s*)?(?:결정|의견|추천|권고|제안)(?:은|는)?\s*[:：\-]?\s*[*_`\s]*"
+    + _ACTION
+    + _KOREAN_END,
+    re.IGNORECASE,
+)
+
+# An echoed template such as "BUY/HOLD/SELL" names no decision
+_ACTION_LIST = re.compile(r"[*_`\s]*(?:[/|]|\bor\b|또는)[*_`\s]*" + _ACTION, re.IGNORECASE)
+
+# 매수 보류 / 매도 유보: the action is put off, i.e. the position is held
+_DEFERRED = re.compile(r"(?:입니다|을|를)?[*_`\s]*(?:보류|유보)")
+
+
+def _marker_decision(match: "re.Match", text: str) -> Optional[str]:
+    """Decision named by one marker match, None when it is ambiguous."""
+    rest = text[match.end():]
+    if _ACTION_LIST.match(rest):
+        return None
+    action = _KOREAN_DECISIONS.get(match.group(1), match.group(1).upper())
+    if action in ("BUY", "SELL") and _DEFERRED.match(rest):
+        return "HOLD"
+    return action
+
+
+def parse_decision(text: str) -> Optional[str]:
+    """Extract the decision from text without calling an LLM.
+
+    The last explicit marker wins, since agents restate their conclusion at
+    the end. English and Korean markers must agree when both are present.
+
+    Returns:
+        "BUY", "SELL" or "HOLD", or None when the text is ambiguous
+    """
+    if not text:
+        return None
+
+    english = [_marker_decision(m, text) for m in _ENGLISH_MARKER.finditer(text)]
+    korean = [_marker_decision(m, text) for m in _KOREAN_MARKER.finditer(text)]
+
+    if english and korean and english[-1] != korean[-1]:
+        return None
+    if english:
+        return english[-1]
+    if korean:
+        return korean[-1]
+    return None
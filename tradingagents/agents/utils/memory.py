@@ -2,11 +2,98 @@
 
 Uses BM25 (Best Matching 25) algorithm for retrieval - no API calls,
 no token limits, works offline with any LLM provider.
+
+Memories are kept in an inverted index that is updated incrementally, so
+adding a reflection only tokenizes the new situation. When persistence is
+enabled the situations (with their term frequencies) are also written to a
+local SQLite file and reloaded on start-up without re-tokenizing.
+
+Scoring is vectorized with numpy over the postings of the query terms only,
+and the top matches are selected with argpartition instead of a full sort.
+Only the query's most distinctive terms (highest tf-idf) are scored, and the
+posting arrays grow in place as memories are added, so a lookup touches a
+bounded number of short posting lists however large the memory gets.
+
+To keep memory use and lookup latency flat in long-running deployments, each
+situation is stored as a compact digest (its most distinctive terms plus a
+short excerpt) rather than the four raw reports, older memories are weighted
+down by an exponential time decay, and each memory is capped at a configurable
+number of entries with age, outcome or redundancy based eviction.
 """
 
-from rank_bm25 import BM25Okapi
-from typing import List, Tuple
+import json
+import math
+import os
 import re
+import sqlite3
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+# BM25Okapi defaults (same as rank_bm25)
+BM25_K1 = 1.5
+BM25_B = 0.75
+
+EVICTION_POLICIES = ("age", "outcome", "redundancy")
+
+# Eviction trims a full memory to this fraction of its capacity so that the
+# index is not rebuilt on every subsequent addition
+_EVICTION_TARGET = 0.9
+
+_INITIAL_POSTING_CAPACITY = 8
+
+# Redundancy eviction compares a document only with the newer documents that
+# share one of its rarest terms, and with at most this many of them
+_REDUNDANCY_CANDIDATE_TERMS = 4
+_REDUNDANCY_MAX_CANDIDATES = 256
+
+
+def _tokenize(text: str) -> List[str]:
+    # Lowercase and split on non-alphanumeric characters
+    return re.findall(r'\b\w+\b', text.lower())
+
+
+@lru_cache(maxsize=32)
+def _query_terms(text: str) -> Tuple[Tuple[str, int], ...]:
+    """(term, count) pairs of a query.
+
+    Cached at module level: the agents query all five memories with the same
+    situation text, so it is tokenized once per run instead of five times.
+    """
+    return tuple(Counter(_tokenize(text)).items())
+
+
+def _append_posting(
+    arrays: Tuple[np.ndarray, np.ndarray, int], position: int, tf: int
+) -> Tuple[np.ndarray, np.ndarray, int]:
+    """Append one posting to a term's arrays, doubling their capacity when full."""
+    positions, tfs, size = arrays
+    if size == len(positions):
+        positions = np.resize(positions, 2 * size)
+        tfs = np.resize(tfs, 2 * size)
+    positions[size] = position
+    tfs[size] = tf
+    return positions, tfs, size + 1
+
+
+def _extended(array: np.ndarray, values: List[float]) -> np.ndarray:
+    """array with the values appended since it was last extended."""
+    if len(array) < len(values):
+        array = np.concatenate([array, np.asarray(values[len(array):], dtype=np.float64)])
+    return array
+
+
+def _as_outcome(returns_losses) -> Optional[float]:
+    try:
+        return float(returns_losses)
+    except (TypeError, ValueError):
+        return None
 
 
 class FinancialSituationMemory:
@@ -17,42 +104,348 @@ class FinancialSituationMemory:
 
         Args:
             name: Name identifier for this memory instance
-            config: Configuration dict (kept for API compatibility, not used for BM25)
+            config: Configuration dict. With "memory_persist" enabled the memory
+                is stored in "memory_db_path" (default <cache_dir>/memories.db).
+                The memory_* capacity, eviction, decay and digest settings are
+                read from it as well.
         """
         self.name = name
+        config = config or {}
+        self.max_entries = config.get("memory_max_entries") or None
+        self.eviction_policy = config.get("memory_eviction_policy", "age")
+        if self.eviction_policy not in EVICTION_POLICIES:
+            raise ValueError(f"Unsupported memory eviction policy: {self.eviction_policy}")
+        self.decay_half_life_days = config.get("memory_decay_half_life_days") or None
+        self.digest_terms = config.get("memory_digest_terms", 200)
+        self.digest_chars = config.get("memory_digest_chars", 1500)
+        self.query_term_limit = config.get("memory_query_terms", 64) or None
+
         self.documents: List[str] = []
         self.recommendations: List[str] = []
-        self.bm25 = None
+        self._outcomes: List[Optional[float]] = []
+        self._created_at: List[float] = []
+        self._row_ids: List[Optional[int]] = []
+
+        # Inverted index: term -> {document position: term frequency}
+        self._postings: Dict[str, Dict[int, int]] = {}
+        self._doc_lens: List[int] = []
+        self._total_len = 0
+        self._lock = threading.RLock()
+
+        # numpy copies of the postings, built lazily on first lookup of a term
+        # and appended to in place afterwards: term -> (positions, tfs, size)
+        self._term_arrays: Dict[str, Tuple[np.ndarray, np.ndarray, int]] = {}
+        # numpy copies of _doc_lens and _created_at, extended before lookups
+        self._doc_len_array = np.empty(0)
+        self._created_at_array = np.empty(0)
+
+        self.db_path: Optional[Path] = None
+        if config.get("memory_persist"):
+            self.db_path = Path(
+                config.get("memory_db_path")
+                or os.path.join(config["cache_dir"], "memories.db")
+            )
+            self._init_db()
+            self._load()
+
+    @contextmanager
+    def _connect(self):
+        conn = sqlite3.connect(str(self.db_path), timeout=30)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def _init_db(self):
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS situation_memories (
+                    id              INTEGER PRIMARY KEY AUTOINCREMENT,
+                    memory          TEXT NOT NULL,
+                    situation       TEXT NOT NULL,
+                    recommendation  TEXT NOT NULL,
+                    term_freqs      TEXT NOT NULL,
+                    created_at      REAL NOT NULL,
+                    outcome         REAL
+                )
+                """
+            )
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(situation_memories)")}
+            if "outcome" not in columns:
+                conn.execute("ALTER TABLE situation_memories ADD COLUMN outcome REAL")
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_situation_memories_memory "
+                "ON situation_memories(memory, id)"
+            )
+
+    def _load(self):
+        """Load the stored situations of this memory into the index."""
+        with self._connect() as conn:
+            rows = conn.execute(
+                """
+                SELECT id, situation, recommendation, term_freqs, created_at, outcome
+                FROM situation_memories WHERE memory = ? ORDER BY id
+                """,
+                (self.name,),
+            ).fetchall()
+        with self._lock:
+            for row_id, situation, recommendation, term_freqs, created_at, outcome in rows:
+                self._index(
+                    situation, recommendation, json.loads(term_freqs),
+                    created_at, outcome, row_id,
+                )
+            self._enforce_capacity()
 
     def _tokenize(self, text: str) -> List[str]:
         """Tokenize text for BM25 indexing.
 
         Simple whitespace + punctuation tokenization with lowercasing.
         """
-        # Lowercase and split on non-alphanumeric characters
-        tokens = re.findall(r'\b\w+\b', text.lower())
-        return tokens
-
-    def _rebuild_index(self):
-        """Rebuild the BM25 index after adding documents."""
-        if self.documents:
-            tokenized_docs = [self._tokenize(doc) for doc in self.documents]
-            self.bm25 = BM25Okapi(tokenized_docs)
-        else:
-            self.bm25 = None
-
-    def add_situations(self, situations_and_advice: List[Tuple[str, str]]):
+        return _tokenize(text)
+
+    def _digest(self, situation: str) -> Tuple[str, Dict[str, int]]:
+        """Compact digest of a situation: its most distinctive terms and an excerpt.
+
+        Terms are ranked by tf-idf against the memory's current corpus, so
+        boilerplate shared by every report does not crowd out the terms that
+        tell situations apart.
+        """
+        term_freqs = Counter(t for t in _tokenize(situation) if len(t) > 1)
+        if self.digest_terms and len(term_freqs) > self.digest_terms:
+            num_docs = len(self.documents)
+            ranked = sorted(
+                term_freqs.items(),
+                key=lambda item: item[1] * self._idf(len(self._postings.get(item[0], ())), num_docs),
+                reverse=True,
+            )
+            term_freqs = Counter(dict(ranked[:self.digest_terms]))
+
+        excerpt = situation.strip()
+        if self.digest_chars and len(excerpt) > self.digest_chars:
+            excerpt = excerpt[:self.digest_chars].rstrip() + " …"
+        return excerpt, dict(term_freqs)
+
+    def _index(
+        self,
+        situation: str,
+        recommendation: str,
+        term_freqs: Dict[str, int],
+        created_at: float,
+        outcome: Optional[float] = None,
+        row_id: Optional[int] = None,
+    ):
+        """Append one document to the inverted index."""
+        position = len(self.documents)
+        self.documents.append(situation)
+        self.recommendations.append(recommendation)
+        self._created_at.append(created_at)
+        self._outcomes.append(outcome)
+        self._row_ids.append(row_id)
+        for term, tf in term_freqs.items():
+            self._postings.setdefault(term, {})[position] = tf
+            arrays = self._term_arrays.get(term)
+            if arrays is not None:
+                self._term_arrays[term] = _append_posting(arrays, position, tf)
+        doc_len = sum(term_freqs.values())
+        self._doc_lens.append(doc_len)
+        self._total_len += doc_len
+
+    def add_situations(
+        self,
+        situations_and_advice: List[Tuple[str, str]],
+        outcome=None,
+    ):
         """Add financial situations and their corresponding advice.
 
+        Only the new situations are tokenized; the index is updated in place.
+
         Args:
             situations_and_advice: List of tuples (situation, recommendation)
+            outcome: Returns/losses the advice was derived from, used by the
+                "outcome" eviction policy
         """
-        for situation, recommendation in situations_and_advice:
-            self.documents.append(situation)
-            self.recommendations.append(recommendation)
+        outcome = _as_outcome(outcome)
+        now = time.time()
+
+        with self._lock:
+            entries = [
+                (*self._digest(situation), recommendation)
+                for situation, recommendation in situations_and_advice
+            ]
+            row_ids: List[Optional[int]] = [None] * len(entries)
+            if self.db_path is not None:
+                with self._connect() as conn:
+                    for i, (excerpt, term_freqs, recommendation) in enumerate(entries):
+                        cursor = conn.execute(
+                            """
+                            INSERT INTO situation_memories
+                                (memory, situation, recommendation, term_freqs, created_at, outcome)
+                            VALUES (?, ?, ?, ?, ?, ?)
+                            """,
+                            (self.name, excerpt, recommendation,
+                             json.dumps(term_freqs, ensure_ascii=False), now, outcome),
+                        )
+                        row_ids[i] = cursor.lastrowid
+            for (excerpt, term_freqs, recommendation), row_id in zip(entries, row_ids):
+                self._index(excerpt, recommendation, term_freqs, now, outcome, row_id)
+            self._enforce_capacity()
+
+    def _eviction_order(self) -> List[int]:
+        """Document positions ordered from first to last to evict."""
+        num_docs = len(self.documents)
+        by_age = list(range(num_docs))  # Positions follow insertion order
+        if self.eviction_policy == "age":
+            return by_age
+        if self.eviction_policy == "outcome":
+            # Small wins/losses teach the least; unknown outcomes go first
+            return sorted(
+                by_age,
+                key=lambda i: -1.0 if self._outcomes[i] is None else abs(self._outcomes[i]),
+            )
+
+        # redundancy: documents most similar to a newer document go first
+        doc_terms: List[List[Tuple[str, int]]] = [[] for _ in range(num_docs)]
+        for term, postings in self._postings.items():
+            for position in postings:
+                doc_terms[position].append((term, 1))
+
+        redundancy = np.zeros(num_docs)
+        for position in range(num_docs - 1):
+            redundancy[position] = self._redundancy(position, tuple(doc_terms[position]))
+        return sorted(by_age, key=lambda i: -redundancy[i])
+
+    def _redundancy(self, position: int, doc_terms: Tuple[Tuple[str, int], ...]) -> float:
+        """Best score of a newer document against a document, relative to its own.
+
+        Eviction runs under the index lock, so instead of scoring the whole
+        memory per document only the newer documents sharing one of its
+        rarest terms are scored, which keeps eviction near linear in the
+        memory size.
+        """
+        terms = self._select_query_terms(doc_terms)
+        rarest = sorted(terms, key=lambda item: item[2], reverse=True)[:_REDUNDANCY_CANDIDATE_TERMS]
+        candidates = set()
+        for term, _, _ in rarest:
+            candidates.update(p for p in self._postings[term] if p > position)
+        if not candidates:
+            return 0.0
+        candidates = sorted(candidates)[-_REDUNDANCY_MAX_CANDIDATES:]
+
+        num_docs = len(self.documents)
+        avg_len = self._total_len / num_docs if self._total_len else 1.0
+
+        def score(doc: int) -> float:
+            len_norm = BM25_K1 * (1 - BM25_B + BM25_B * self._doc_lens[doc] / avg_len)
+            total = 0.0
+            for term, query_tf, idf in terms:
+                tf = self._postings[term].get(doc)
+                if tf:
+                    total += query_tf * idf * tf * (BM25_K1 + 1) / (tf + len_norm)
+            return total
 
-        # Rebuild BM25 index with new documents
-        self._rebuild_index()
+        self_score = score(position)
+        if self_score <= 0:
+            return 0.0
+        return max(score(doc) for doc in candidates) / self_score
+
+    def _enforce_capacity(self):
+        """Evict entries once the memory exceeds its capacity."""
+        if not self.max_entries or len(self.documents) <= self.max_entries:
+            return
+
+        target = max(int(self.max_entries * _EVICTION_TARGET), 1)
+        evicted = set(self._eviction_order()[:len(self.documents) - target])
+
+        if self.db_path is not None:
+            row_ids = [(self._row_ids[i],) for i in evicted if self._row_ids[i] is not None]
+            with self._connect() as conn:
+                conn.executemany("DELETE FROM situation_memories WHERE id = ?", row_ids)
+
+        # Compact the index without re-tokenizing: remap surviving positions
+        kept = [i for i in range(len(self.documents)) if i not in evicted]
+        new_position = {old: new for new, old in enumerate(kept)}
+        self.documents = [self.documents[i] for i in kept]
+        self.recommendations = [self.recommendations[i] for i in kept]
+        self._outcomes = [self._outcomes[i] for i in kept]
+        self._created_at = [self._created_at[i] for i in kept]
+        self._row_ids = [self._row_ids[i] for i in kept]
+        self._doc_lens = [self._doc_lens[i] for i in kept]
+        self._total_len = sum(self._doc_lens)
+        postings = {}
+        for term, term_postings in self._postings.items():
+            remapped = {
+                new_position[old]: tf for old, tf in term_postings.items() if old in new_position
+            }
+            if remapped:
+                postings[term] = remapped
+        self._postings = postings
+        self._term_arrays = {}
+        self._doc_len_array = np.empty(0)
+        self._created_at_array = np.empty(0)
+
+    def _idf(self, doc_freq: int, num_docs: int) -> float:
+        """BM25 inverse document frequency.
+
+        Uses the log(1 + ...) form, which stays positive for terms that occur
+        in more than half of the documents.
+        """
+        return math.log(1 + (num_docs - doc_freq + 0.5) / (doc_freq + 0.5))
+
+    def _get_term_arrays(self, term: str) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """(positions, term frequencies) arrays of a term's postings."""
+        arrays = self._term_arrays.get(term)
+        if arrays is None:
+            postings = self._postings.get(term)
+            if not postings:
+                return None
+            size = len(postings)
+            capacity = max(_INITIAL_POSTING_CAPACITY, 2 * size)
+            positions = np.empty(capacity, dtype=np.int64)
+            tfs = np.empty(capacity, dtype=np.float64)
+            positions[:size] = np.fromiter(postings.keys(), dtype=np.int64, count=size)
+            tfs[:size] = np.fromiter(postings.values(), dtype=np.float64, count=size)
+            arrays = self._term_arrays[term] = (positions, tfs, size)
+        positions, tfs, size = arrays
+        return positions[:size], tfs[:size]
+
+    def _select_query_terms(
+        self, query_terms: Tuple[Tuple[str, int], ...]
+    ) -> List[Tuple[str, int, float]]:
+        """(term, count, idf) of the indexed query terms that are scored.
+
+        Beyond query_term_limit only the terms with the highest tf-idf are
+        kept. Frequent terms carry little weight in BM25 but have the longest
+        posting lists, so dropping them bounds the lookup cost at a negligible
+        change in ranking.
+        """
+        num_docs = len(self.documents)
+        selected = []
+        for term, query_tf in query_terms:
+            postings = self._postings.get(term)
+            if postings:
+                selected.append((term, query_tf, self._idf(len(postings), num_docs)))
+        if self.query_term_limit and len(selected) > self.query_term_limit:
+            selected.sort(key=lambda item: item[1] * item[2], reverse=True)
+            del selected[self.query_term_limit:]
+        return selected
+
+    def _get_scores(self, query_terms: Tuple[Tuple[str, int], ...]) -> np.ndarray:
+        """BM25 score of every document, computed from the query terms' postings."""
+        num_docs = len(self.documents)
+        avg_len = self._total_len / num_docs if self._total_len else 1.0
+        self._doc_len_array = doc_lens = _extended(self._doc_len_array, self._doc_lens)
+
+        scores = np.zeros(num_docs)
+        for term, query_tf, idf in self._select_query_terms(query_terms):
+            positions, tfs = self._get_term_arrays(term)
+            len_norm = BM25_K1 * (1 - BM25_B + BM25_B * doc_lens[positions] / avg_len)
+            # Positions are unique within a posting list, so += is safe
+            scores[positions] += query_tf * idf * tfs * (BM25_K1 + 1) / (tfs + len_norm)
+        return scores
 
     def get_memories(self, current_situation: str, n_matches: int = 1) -> List[dict]:
         """Find matching recommendations using BM25 similarity.
@@ -64,38 +457,56 @@ class FinancialSituationMemory:
         Returns:
             List of dicts with matched_situation, recommendation, and similarity_score
         """
-        if not self.documents or self.bm25 is None:
-            return []
-
-        # Tokenize query
-        query_tokens = self._tokenize(current_situation)
+        query_terms = _query_terms(current_situation)
 
-        # Get BM25 scores for all documents
-        scores = self.bm25.get_scores(query_tokens)
+        with self._lock:
+            if not self.documents or n_matches <= 0:
+                return []
 
-        # Get top-n indices sorted by score (descending)
-        top_indices = sorted(range(len(scores)), key=lambda i: scores[i], reverse=True)[:n_matches]
+            scores = self._get_scores(query_terms)
+            if self.decay_half_life_days:
+                self._created_at_array = _extended(self._created_at_array, self._created_at)
+                age_days = (time.time() - self._created_at_array) / 86400
+                scores = scores * np.power(0.5, np.maximum(age_days, 0) / self.decay_half_life_days)
 
-        # Build results
-        results = []
-        max_score = max(scores) if max(scores) > 0 else 1  # Normalize scores
+            # Top-n without sorting the whole score array
+            n_matches = min(n_matches, len(scores))
+            top_indices = np.argpartition(-scores, n_matches - 1)[:n_matches]
+            top_indices = top_indices[np.argsort(-scores[top_indices], kind="stable")]
 
-        for idx in top_indices:
-            # Normalize score to 0-1 range for consistency
-            normalized_score = scores[idx] / max_score if max_score > 0 else 0
-            results.append({
-                "matched_situation": self.documents[idx],
-                "recommendation": self.recommendations[idx],
-                "similarity_score": normalized_score,
-            })
+            # Normalize scores to 0-1 range for consistency
+            max_score = scores[top_indices[0]]
+            if max_score <= 0:
+                max_score = 1.0
 
-        return results
+            return [
+                {
+                    "matched_situation": self.documents[idx],
+                    "recommendation": self.recommendations[idx],
+                    "similarity_score": float(scores[idx] / max_score),
+                }
+                for idx in top_indices
+            ]
 
     def clear(self):
         """Clear all stored memories."""
-        self.documents = []
-        self.recommendations = []
-        self.bm25 = None
+        with self._lock:
+            if self.db_path is not None:
+                with self._connect() as conn:
+                    conn.execute(
+                        "DELETE FROM situation_memories WHERE memory = ?", (self.name,)
+                    )
+            self.documents = []
+            self.recommendations = []
+            self._postings = {}
+            self._outcomes = []
+            self._created_at = []
+            self._row_ids = []
+            self._doc_lens = []
+            self._total_len = 0
+            self._term_arrays = {}
+            self._doc_len_array = np.empty(0)
+            self._created_at_array = np.empty(0)
 
 
 if __name__ == "__main__":
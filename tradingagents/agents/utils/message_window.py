@@ -0,0 +1,73 @@
+"""Message window for analyst tool loops.
+
+Analysts append an AIMessage and its ToolMessages to state["messages"] on
+every tool round, and the whole list is resent on the next round. The helper
+here keeps the tool results of the most recent rounds verbatim and collapses
+older ones to a short head/tail summary, so the prompt size of a round stays
+bounded however many tools the analyst calls. The state itself is not
+modified; only the messages sent to the LLM are windowed.
+"""
+
+from typing import List, Sequence
+
+from langchain_core.messages import AIMessage, BaseMessage, ToolMessage
+
+
+def summarize_tool_output(content: str, head_lines: int = 2, tail_lines: int = 6) -> str:
+    """Compact summary of a tool output: its first and last lines.
+
+    Tool outputs are headed reports or CSV tables sorted by date, so the head
+    keeps the title/columns and the tail keeps the most recent values.
+    """
+    lines = content.splitlines()
+    if len(lines) <= head_lines + tail_lines + 1:
+        return content
+    omitted = len(lines) - head_lines - tail_lines
+    return "\n".join(
+        ["[Earlier tool result, summarized]"]
+        + lines[:head_lines]
+        + [f"... ({omitted} lines omitted) ..."]
+        + lines[-tail_lines:]
+    )
+
+
+def window_messages(
+    messages: Sequence[BaseMessage],
+    keep_rounds: int = 2,
+    head_lines: int = 2,
+    tail_lines: int = 6,
+) -> List[BaseMessage]:
+    """Collapse the tool results of all but the last keep_rounds tool rounds.
+
+    Every ToolMessage is kept (providers require a result for each tool
+    call); only the content of older ones is replaced by a summary.
+
+    Args:
+        messages: Conversation of the analyst loop
+        keep_rounds: Number of most recent tool-calling rounds kept verbatim
+        head_lines: Lines kept from the start of a collapsed result
+        tail_lines: Lines kept from the end of a collapsed result
+
+    Returns:
+        The messages to send to the LLM
+    """
+    if keep_rounds is None or keep_rounds < 0:
+        return list(messages)
+
+    # Index of the AIMessage opening each tool round
+    round_starts = [
+        i for i, message in enumerate(messages)
+        if isinstance(message, AIMessage) and message.tool_calls
+    ]
+    if len(round_starts) <= keep_rounds:
+        return list(messages)
+    cutoff = round_starts[len(round_starts) - keep_rounds] if keep_rounds else len(messages)
+
+    windowed = []
+    for i, message in enumerate(messages):
+        if i < cutoff and isinstance(message, ToolMessage) and isinstance(message.content, str):
+            summary = summarize_tool_output(message.content, head_lines, tail_lines)
+            if summary is not message.content:
+                message = message.model_copy(update={"content": summary})
+        windowed.append(message)
+    return windowed
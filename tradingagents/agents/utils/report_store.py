@@ -0,0 +1,202 @@
+"""Analyst report store for incremental re-analysis.
+
+Each analyst's report is stored together with a fingerprint of the data the
+analyst works from. When the same ticker is analysed again and the fingerprint
+still matches a report produced within the staleness window, the stored report
+is reused and the analyst's LLM/tool loop is skipped.
+"""
+
+import hashlib
+import re
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from langchain_core.messages import AIMessage, ToolMessage
+
+from tradingagents.dataflows.interface import is_cacheable_result, route_to_vendor
+
+# Lines that change on every fetch without the underlying data changing
+_VOLATILE_LINE = re.compile(r"^(# Data retrieved on:|## .*, from \d{4}-\d{2}-\d{2} to )")
+
+
+def _shift_date(date_str: str, days: int) -> str:
+    return (datetime.strptime(date_str, "%Y-%m-%d") + timedelta(days=days)).strftime("%Y-%m-%d")
+
+
+def _market_inputs(ticker: str, trade_date: str) -> List[str]:
+    return [route_to_vendor("get_stock_data", ticker, _shift_date(trade_date, -30), trade_date)]
+
+
+def _social_inputs(ticker: str, trade_date: str) -> List[str]:
+    return [route_to_vendor("get_news", ticker, _shift_date(trade_date, -7), trade_date)]
+
+
+def _news_inputs(ticker: str, trade_date: str) -> List[str]:
+    return [
+        route_to_vendor("get_news", ticker, _shift_date(trade_date, -7), trade_date),
+        route_to_vendor("get_global_news", trade_date, 7, 5),
+    ]
+
+
+def _fundamentals_inputs(ticker: str, trade_date: str) -> List[str]:
+    # The overview from get_fundamentals contains price-derived fields
+    # (market cap, PE, ...) that move daily, so only the statements count.
+    return [
+        route_to_vendor("get_balance_sheet", ticker, "quarterly", trade_date),
+        route_to_vendor("get_cashflow", ticker, "quarterly", trade_date),
+        route_to_vendor("get_income_statement", ticker, "quarterly", trade_date),
+    ]
+
+
+# Analyst type -> function returning the raw tool inputs to fingerprint
+FINGERPRINT_INPUTS: Dict[str, Callable[[str, str], List[str]]] = {
+    "market": _market_inputs,
+    "social": _social_inputs,
+    "news": _news_inputs,
+    "fundamentals": _fundamentals_inputs,
+}
+
+
+def fingerprint_inputs(analyst_type: str, ticker: str, trade_date: str) -> Optional[str]:
+    """Fingerprint the tool inputs of an analyst.
+
+    Returns None when any input could not be fetched (including vendor
+    failures returned as text, such as "No ... found"), in which case the
+    analyst always runs normally and its report is not stored.
+    """
+    try:
+        inputs = FINGERPRINT_INPUTS[analyst_type](ticker, trade_date)
+    except Exception:
+        return None
+
+    digest = hashlib.sha256()
+    for text in inputs:
+        if not is_cacheable_result(text):
+            return None
+        lines = [line for line in text.splitlines() if not _VOLATILE_LINE.match(line)]
+        digest.update("\n".join(lines).encode("utf-8"))
+        digest.update(b"\x00")
+    return digest.hexdigest()
+
+
+class AnalystReportStore:
+    """SQLite-backed store of analyst reports keyed by input fingerprint."""
+
+    def __init__(self, db_path: str, staleness_days: int = 3):
+        """Initialize the store.
+
+        Args:
+            db_path: Path of the SQLite database file
+            staleness_days: Maximum age in calendar days of a reusable report,
+                relative to the trade date being analysed
+        """
+        self.db_path = Path(db_path)
+        self.staleness_days = staleness_days
+        self._lock = threading.Lock()
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS analyst_reports (
+                    analyst      TEXT NOT NULL,
+                    ticker       TEXT NOT NULL,
+                    fingerprint  TEXT NOT NULL,
+                    trade_date   TEXT NOT NULL,
+                    report       TEXT NOT NULL,
+                    created_at   REAL NOT NULL,
+                    PRIMARY KEY (analyst, ticker, fingerprint, trade_date)
+                )
+                """
+            )
+
+    @contextmanager
+    def _connect(self):
+        conn = sqlite3.connect(str(self.db_path), timeout=30)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def lookup(
+        self, analyst: str, ticker: str, fingerprint: str, trade_date: str
+    ) -> Optional[str]:
+        """Return the newest matching report within the staleness window."""
+        oldest = _shift_date(trade_date, -self.staleness_days)
+        with self._lock, self._connect() as conn:
+            row = conn.execute(
+                """
+                SELECT report FROM analyst_reports
+                WHERE analyst = ? AND ticker = ? AND fingerprint = ?
+                  AND trade_date BETWEEN ? AND ?
+                ORDER BY trade_date DESC, created_at DESC
+                LIMIT 1
+                """,
+                (analyst, ticker.upper(), fingerprint, oldest, trade_date),
+            ).fetchone()
+        return row[0] if row else None
+
+    def save(
+        self, analyst: str, ticker: str, fingerprint: str, trade_date: str, report: str
+    ):
+        """Store a freshly generated report."""
+        with self._lock, self._connect() as conn:
+            conn.execute(
+                """
+                INSERT OR REPLACE INTO analyst_reports
+                    (analyst, ticker, fingerprint, trade_date, report, created_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                (analyst, ticker.upper(), fingerprint, trade_date, report, time.time()),
+            )
+
+
+def create_reusable_analyst(analyst_node, analyst_type: str, report_key: str, store: AnalystReportStore):
+    """Wrap an analyst node so that it reuses a stored report when its inputs are unchanged.
+
+    Args:
+        analyst_node: The analyst node created by create_*_analyst
+        analyst_type: One of "market", "social", "news", "fundamentals"
+        report_key: State key the analyst writes its report to
+        store: Report store used for lookups and saves
+    """
+    def reusable_analyst_node(state):
+        ticker = state["company_of_interest"]
+        trade_date = state["trade_date"]
+        fingerprints = state.get("analyst_fingerprints") or {}
+
+        # Only the first turn of the tool loop may short-circuit. The fingerprint
+        # it computes is kept in the run's state, not in this node, since the
+        # graph (and so this node) is shared by concurrent runs
+        in_tool_loop = bool(state["messages"]) and isinstance(state["messages"][-1], ToolMessage)
+        if in_tool_loop:
+            fingerprint = fingerprints.get(analyst_type)
+        else:
+            fingerprint = fingerprint_inputs(analyst_type, ticker, trade_date)
+            if fingerprint is not None:
+                report = store.lookup(analyst_type, ticker, fingerprint, trade_date)
+                if report:
+                    return {
+                        "messages": [AIMessage(content=report)],
+                        report_key: report,
+                    }
+
+        result = analyst_node(state)
+
+        if not in_tool_loop:
+            result = {
+                **result,
+                "analyst_fingerprints": {**fingerprints, analyst_type: fingerprint},
+            }
+        if result.get(report_key) and fingerprint is not None:
+            store.save(analyst_type, ticker, fingerprint, trade_date, result[report_key])
+
+        return result
+
+    return reusable_analyst_node
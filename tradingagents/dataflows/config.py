@@ -1,9 +1,16 @@
 import tradingagents.default_config as default_config
+from contextlib import contextmanager
+from contextvars import ContextVar
 from typing import Dict, Optional
 
 # Use default config but allow it to be overridden
 _config: Optional[Dict] = None
 
+# Config of the run executing in the current context. LangGraph copies the
+# context into node and tool threads, so every tool of a run sees its own
+# graph's settings even when several graphs run in one process.
+_run_config: ContextVar[Optional[Dict]] = ContextVar("run_config", default=None)
+
 
 def initialize_config():
     """Initialize the configuration with default values."""
@@ -13,15 +20,35 @@ def initialize_config():
 
 
 def set_config(config: Dict):
-    """Update the configuration with custom values."""
+    """Update the process-wide configuration with custom values.
+
+    Used outside of a config_scope(); runs inside a scope are not affected.
+    """
     global _config
     if _config is None:
         _config = default_config.DEFAULT_CONFIG.copy()
     _config.update(config)
 
 
+@contextmanager
+def config_scope(config: Dict):
+    """Make config the configuration seen by get_config() in this context.
+
+    Values missing from config fall back to the defaults. Scopes nest, and
+    threads or tasks started with a copy of the context inherit the scope.
+    """
+    token = _run_config.set({**default_config.DEFAULT_CONFIG, **config})
+    try:
+        yield
+    finally:
+        _run_config.reset(token)
+
+
 def get_config() -> Dict:
-    """Get the current configuration."""
+    """Get the configuration of the current run, or the process-wide one."""
+    scoped = _run_config.get()
+    if scoped is not None:
+        return scoped.copy()
     if _config is None:
         initialize_config()
     return _config.copy()
@@ -0,0 +1,296 @@
+"""Shared cache tier for vendor data.
+
+route_to_vendor results (price tables, indicator reports, fundamentals, news)
+are cached in two levels: an in-process LRU in front of a backend shared by
+every process on the host (SQLite with memory-mapped reads) or across hosts
+(Redis). Misses are single-flighted: concurrent requests for the same key in
+one process wait on a single fetch, and across processes the first one takes
+a short lock in the backend while the others wait for its result, so several
+workers analysing the same ticker hit yfinance or Alpha Vantage once.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+# Seconds a backend fetch lock is held before waiters give up on it
+_LOCK_TTL = 60
+_LOCK_POLL = 0.1
+
+
+def _is_str(result: Any) -> bool:
+    return isinstance(result, str)
+
+
+class SQLiteCacheBackend:
+    """Host-wide cache in a SQLite file read through mmap."""
+
+    def __init__(self, db_path: str, mmap_size: int = 256 * 1024 * 1024):
+        self.db_path = Path(db_path)
+        self.mmap_size = mmap_size
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS vendor_data (
+                    key         TEXT PRIMARY KEY,
+                    value       TEXT NOT NULL,
+                    expires_at  REAL NOT NULL
+                )
+                """
+            )
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS vendor_locks (
+                    key         TEXT PRIMARY KEY,
+                    expires_at  REAL NOT NULL
+                )
+                """
+            )
+
+    @contextmanager
+    def _connect(self):
+        conn = sqlite3.connect(str(self.db_path), timeout=30)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(f"PRAGMA mmap_size={int(self.mmap_size)}")
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT value FROM vendor_data WHERE key = ? AND expires_at > ?",
+                (key, time.time()),
+            ).fetchone()
+        return row[0] if row else None
+
+    def set(self, key: str, value: str, ttl: float):
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO vendor_data (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, value, now + ttl),
+            )
+            conn.execute("DELETE FROM vendor_data WHERE expires_at <= ?", (now,))
+
+    def acquire_lock(self, key: str, ttl: float) -> bool:
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute("DELETE FROM vendor_locks WHERE key = ? AND expires_at <= ?", (key, now))
+            cursor = conn.execute(
+                "INSERT OR IGNORE INTO vendor_locks (key, expires_at) VALUES (?, ?)",
+                (key, now + ttl),
+            )
+            return cursor.rowcount == 1
+
+    def release_lock(self, key: str):
+        with self._connect() as conn:
+            conn.execute("DELETE FROM vendor_locks WHERE key = ?", (key,))
+
+
+class RedisCacheBackend:
+    """Cache shared across hosts through Redis."""
+
+    def __init__(self, redis_client, namespace: str = "tradingagents:vendor"):
+        self.redis = redis_client
+        self.namespace = namespace
+
+    @classmethod
+    def from_url(cls, url: str, **kwargs) -> "RedisCacheBackend":
+        import redis
+
+        return cls(redis.Redis.from_url(url), **kwargs)
+
+    def get(self, key: str) -> Optional[str]:
+        value = self.redis.get(f"{self.namespace}:data:{key}")
+        return value.decode("utf-8") if isinstance(value, bytes) else value
+
+    def set(self, key: str, value: str, ttl: float):
+        self.redis.set(f"{self.namespace}:data:{key}", value, ex=max(1, int(ttl)))
+
+    def acquire_lock(self, key: str, ttl: float) -> bool:
+        return bool(self.redis.set(f"{self.namespace}:lock:{key}", 1, nx=True, ex=max(1, int(ttl))))
+
+    def release_lock(self, key: str):
+        self.redis.delete(f"{self.namespace}:lock:{key}")
+
+
+class VendorDataCache:
+    """In-process LRU in front of a shared backend, with single-flight misses."""
+
+    def __init__(self, backend=None, lru_size: int = 256):
+        """Initialize the cache.
+
+        Args:
+            backend: SQLiteCacheBackend, RedisCacheBackend or None for LRU only
+            lru_size: Entries kept in the in-process LRU
+        """
+        self.backend = backend
+        self.lru_size = lru_size
+        self._lru: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+        self._inflight: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.shared_hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(method: str, args: tuple, kwargs: dict, vendors: Any) -> str:
+        """Key of a vendor call; includes the vendor routing it resolves to."""
+        raw = json.dumps([method, args, sorted(kwargs.items()), vendors], default=str)
+        return f"{method}:{hashlib.sha256(raw.encode('utf-8')).hexdigest()[:32]}"
+
+    def _lru_get(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._lru.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at <= time.time():
+                del self._lru[key]
+                return None
+            self._lru.move_to_end(key)
+            return value
+
+    def _lru_put(self, key: str, value: str, ttl: float):
+        with self._lock:
+            self._lru[key] = (value, time.time() + ttl)
+            self._lru.move_to_end(key)
+            while len(self._lru) > self.lru_size:
+                self._lru.popitem(last=False)
+
+    def _fetch_shared(
+        self, key: str, fetch: Callable[[], Any], ttl: float, cacheable: Callable[[Any], bool]
+    ):
+        """Read the backend, or fetch under its lock so other processes wait."""
+        value = self.backend.get(key)
+        if value is not None:
+            self.shared_hits += 1
+            return value
+        deadline = time.monotonic() + _LOCK_TTL
+        locked = self.backend.acquire_lock(key, _LOCK_TTL)
+        while not locked:
+            time.sleep(_LOCK_POLL)
+            value = self.backend.get(key)
+            if value is not None:
+                self.shared_hits += 1
+                return value
+            if time.monotonic() >= deadline:
+                # Holder is gone or slow; fetch without the lock
+                break
+            locked = self.backend.acquire_lock(key, _LOCK_TTL)
+        try:
+            # The previous holder may have stored the value just before releasing
+            value = self.backend.get(key)
+            if value is not None:
+                self.shared_hits += 1
+                return value
+            self.misses += 1
+            result = fetch()
+            if cacheable(result):
+                self.backend.set(key, result, ttl)
+            return result
+        finally:
+            if locked:
+                self.backend.release_lock(key)
+
+    def get_or_fetch(
+        self,
+        key: str,
+        fetch: Callable[[], Any],
+        ttl: float,
+        cacheable: Optional[Callable[[Any], bool]] = None,
+    ):
+        """Cached value of key, calling fetch() once on a miss.
+
+        Only string results accepted by cacheable (any string by default) are
+        cached; exceptions propagate and are not cached either.
+        """
+        if cacheable is None:
+            cacheable = _is_str
+        value = self._lru_get(key)
+        if value is not None:
+            self.hits += 1
+            return value
+
+        with self._lock:
+            future = self._inflight.get(key)
+            is_owner = future is None
+            if is_owner:
+                future = self._inflight[key] = Future()
+        if not is_owner:
+            return future.result()
+
+        try:
+            if self.backend is not None:
+                result = self._fetch_shared(key, fetch, ttl, cacheable)
+            else:
+                self.misses += 1
+                result = fetch()
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            if isinstance(result, str) and cacheable(result):
+                self._lru_put(key, result, ttl)
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+
+    def stats(self) -> Dict[str, int]:
+        """Hit counters of the in-process and shared tiers."""
+        with self._lock:
+            return {
+                "lru_hits": self.hits,
+                "shared_hits": self.shared_hits,
+                "misses": self.misses,
+                "lru_size": len(self._lru),
+            }
+
+
+_caches: Dict[Tuple[str, str], VendorDataCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_vendor_cache(config: Dict[str, Any]) -> Optional[VendorDataCache]:
+    """Return the process-wide vendor cache for a config, None when disabled."""
+    backend_name = (config.get("vendor_cache_backend") or "off").lower()
+    if backend_name == "off":
+        return None
+    if backend_name == "redis":
+        location = config.get("vendor_cache_redis_url") or "redis://localhost:6379/0"
+    elif backend_name == "sqlite":
+        location = config.get("vendor_cache_path") or str(
+            Path(config["cache_dir"]) / "vendor_data.db"
+        )
+    elif backend_name == "memory":
+        location = ""
+    else:
+        raise ValueError(f"Unknown vendor_cache_backend: {backend_name}")
+
+    key = (backend_name, location)
+    with _caches_lock:
+        cache = _caches.get(key)
+        if cache is None:
+            if backend_name == "redis":
+                backend = RedisCacheBackend.from_url(location)
+            elif backend_name == "sqlite":
+                backend = SQLiteCacheBackend(location)
+            else:
+                backend = None
+            cache = _caches[key] = VendorDataCache(
+                backend, lru_size=config.get("vendor_cache_lru_size", 256)
+            )
+        return cache
@@ -0,0 +1,294 @@
+"""Precomputed technical features for a trading universe.
+
+A batch job run after the market close (build_feature_store) brings each
+symbol's daily bars up to date with an incremental download, computes every
+indicator the market analyst can request and writes one compressed columnar
+.npz file per symbol, together with the symbol's IndicatorState so later
+updates only advance it over the new bars. get_stock_stats_indicators_window
+then reads those columns instead of downloading 15 years of bars and running
+stockstats while an analysis waits.
+"""
+
+import argparse
+import json
+import logging
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .indicator_state import SUPPORTED_INDICATORS, IndicatorState
+
+logger = logging.getLogger(__name__)
+
+BAR_COLUMNS = ["open", "high", "low", "close", "volume"]
+
+# Same window as the on-demand stockstats path
+_HISTORY_YEARS = 15
+# Bars re-downloaded before the last stored one; a changed close there means
+# the history was re-adjusted (dividend, split) and is downloaded again
+_OVERLAP_DAYS = 10
+_SYMBOL_UNSAFE = re.compile(r"[^A-Za-z0-9._-]")
+
+
+def _download_bars(symbol: str, start: str, end: str) -> pd.DataFrame:
+    """Daily adjusted bars in [start, end) as a Date/OHLCV frame."""
+    import yfinance as yf
+
+    data = yf.download(
+        symbol,
+        start=start,
+        end=end,
+        multi_level_index=False,
+        progress=False,
+        auto_adjust=True,
+    )
+    if data.empty:
+        return pd.DataFrame(columns=["Date", "Open", "High", "Low", "Close", "Volume"])
+    data = data.reset_index()
+    data["Date"] = pd.to_datetime(data["Date"]).dt.tz_localize(None).dt.normalize()
+    return data[["Date", "Open", "High", "Low", "Close", "Volume"]]
+
+
+def compute_features(bars: pd.DataFrame) -> Dict[str, np.ndarray]:
+    """Columns of the bars plus every supported indicator, one row per bar."""
+    from stockstats import wrap
+
+    df = wrap(bars.copy())
+    columns = {"date": bars["Date"].values.astype("datetime64[D]")}
+    for name in BAR_COLUMNS:
+        columns[name] = np.asarray(df[name], dtype=np.float64)
+    for indicator in SUPPORTED_INDICATORS:
+        columns[indicator] = np.asarray(df[indicator], dtype=np.float64)
+    return columns
+
+
+def _advance(state: IndicatorState, bars: pd.DataFrame) -> list:
+    return [
+        state.update(bar.Open, bar.High, bar.Low, bar.Close, bar.Volume)
+        for bar in bars.itertuples(index=False)
+    ]
+
+
+def _append_features(
+    columns: Dict[str, np.ndarray], bars: pd.DataFrame, state: IndicatorState
+) -> Dict[str, np.ndarray]:
+    """Stored columns extended by bars, advancing state over them."""
+    rows = _advance(state, bars)
+    appended = {
+        "date": np.concatenate([columns["date"], bars["Date"].values.astype("datetime64[D]")])
+    }
+    for name in BAR_COLUMNS:
+        appended[name] = np.concatenate(
+            [columns[name], bars[name.capitalize()].to_numpy(dtype=np.float64)]
+        )
+    for indicator in SUPPORTED_INDICATORS:
+        appended[indicator] = np.concatenate(
+            [columns[indicator], np.array([row[indicator] for row in rows], dtype=np.float64)]
+        )
+    return appended
+
+
+class FeatureStore:
+    """One .npz file of bars and indicator columns per symbol."""
+
+    def __init__(self, root: str, lru_size: int = 64):
+        self.root = Path(root)
+        self.lru_size = lru_size
+        self._lru: "OrderedDict[str, Tuple[int, Dict[str, np.ndarray]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def path(self, symbol: str) -> Path:
+        return self.root / f"{_SYMBOL_UNSAFE.sub('_', symbol.upper())}.npz"
+
+    def load(self, symbol: str) -> Optional[Dict[str, np.ndarray]]:
+        """Stored columns of symbol, or None when it has not been built."""
+        path = self.path(symbol)
+        try:
+            mtime = path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return None
+        with self._lock:
+            entry = self._lru.get(str(path))
+            if entry is not None and entry[0] == mtime:
+                self._lru.move_to_end(str(path))
+                return entry[1]
+        with np.load(path, allow_pickle=False) as npz:
+            columns = {name: npz[name] for name in npz.files}
+        with self._lock:
+            self._lru[str(path)] = (mtime, columns)
+            self._lru.move_to_end(str(path))
+            while len(self._lru) > self.lru_size:
+                self._lru.popitem(last=False)
+        return columns
+
+    def save(self, symbol: str, columns: Dict[str, np.ndarray], state: IndicatorState):
+        """Write the columns and state with the current time as their update time."""
+        path = self.path(symbol)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".npz.tmp")
+        columns = {k: v for k, v in columns.items() if k not in ("updated_at", "indicator_state")}
+        with open(tmp, "wb") as f:
+            np.savez_compressed(
+                f,
+                updated_at=np.float64(time.time()),
+                indicator_state=np.array(json.dumps(state.to_dict())),
+                **columns,
+            )
+        os.replace(tmp, path)
+
+    def load_state(self, symbol: str) -> Optional[IndicatorState]:
+        """Indicator state after the last stored bar of symbol."""
+        columns = self.load(symbol)
+        if columns is None or "indicator_state" not in columns:
+            return None
+        return IndicatorState.from_dict(json.loads(str(columns["indicator_state"])))
+
+    def update(self, symbol: str, today: Optional[pd.Timestamp] = None) -> int:
+        """Bring symbol up to date; returns its bar count.
+
+        Bars after the last stored one advance the stored indicator state.
+        The features are recomputed from a full download only for a new
+        symbol or when the stored history was re-adjusted.
+        """
+        today = (today or pd.Timestamp.today()).normalize()
+        start = today - pd.DateOffset(years=_HISTORY_YEARS)
+        end_str = (today + pd.Timedelta(days=1)).strftime("%Y-%m-%d")
+
+        stored = self.load(symbol)
+        state = self.load_state(symbol)
+        if state is not None and len(stored["date"]):
+            last = pd.Timestamp(stored["date"][-1])
+            since = last - pd.Timedelta(days=_OVERLAP_DAYS)
+            new = _download_bars(symbol, since.strftime("%Y-%m-%d"), end_str)
+            old = pd.DataFrame({"Date": pd.to_datetime(stored["date"]), "Close_old": stored["close"]})
+            overlap = old.merge(new, on="Date")
+            if new.empty or (
+                len(overlap)
+                and np.allclose(overlap["Close_old"], overlap["Close"], rtol=1e-6, equal_nan=True)
+            ):
+                columns = _append_features(stored, new[new["Date"] > last], state)
+                keep = columns["date"] >= np.datetime64(start.date())
+                columns = {name: values[keep] for name, values in columns.items()}
+                self.save(symbol, columns, state)
+                return len(columns["date"])
+            logger.info("Re-downloading %s: stored history was re-adjusted", symbol)
+
+        bars = _download_bars(symbol, start.strftime("%Y-%m-%d"), end_str)
+        bars = bars[bars["Date"] >= start].reset_index(drop=True)
+        if bars.empty:
+            raise ValueError(f"No price data for {symbol}")
+        state = IndicatorState()
+        _advance(state, bars)
+        self.save(symbol, compute_features(bars), state)
+        return len(bars)
+
+    def intraday(
+        self, symbol: str, open_: float, high: float, low: float, close: float, volume: float
+    ) -> Optional[Dict[str, float]]:
+        """Indicator values with today's unfinished bar appended; nothing is stored."""
+        state = self.load_state(symbol)
+        if state is None:
+            return None
+        return state.preview(open_, high, low, close, volume)
+
+    def indicator_values(
+        self, symbol: str, indicator: str, curr_date: str, max_age_days: float
+    ) -> Optional[Dict[str, str]]:
+        """Date -> value of a stored indicator, as _get_stock_stats_bulk returns.
+
+        None when the symbol or indicator is not stored, or when the store
+        neither reaches curr_date nor was updated within max_age_days (so a
+        later session may be missing).
+        """
+        columns = self.load(symbol)
+        if columns is None or indicator not in columns or not len(columns["date"]):
+            return None
+        dates = columns["date"]
+        if dates[-1] < np.datetime64(curr_date, "D"):
+            age_days = (time.time() - float(columns["updated_at"])) / 86400
+            if age_days > max_age_days:
+                return None
+        result = {}
+        for date_str, value in zip(np.datetime_as_string(dates, unit="D"), columns[indicator]):
+            result[str(date_str)] = "N/A" if np.isnan(value) else str(float(value))
+        return result
+
+
+_stores: Dict[str, FeatureStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_feature_store(config: Dict[str, Any]) -> Optional[FeatureStore]:
+    """Return the process-wide feature store for a config, None when disabled."""
+    if not config.get("feature_store_enabled"):
+        return None
+    root = config.get("feature_store_dir") or str(Path(config["cache_dir"]) / "features")
+    with _stores_lock:
+        store = _stores.get(root)
+        if store is None:
+            store = _stores[root] = FeatureStore(root)
+        return store
+
+
+def build_feature_store(
+    symbols: Iterable[str], config: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """Update the features of every symbol; failures are reported, not raised.
+
+    Symbols are processed one at a time since yf.download is not safe to call
+    from several threads.
+    """
+    if config is None:
+        from .config import get_config
+
+        config = get_config()
+    store = get_feature_store({**config, "feature_store_enabled": True})
+
+    updated: List[str] = []
+    failed: Dict[str, str] = {}
+    started = time.monotonic()
+    for symbol in dict.fromkeys(s.strip().upper() for s in symbols if s.strip()):
+        try:
+            store.update(symbol)
+            updated.append(symbol)
+        except Exception as e:
+            logger.warning("Feature update failed for %s: %s", symbol, e)
+            failed[symbol] = str(e)
+    return {
+        "updated": updated,
+        "failed": failed,
+        "seconds": round(time.monotonic() - started, 1),
+    }
+
+
+def main():
+    """Update features: python -m tradingagents.dataflows.feature_store AAPL 005930.KS ..."""
+    parser = argparse.ArgumentParser(description="Update the technical feature store")
+    parser.add_argument("symbols", nargs="+", help="yfinance symbols")
+    parser.add_argument("--dir", default=None, help="Feature store directory")
+    args = parser.parse_args()
+
+    from .config import get_config
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    config = get_config()
+    if args.dir:
+        config["feature_store_dir"] = args.dir
+    summary = build_feature_store(args.symbols, config)
+    logger.info(
+        "Updated %d symbols in %.1fs, %d failed",
+        len(summary["updated"]),
+        summary["seconds"],
+        len(summary["failed"]),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,221 @@
+"""Incremental state of the supported technical indicators.
+
+IndicatorState keeps what each indicator needs to produce its next value:
+the accumulators of the exponential and Wilder averages (EMA, MACD, RSI,
+ATR) and the last N inputs of the windowed ones (SMA, Bollinger, VWMA, MFI).
+Advancing it by one bar costs the same however long the history is, so a
+daily update or an intraday bar does not recompute 15 years of data.
+
+Values follow the stockstats definitions used by get_stock_stats_indicators_window
+(adjusted EWM with min_periods=1, partial windows at the start of the
+history) and agree with them to floating-point rounding.
+"""
+
+import copy
+import math
+from collections import deque
+from typing import Any, Dict
+
+SUPPORTED_INDICATORS = (
+    "close_50_sma",
+    "close_200_sma",
+    "close_10_ema",
+    "macd",
+    "macds",
+    "macdh",
+    "rsi",
+    "boll",
+    "boll_ub",
+    "boll_lb",
+    "atr",
+    "vwma",
+    "mfi",
+)
+
+_BOLL_STD_TIMES = 2
+
+
+class _Ewm:
+    """Adjusted exponentially weighted mean, as pandas ewm(adjust=True)."""
+
+    def __init__(self, alpha: float):
+        self.alpha = alpha
+        self.weighted = math.nan
+        self.old_wt = 1.0
+
+    def update(self, value: float) -> float:
+        if self.weighted != self.weighted:
+            self.weighted = value
+            self.old_wt = 1.0
+        else:
+            self.old_wt *= 1.0 - self.alpha
+            if self.weighted != value:
+                self.weighted = (self.old_wt * self.weighted + value) / (self.old_wt + 1.0)
+            self.old_wt += 1.0
+        return self.weighted
+
+    def to_dict(self) -> Dict[str, float]:
+        return {"alpha": self.alpha, "weighted": self.weighted, "old_wt": self.old_wt}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, float]) -> "_Ewm":
+        ewm = cls(data["alpha"])
+        ewm.weighted = data["weighted"]
+        ewm.old_wt = data["old_wt"]
+        return ewm
+
+
+def _ema(span: int) -> _Ewm:
+    return _Ewm(2.0 / (span + 1.0))
+
+
+def _smma(window: int) -> _Ewm:
+    return _Ewm(1.0 / window)
+
+
+class _Window:
+    """Last `size` values of a series; statistics over partial windows too."""
+
+    def __init__(self, size: int):
+        self.values: deque = deque(maxlen=size)
+
+    def push(self, value: float):
+        self.values.append(value)
+
+    def sum(self) -> float:
+        return math.fsum(self.values)
+
+    def mean(self) -> float:
+        return self.sum() / len(self.values)
+
+    def std(self) -> float:
+        n = len(self.values)
+        if n < 2:
+            return math.nan
+        mean = self.mean()
+        return math.sqrt(math.fsum((v - mean) ** 2 for v in self.values) / (n - 1))
+
+    def to_list(self) -> list:
+        return list(self.values)
+
+    @classmethod
+    def from_list(cls, size: int, values: list) -> "_Window":
+        window = cls(size)
+        window.values.extend(values)
+        return window
+
+
+class IndicatorState:
+    """Rolling state of every supported indicator for one symbol."""
+
+    def __init__(self):
+        self.bars = 0
+        self.prev_close = math.nan
+        self.prev_tp = math.nan
+        self.sma_50 = _Window(50)
+        self.sma_200 = _Window(200)
+        self.boll = _Window(20)
+        self.ema_10 = _ema(10)
+        self.macd_short = _ema(12)
+        self.macd_long = _ema(26)
+        self.macd_signal = _ema(9)
+        self.rsi_up = _smma(14)
+        self.rsi_down = _smma(14)
+        self.atr = _smma(14)
+        self.vwma_tpv = _Window(14)
+        self.vwma_vol = _Window(14)
+        self.mfi_pos = _Window(14)
+        self.mfi_neg = _Window(14)
+
+    def update(
+        self, open_: float, high: float, low: float, close: float, volume: float
+    ) -> Dict[str, float]:
+        """Advance the state by one closed bar and return its indicator values."""
+        first = self.bars == 0
+        prev_close = close if first else self.prev_close
+        tp = (close + high + low) / 3.0
+        values: Dict[str, float] = {}
+
+        self.sma_50.push(close)
+        self.sma_200.push(close)
+        values["close_50_sma"] = self.sma_50.mean()
+        values["close_200_sma"] = self.sma_200.mean()
+        values["close_10_ema"] = self.ema_10.update(close)
+
+        macd = self.macd_short.update(close) - self.macd_long.update(close)
+        macds = self.macd_signal.update(macd)
+        values["macd"] = macd
+        values["macds"] = macds
+        values["macdh"] = macd - macds
+
+        diff = close - prev_close
+        up = self.rsi_up.update(diff if diff > 0 else 0.0)
+        down = self.rsi_down.update(-diff if diff < 0 else 0.0)
+        total = up + down
+        values["rsi"] = 50.0 if first or total == 0 else 100 * (up / total)
+
+        self.boll.push(close)
+        mid = self.boll.mean()
+        width = _BOLL_STD_TIMES * self.boll.std()
+        values["boll"] = mid
+        values["boll_ub"] = mid + width
+        values["boll_lb"] = mid - width
+
+        tr = max(high - low, abs(high - prev_close), abs(low - prev_close))
+        values["atr"] = self.atr.update(0.0 if math.isnan(tr) else tr)
+
+        self.vwma_tpv.push(tp * volume)
+        self.vwma_vol.push(volume)
+        vol_sum = self.vwma_vol.sum()
+        values["vwma"] = self.vwma_tpv.sum() / vol_sum if vol_sum != 0 else 0.0
+
+        tp_diff = 0.0 if first else tp - self.prev_tp
+        flow = tp * volume
+        self.mfi_pos.push(flow if tp_diff > 0 else 0.0)
+        self.mfi_neg.push(flow if tp_diff < 0 else 0.0)
+        pos_sum = self.mfi_pos.sum()
+        total_flow = pos_sum + self.mfi_neg.sum()
+        if self.bars < self.mfi_pos.values.maxlen or total_flow <= 0:
+            values["mfi"] = 0.5
+        else:
+            values["mfi"] = pos_sum / total_flow
+
+        self.bars += 1
+        self.prev_close = close
+        self.prev_tp = tp
+        return values
+
+    def preview(
+        self, open_: float, high: float, low: float, close: float, volume: float
+    ) -> Dict[str, float]:
+        """Indicator values if an unfinished bar closed now; the state is unchanged."""
+        return copy.deepcopy(self).update(open_, high, low, close, volume)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-serializable form of the state."""
+        return {
+            "bars": self.bars,
+            "prev_close": self.prev_close,
+            "prev_tp": self.prev_tp,
+            "windows": {
+                name: getattr(self, name).to_list()
+                for name in ("sma_50", "sma_200", "boll", "vwma_tpv", "vwma_vol", "mfi_pos", "mfi_neg")
+            },
+            "ewms": {
+                name: getattr(self, name).to_dict()
+                for name in ("ema_10", "macd_short", "macd_long", "macd_signal", "rsi_up", "rsi_down", "atr")
+            },
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "IndicatorState":
+        state = cls()
+        state.bars = data["bars"]
+        state.prev_close = data["prev_close"]
+        state.prev_tp = data["prev_tp"]
+        for name, values in data["windows"].items():
+            size = getattr(state, name).values.maxlen
+            setattr(state, name, _Window.from_list(size, values))
+        for name, ewm in data["ewms"].items():
+            setattr(state, name, _Ewm.from_dict(ewm))
+        return state
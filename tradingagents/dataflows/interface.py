@@ -1,4 +1,9 @@
-from typing import Annotated
+import re
+import threading
+from concurrent.futures import Future
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Annotated, Dict, Optional
 
 # Import from vendor-specific modules
 from .y_finance import (
@@ -26,6 +31,7 @@ from .alpha_vantage_common import AlphaVantageRateLimitError
 
 # Configuration and routing logic
 from .config import get_config
+from .data_cache import VendorDataCache, get_vendor_cache
 
 # Tools organized by category
 TOOLS_CATEGORIES = {
@@ -131,7 +137,105 @@ def get_vendor(category: str, method: str = None) -> str:
     # Fall back to category-level configuration
     return config.get("data_vendors", {}).get(category, "default")
 
+# Memo of vendor calls made during one propagate() run: call key -> Future.
+# LangGraph copies the context into its worker threads, so every node and
+# tool call of the run sees the same dict.
+_run_memo: ContextVar[Optional[Dict[tuple, Future]]] = ContextVar("vendor_run_memo", default=None)
+_run_memo_lock = threading.Lock()
+
+
+@contextmanager
+def vendor_call_scope():
+    """Memoize identical vendor calls made within the block.
+
+    Used around a propagate() run: the social and news analysts both fetch
+    get_news for the same ticker and dates, and the report store fingerprints
+    the same inputs the analysts then request. Concurrent identical calls are
+    single-flighted; failed calls are not memoized.
+    """
+    token = _run_memo.set({})
+    try:
+        yield
+    finally:
+        _run_memo.reset(token)
+
+
 def route_to_vendor(method: str, *args, **kwargs):
+    """Route method calls to appropriate vendor implementation with fallback support."""
+    memo = _run_memo.get()
+    if memo is None:
+        return _cached_route_to_vendor(method, *args, **kwargs)
+
+    key = (method, args, tuple(sorted(kwargs.items())))
+    try:
+        hash(key)
+    except TypeError:
+        return _cached_route_to_vendor(method, *args, **kwargs)
+
+    with _run_memo_lock:
+        future = memo.get(key)
+        is_owner = future is None
+        if is_owner:
+            future = memo[key] = Future()
+
+    if not is_owner:
+        return future.result()
+
+    try:
+        result = _cached_route_to_vendor(method, *args, **kwargs)
+    except BaseException as exc:
+        with _run_memo_lock:
+            memo.pop(key, None)
+        future.set_exception(exc)
+        raise
+    future.set_result(result)
+    return result
+
+
+def _cached_route_to_vendor(method: str, *args, **kwargs):
+    """Serve a vendor call from the recording or the shared data cache.
+
+    With an LLM response cache configured, the result a run used is recorded
+    (read-write), or served from the recording without any network access
+    (replay-only) so that replayed prompts match the recorded ones.
+    """
+    from tradingagents.llm_clients.response_cache import get_config_response_cache
+
+    config = get_config()
+    category = get_category_for_method(method)
+    vendors = (
+        config.get("data_vendors", {}).get(category),
+        config.get("tool_vendors", {}).get(method),
+    )
+    key = VendorDataCache.make_key(method, args, kwargs, vendors)
+
+    recording = get_config_response_cache(config)
+    if recording is not None and recording.mode == "replay-only":
+        return recording.lookup_vendor_result(key, method)
+
+    cache = get_vendor_cache(config)
+    ttl = (config.get("vendor_cache_ttl") or {}).get(category)
+    if cache is None or not ttl:
+        result = _route_to_vendor(method, *args, **kwargs)
+    else:
+        result = cache.get_or_fetch(
+            key, lambda: _route_to_vendor(method, *args, **kwargs), ttl, is_cacheable_result
+        )
+    if recording is not None:
+        recording.record_vendor_result(key, method, result)
+    return result
+
+
+# Vendors report many failures as returned text rather than exceptions
+_FAILED_RESULT = re.compile(r"^\s*(?:Error\b|No\s.*\bfound\b)", re.IGNORECASE)
+
+
+def is_cacheable_result(result) -> bool:
+    """Whether a vendor result is real data worth sharing through the cache."""
+    return isinstance(result, str) and bool(result.strip()) and not _FAILED_RESULT.match(result)
+
+
+def _route_to_vendor(method: str, *args, **kwargs):
     """Route method calls to appropriate vendor implementation with fallback support."""
     category = get_category_for_method(method)
     vendor_config = get_vendor(category, method)
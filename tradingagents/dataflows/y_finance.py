@@ -139,7 +139,10 @@ def get_stock_stats_indicators_window(
 
     # Optimized: Get stock data once and calculate indicators for all dates
     try:
-        indicator_data = _get_stock_stats_bulk(symbol, indicator, curr_date)
+        # Features precomputed by the nightly job, when fresh enough
+        indicator_data = _get_precomputed_indicator(symbol, indicator, curr_date)
+        if indicator_data is None:
+            indicator_data = _get_stock_stats_bulk(symbol, indicator, curr_date)
         
         # Generate the date range we need
         current_dt = curr_date_dt
@@ -184,6 +187,26 @@ def get_stock_stats_indicators_window(
     return result_str
 
 
+def _get_precomputed_indicator(symbol: str, indicator: str, curr_date: str):
+    """Indicator values from the feature store, or None to compute them."""
+    from .config import get_config
+    from .feature_store import get_feature_store
+
+    config = get_config()
+    if config["data_vendors"]["technical_indicators"] == "local":
+        return None
+    store = get_feature_store(config)
+    if store is None:
+        return None
+    try:
+        return store.indicator_values(
+            symbol, indicator, curr_date, config.get("feature_store_max_age_days", 4)
+        )
+    except Exception as e:
+        print(f"Error reading feature store for {symbol}: {e}")
+        return None
+
+
 def _get_stock_stats_bulk(
     symbol: Annotated[str, "ticker symbol of the company"],
     indicator: Annotated[str, "technical indicator to calculate"],
@@ -3,6 +3,11 @@ import os
 DEFAULT_CONFIG = {
     "project_dir": os.path.abspath(os.path.join(os.path.dirname(__file__), ".")),
     "results_dir": os.getenv("TRADINGAGENTS_RESULTS_DIR", "./results"),
+    "cache_dir": os.getenv("TRADINGAGENTS_CACHE_DIR", "./data/cache"),
+    # Append-only compressed log of run states (gzip JSONL segments + index)
+    "run_log_dir": os.getenv("TRADINGAGENTS_RUN_LOG_DIR", "./eval_results/run_logs"),
+    # Final states kept in memory per graph; older ones are read from the run log
+    "state_retention": 1,
     "data_cache_dir": os.path.join(
         os.path.abspath(os.path.join(os.path.dirname(__file__), ".")),
         "dataflows/data_cache",
@@ -15,10 +20,69 @@ DEFAULT_CONFIG = {
     # Provider-specific thinking configuration
     "google_thinking_level": "high",      # "high", "minimal", etc.
     "openai_reasoning_effort": None,    # "medium", "high", "low"
+    # Provider prompt-prefix caching (Anthropic cache_control, OpenAI
+    # prompt_cache_key; Gemini caches shared prefixes implicitly)
+    "prompt_caching": True,
+    # Persistent LLM response cache: "off", "read-write" (record + reuse),
+    # "replay-only" (never call the provider or the data vendors; raise on
+    # unrecorded calls). Vendor data results are recorded alongside.
+    "llm_cache_mode": os.getenv("TRADINGAGENTS_LLM_CACHE_MODE", "off"),
+    "llm_cache_path": None,  # Defaults to <cache_dir>/llm_responses.db
+    # HTTP connection pool shared per provider endpoint across graphs
+    # (None to let each client manage its own connections)
+    "llm_http_pool": {
+        "max_connections": 100,
+        "max_keepalive_connections": 20,
+        "keepalive_expiry": 30.0,  # seconds
+    },
+    # Shared per-minute limits per "provider:model" across every graph in the
+    # process; calls over budget queue with deep-think ahead of quick-think
+    "llm_rate_limits": {},  # e.g. {"google:gemini-3-pro-preview": {"rpm": 25, "tpm": 2_000_000}}
+    # Hedged requests: a call still running after the given latency
+    # percentile gets a duplicate request; timeouts, 429s and 5xx fail over
+    # to the fallback model when one is configured
+    "llm_hedging": False,
+    "llm_hedge_percentile": 95,
+    "llm_hedge_min_samples": 20,  # Latency samples needed before hedging
+    "llm_request_timeout": None,  # Seconds before failing over (None waits)
+    "llm_fallback_provider": None,  # Defaults to llm_provider
+    "llm_fallback_deep_llm": None,
+    "llm_fallback_quick_llm": None,
     # Debate and discussion settings
     "max_debate_rounds": 1,
     "max_risk_discuss_rounds": 1,
     "max_recur_limit": 100,
+    # Tool calls requested in one message run concurrently, up to this bound
+    "max_tool_concurrency": 4,
+    # Maximum number of reflection LLM calls run concurrently
+    "max_reflection_workers": 5,
+    # Reflection memories survive restarts when persisted
+    "memory_persist": True,
+    "memory_db_path": None,  # Defaults to <cache_dir>/memories.db
+    # Per-memory capacity; beyond it entries are evicted by the policy
+    "memory_max_entries": 1000,  # 0 or None for unlimited
+    "memory_eviction_policy": "age",  # Options: age, outcome, redundancy
+    # Older memories score lower: weight halves every N days (None disables)
+    "memory_decay_half_life_days": 180,
+    # Situations are stored as a digest of their most distinctive terms
+    "memory_digest_terms": 200,
+    "memory_digest_chars": 1500,  # Length of the stored situation excerpt
+    # Retrieval scores only the query's most distinctive terms (None for all)
+    "memory_query_terms": 64,
+    # Analyst tool loops resend earlier tool results on every round; only the
+    # results of this many recent rounds are sent verbatim (None keeps all)
+    "analyst_tool_window": 2,
+    # Approximate token budget for the debate history pasted into each
+    # researcher/debater prompt; older turns are compacted beyond this
+    "debate_history_token_budget": 6000,
+    # Run-level result cache (same ticker/date/config returns the stored result)
+    "result_cache_enabled": True,
+    "result_cache_ttl": 6 * 60 * 60,  # seconds
+    # Analyst report reuse (opt-in): analysts listed here whose tool inputs are
+    # unchanged since a recent run reuse that report instead of re-running
+    # their LLM/tool loop
+    "analyst_report_reuse": [],  # Options: market, social, news, fundamentals
+    "analyst_report_staleness_days": 3,
     # Data vendor configuration
     # Category-level configuration (default for all tools in category)
     "data_vendors": {
@@ -31,4 +95,24 @@ DEFAULT_CONFIG = {
     "tool_vendors": {
         # Example: "get_stock_data": "alpha_vantage",  # Override category default
     },
+    # Vendor data cache shared between processes: an in-process LRU in front
+    # of "sqlite" (host-wide, <cache_dir>/vendor_data.db) or "redis"
+    # (cross-host); "memory" keeps only the LRU, "off" disables caching
+    "vendor_cache_backend": os.getenv("TRADINGAGENTS_VENDOR_CACHE", "sqlite"),
+    "vendor_cache_path": None,
+    "vendor_cache_redis_url": os.getenv("TRADINGAGENTS_VENDOR_CACHE_REDIS_URL"),
+    "vendor_cache_lru_size": 256,
+    # Seconds a cached result stays valid, per data category (0 disables)
+    "vendor_cache_ttl": {
+        "core_stock_apis": 60 * 60,
+        "technical_indicators": 60 * 60,
+        "fundamental_data": 12 * 60 * 60,
+        "news_data": 30 * 60,
+    },
+    # Indicator columns precomputed after the close by build_feature_store();
+    # used instead of computing them on demand while they are newer than
+    # feature_store_max_age_days or cover the requested date
+    "feature_store_enabled": True,
+    "feature_store_dir": None,  # Defaults to <cache_dir>/features
+    "feature_store_max_age_days": 4,
 }
@@ -0,0 +1,414 @@
+# TradingAgents/graph/job_queue.py
+
+import argparse
+import hashlib
+import json
+import logging
+import os
+import socket
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from .process_pool import compact_state
+from .result_cache import RESULT_CONFIG_KEYS
+
+logger = logging.getLogger(__name__)
+
+
+def _text(value) -> Optional[str]:
+    """Redis replies are bytes unless the client decodes responses."""
+    if isinstance(value, bytes):
+        return value.decode("utf-8")
+    return value
+
+
+@dataclass
+class AnalysisJob:
+    """A claimed analysis job."""
+
+    id: str
+    ticker: str
+    trade_date: str
+    config: Dict[str, Any]
+    selected_analysts: List[str]
+    use_cache: bool
+    attempts: int
+
+
+class AnalysisJobQueue:
+    """Reliable analysis job queue on Redis.
+
+    Producers enqueue (ticker, trade_date, config) jobs and wait for their
+    result; workers on any machine claim jobs, run them and publish the
+    result. Keys, under the namespace:
+
+    * ``jobs:pending`` list of job ids waiting to run (FIFO)
+    * ``jobs:processing`` list of claimed job ids; claiming moves an id here
+      atomically (BLMOVE), so a worker crash never loses a job
+    * ``job:<id>`` hash with the payload, attempt count and lease deadline
+    * ``result:<id>`` JSON result, expiring after result_ttl
+    * ``done:<id>`` list pushed once the result exists, for blocking waits
+
+    A claimed job whose lease (visibility timeout) expires without an ack is
+    put back in the queue by requeue_expired(), which workers call
+    periodically; running workers extend their lease with a heartbeat. Jobs
+    failing max_attempts times are published as failed.
+
+    Only plain Redis commands are used, so the queue runs against a Redis
+    server or an in-memory fake such as fakeredis.FakeRedis.
+    """
+
+    def __init__(
+        self,
+        redis_client,
+        namespace: str = "tradingagents",
+        visibility_timeout: float = 600,
+        result_ttl: int = 24 * 60 * 60,
+        max_attempts: int = 3,
+    ):
+        """Initialize the queue.
+
+        Args:
+            redis_client: redis.Redis (or compatible) client
+            namespace: Prefix of every key
+            visibility_timeout: Seconds a claimed job may go without a
+                heartbeat before it is handed to another worker
+            result_ttl: Seconds results (and job records) are kept
+            max_attempts: Runs of a job before it is published as failed
+        """
+        self.redis = redis_client
+        self.namespace = namespace
+        self.visibility_timeout = visibility_timeout
+        self.result_ttl = result_ttl
+        self.max_attempts = max_attempts
+        self.pending_key = f"{namespace}:jobs:pending"
+        self.processing_key = f"{namespace}:jobs:processing"
+
+    @classmethod
+    def from_url(cls, url: str, **kwargs) -> "AnalysisJobQueue":
+        """Queue on the Redis server at url (e.g. redis://localhost:6379/0)."""
+        import redis
+
+        return cls(redis.Redis.from_url(url), **kwargs)
+
+    def _job_key(self, job_id: str) -> str:
+        return f"{self.namespace}:job:{job_id}"
+
+    def _result_key(self, job_id: str) -> str:
+        return f"{self.namespace}:result:{job_id}"
+
+    def _done_key(self, job_id: str) -> str:
+        return f"{self.namespace}:done:{job_id}"
+
+    # ── Producer side ────────────────────────────────────────
+
+    def enqueue(
+        self,
+        ticker: str,
+        trade_date: str,
+        config: Optional[Dict[str, Any]] = None,
+        selected_analysts: Optional[List[str]] = None,
+        use_cache: bool = True,
+    ) -> str:
+        """Queue an analysis and return its job id."""
+        job_id = uuid.uuid4().hex
+        payload = {
+            "ticker": ticker,
+            "trade_date": str(trade_date),
+            "config": config or {},
+            "selected_analysts": selected_analysts
+            or ["market", "social", "news", "fundamentals"],
+            "use_cache": use_cache,
+        }
+        pipe = self.redis.pipeline()
+        pipe.hset(
+            self._job_key(job_id),
+            mapping={
+                "payload": json.dumps(payload, ensure_ascii=False, default=str),
+                "attempts": 0,
+                "status": "pending",
+                "created_at": time.time(),
+            },
+        )
+        pipe.lpush(self.pending_key, job_id)
+        pipe.execute()
+        return job_id
+
+    def status(self, job_id: str) -> Optional[str]:
+        """pending, running, done or failed; None for unknown or expired jobs."""
+        return _text(self.redis.hget(self._job_key(job_id), "status"))
+
+    def get_result(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Result of a finished job: {"status", "final_state", "decision"} or
+        {"status": "failed", "error"}; None while the job is unfinished."""
+        raw = self.redis.get(self._result_key(job_id))
+        return json.loads(raw) if raw is not None else None
+
+    def wait(self, job_id: str, timeout: Optional[float] = None, poll: float = 5) -> Optional[Dict[str, Any]]:
+        """Block until a job finishes and return its result (None on timeout)."""
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        while True:
+            result = self.get_result(job_id)
+            if result is not None:
+                return result
+            wait_for = poll
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return None
+                wait_for = min(poll, remaining)
+            # BLPOP takes whole seconds; the result is re-read either way
+            self.redis.blpop([self._done_key(job_id)], timeout=max(1, int(wait_for)))
+
+    # ── Worker side ──────────────────────────────────────────
+
+    def claim(self, timeout: float = 5) -> Optional[AnalysisJob]:
+        """Take the next pending job, waiting up to timeout seconds."""
+        job_id = _text(
+            self.redis.blmove(
+                self.pending_key, self.processing_key, max(1, int(timeout)), "RIGHT", "LEFT"
+            )
+        )
+        if job_id is None:
+            return None
+        key = self._job_key(job_id)
+        pipe = self.redis.pipeline()
+        pipe.hincrby(key, "attempts", 1)
+        pipe.hset(
+            key,
+            mapping={"status": "running", "lease_until": time.time() + self.visibility_timeout},
+        )
+        pipe.hget(key, "payload")
+        attempts, _, payload = pipe.execute()
+        if payload is None:
+            # Record expired while queued; nothing left to run. The writes
+            # above recreated the hash without a TTL, so remove it again
+            pipe = self.redis.pipeline()
+            pipe.delete(key)
+            pipe.lrem(self.processing_key, 1, job_id)
+            pipe.execute()
+            return None
+        payload = json.loads(payload)
+        return AnalysisJob(
+            id=job_id,
+            ticker=payload["ticker"],
+            trade_date=payload["trade_date"],
+            config=payload["config"],
+            selected_analysts=payload["selected_analysts"],
+            use_cache=payload["use_cache"],
+            attempts=int(attempts),
+        )
+
+    def heartbeat(self, job: AnalysisJob):
+        """Extend the lease of a running job."""
+        self.redis.hset(
+            self._job_key(job.id), "lease_until", time.time() + self.visibility_timeout
+        )
+
+    def _publish(self, job_id: str, result: Dict[str, Any]):
+        # The first result wins if a reclaimed job also finishes late
+        stored = self.redis.set(
+            self._result_key(job_id),
+            json.dumps(result, ensure_ascii=False, default=str),
+            ex=self.result_ttl,
+            nx=True,
+        )
+        pipe = self.redis.pipeline()
+        pipe.lrem(self.processing_key, 0, job_id)
+        pipe.lrem(self.pending_key, 0, job_id)
+        pipe.hset(self._job_key(job_id), "status", result["status"])
+        pipe.expire(self._job_key(job_id), self.result_ttl)
+        if stored:
+            pipe.rpush(self._done_key(job_id), 1)
+            pipe.expire(self._done_key(job_id), self.result_ttl)
+        pipe.execute()
+
+    def ack(self, job: AnalysisJob, final_state: Dict[str, Any], decision: str):
+        """Publish the result of a finished job."""
+        self._publish(
+            job.id,
+            {
+                "status": "done",
+                "final_state": json.loads(compact_state(final_state)),
+                "decision": decision,
+            },
+        )
+
+    def fail(self, job: AnalysisJob, error: str):
+        """Retry a failed job, or publish the failure after max_attempts."""
+        if job.attempts >= self.max_attempts:
+            self._publish(job.id, {"status": "failed", "error": error})
+            return
+        pipe = self.redis.pipeline()
+        pipe.lrem(self.processing_key, 0, job.id)
+        pipe.hset(self._job_key(job.id), mapping={"status": "pending", "error": error})
+        pipe.lpush(self.pending_key, job.id)
+        pipe.execute()
+
+    def requeue_expired(self) -> int:
+        """Return claimed jobs whose lease expired to the queue.
+
+        Safe to call from several workers at once: a job is only requeued by
+        the caller whose LREM removed it from the processing list.
+        """
+        now = time.time()
+        requeued = 0
+        for raw_id in self.redis.lrange(self.processing_key, 0, -1):
+            job_id = _text(raw_id)
+            key = self._job_key(job_id)
+            lease_until = _text(self.redis.hget(key, "lease_until"))
+            if lease_until is None:
+                if self.redis.exists(key):
+                    # Claimed but the lease was not written yet; start one
+                    self.redis.hsetnx(key, "lease_until", now + self.visibility_timeout)
+                    continue
+            elif float(lease_until) > now:
+                continue
+            if not self.redis.lrem(self.processing_key, 1, job_id):
+                continue
+            attempts = int(_text(self.redis.hget(key, "attempts")) or 0)
+            if not self.redis.exists(key):
+                continue
+            if attempts >= self.max_attempts:
+                self._publish(job_id, {"status": "failed", "error": "visibility timeout exceeded"})
+            else:
+                self.redis.hset(key, "status", "pending")
+                self.redis.lpush(self.pending_key, job_id)
+                requeued += 1
+        return requeued
+
+    def stats(self) -> Dict[str, int]:
+        """Number of pending and running jobs."""
+        return {
+            "pending": self.redis.llen(self.pending_key),
+            "running": self.redis.llen(self.processing_key),
+        }
+
+
+class AnalysisWorker:
+    """Consumes analysis jobs from an AnalysisJobQueue.
+
+    Graphs are built once per (analysts, config) and reused across jobs. The
+    worker takes only the result-affecting settings (RESULT_CONFIG_KEYS) from
+    a job's config; storage and other operational settings are its own, since
+    the producer may run elsewhere.
+    """
+
+    def __init__(
+        self,
+        queue: AnalysisJobQueue,
+        base_config: Optional[Dict[str, Any]] = None,
+        max_graphs: int = 4,
+    ):
+        """Initialize the worker.
+
+        Args:
+            queue: Job queue to consume
+            base_config: Worker-local settings; DEFAULT_CONFIG when None
+            max_graphs: Warm graphs kept for different job configs
+        """
+        from tradingagents.default_config import DEFAULT_CONFIG
+
+        self.queue = queue
+        self.base_config = dict(base_config or DEFAULT_CONFIG)
+        self.max_graphs = max_graphs
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}"
+        self._graphs: "OrderedDict[str, Any]" = OrderedDict()
+        self._stop = threading.Event()
+
+    def _graph_for(self, job: AnalysisJob):
+        from .trading_graph import TradingAgentsGraph
+
+        config = {
+            **self.base_config,
+            **{k: v for k, v in job.config.items() if k in RESULT_CONFIG_KEYS},
+        }
+        graph_key = hashlib.sha256(
+            json.dumps([job.selected_analysts, config], sort_keys=True, default=str).encode("utf-8")
+        ).hexdigest()
+        graph = self._graphs.get(graph_key)
+        if graph is None:
+            graph = TradingAgentsGraph(
+                selected_analysts=job.selected_analysts, debug=False, config=config
+            )
+            self._graphs[graph_key] = graph
+            while len(self._graphs) > self.max_graphs:
+                self._graphs.popitem(last=False)
+        else:
+            self._graphs.move_to_end(graph_key)
+        return graph
+
+    def run_job(self, job: AnalysisJob):
+        """Run one claimed job, keeping its lease alive while it runs."""
+        done = threading.Event()
+
+        def _heartbeat():
+            while not done.wait(self.queue.visibility_timeout / 3):
+                try:
+                    self.queue.heartbeat(job)
+                except Exception as e:
+                    logger.warning("Heartbeat failed for job %s: %s", job.id, e)
+
+        heartbeat = threading.Thread(target=_heartbeat, daemon=True)
+        heartbeat.start()
+        try:
+            graph = self._graph_for(job)
+            final_state, decision = graph.propagate(job.ticker, job.trade_date, job.use_cache)
+        except Exception as e:
+            logger.exception("Job %s (%s %s) failed", job.id, job.ticker, job.trade_date)
+            self.queue.fail(job, f"{type(e).__name__}: {e}")
+        else:
+            self.queue.ack(job, final_state, decision)
+        finally:
+            done.set()
+            heartbeat.join()
+
+    def run(self, poll_timeout: float = 5, max_jobs: Optional[int] = None):
+        """Claim and run jobs until stop() is called (or max_jobs ran)."""
+        processed = 0
+        while not self._stop.is_set() and (max_jobs is None or processed < max_jobs):
+            self.queue.requeue_expired()
+            job = self.queue.claim(timeout=poll_timeout)
+            if job is None:
+                continue
+            logger.info(
+                "Worker %s running job %s (%s %s, attempt %d)",
+                self.worker_id, job.id, job.ticker, job.trade_date, job.attempts,
+            )
+            self.run_job(job)
+            processed += 1
+
+    def stop(self):
+        self._stop.set()
+
+
+def main():
+    """Run a worker: python -m tradingagents.graph.job_queue --redis-url ..."""
+    parser = argparse.ArgumentParser(description="TradingAgents analysis worker")
+    parser.add_argument("--redis-url", default=os.getenv("ANALYSIS_QUEUE_REDIS_URL", "redis://localhost:6379/0"))
+    parser.add_argument("--namespace", default=os.getenv("ANALYSIS_QUEUE_NAMESPACE", "tradingagents"))
+    parser.add_argument("--visibility-timeout", type=float, default=600)
+    parser.add_argument("--max-attempts", type=int, default=3)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    queue = AnalysisJobQueue.from_url(
+        args.redis_url,
+        namespace=args.namespace,
+        visibility_timeout=args.visibility_timeout,
+        max_attempts=args.max_attempts,
+    )
+    worker = AnalysisWorker(queue)
+    logger.info("Worker %s consuming %s", worker.worker_id, args.redis_url)
+    try:
+        worker.run()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+# TradingAgents/graph/process_pool.py
+
+import asyncio
+import json
+import multiprocessing
+import pickle
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Dict, List, Optional, Tuple
+
+# Graph built once per worker process by _init_worker
+_worker_graph = None
+
+
+def compact_state(final_state: Dict[str, Any]) -> str:
+    """Serialize a final state for transfer between processes.
+
+    The LangGraph message list is dropped, as in the result cache; every
+    report, debate turn and decision is kept.
+    """
+    state = {k: v for k, v in final_state.items() if k != "messages"}
+    return json.dumps(state, ensure_ascii=False, default=str)
+
+
+def _init_worker(config: Dict[str, Any], selected_analysts: List[str]):
+    # Imported here so the parent only pays for it when it runs analyses itself
+    from .trading_graph import TradingAgentsGraph
+
+    global _worker_graph
+    _worker_graph = TradingAgentsGraph(
+        selected_analysts=selected_analysts, debug=False, config=config
+    )
+
+
+class AnalysisWorkerError(RuntimeError):
+    """An analysis failed in a worker with an exception that cannot be sent back."""
+
+
+def _propagate(company_name: str, trade_date: str, use_cache: bool) -> Tuple[str, str]:
+    try:
+        final_state, decision = _worker_graph.propagate(company_name, trade_date, use_cache)
+    except Exception as exc:
+        # Some SDK errors take keyword-only arguments and fail to unpickle in
+        # the parent, which would mark the whole pool as broken
+        try:
+            pickle.loads(pickle.dumps(exc))
+        except Exception:
+            raise AnalysisWorkerError(f"{type(exc).__name__}: {exc}") from None
+        raise
+    return compact_state(final_state), decision
+
+
+class AnalysisProcessPool:
+    """Runs propagate() in worker processes holding warm graphs.
+
+    Each worker builds its TradingAgentsGraph once (LLM clients, memories,
+    caches, connection pools) and reuses it for every analysis it runs. The
+    pandas/stockstats work and JSON handling of a run then happen outside the
+    caller's process, so they never hold the GIL of e.g. a bot event loop.
+    Results come back as a compact JSON state without the message list.
+
+    Workers are started with the "spawn" method by default, which is safe in
+    processes that already run threads; the caller's main module is
+    re-imported in each worker, so it must guard its entry point with
+    ``if __name__ == "__main__"``.
+    """
+
+    def __init__(
+        self,
+        config: Dict[str, Any],
+        selected_analysts: Optional[List[str]] = None,
+        max_workers: int = 2,
+        max_tasks_per_child: Optional[int] = None,
+        start_method: str = "spawn",
+    ):
+        """Initialize the pool; workers are started on first use.
+
+        Args:
+            config: Graph configuration used by every worker
+            selected_analysts: Analysts of the graphs, all four by default
+            max_workers: Number of worker processes
+            max_tasks_per_child: Analyses after which a worker is replaced, to
+                bound its memory; None keeps workers for the pool's lifetime
+            start_method: multiprocessing start method of the workers
+        """
+        self.config = dict(config)
+        self.selected_analysts = list(
+            selected_analysts or ["market", "social", "news", "fundamentals"]
+        )
+        self.max_workers = max_workers
+        self.max_tasks_per_child = max_tasks_per_child
+        self.start_method = start_method
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                kwargs = {}
+                if self.max_tasks_per_child:
+                    kwargs["max_tasks_per_child"] = self.max_tasks_per_child
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context(self.start_method),
+                    initializer=_init_worker,
+                    initargs=(self.config, self.selected_analysts),
+                    **kwargs,
+                )
+            return self._executor
+
+    def _discard_executor(self, executor: ProcessPoolExecutor):
+        with self._lock:
+            if self._executor is executor:
+                self._executor = None
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    def submit(self, company_name: str, trade_date: str, use_cache: bool = True) -> Future:
+        """Start an analysis; the future resolves to (final_state, decision)."""
+        executor = self._get_executor()
+        try:
+            raw = executor.submit(_propagate, company_name, str(trade_date), use_cache)
+        except BrokenProcessPool:
+            # A worker died (e.g. killed for memory); start a fresh pool
+            self._discard_executor(executor)
+            executor = self._get_executor()
+            raw = executor.submit(_propagate, company_name, str(trade_date), use_cache)
+
+        result: Future = Future()
+
+        def _done(future: Future):
+            try:
+                state_json, decision = future.result()
+            except BaseException as exc:
+                if isinstance(exc, BrokenProcessPool):
+                    self._discard_executor(executor)
+                result.set_exception(exc)
+            else:
+                result.set_result((json.loads(state_json), decision))
+
+        raw.add_done_callback(_done)
+        return result
+
+    async def run(
+        self, company_name: str, trade_date: str, use_cache: bool = True
+    ) -> Tuple[Dict[str, Any], str]:
+        """Await an analysis without blocking the event loop."""
+        return await asyncio.wrap_future(self.submit(company_name, trade_date, use_cache))
+
+    def propagate(
+        self, company_name: str, trade_date: str, use_cache: bool = True
+    ) -> Tuple[Dict[str, Any], str]:
+        """Blocking equivalent of TradingAgentsGraph.propagate()."""
+        return self.submit(company_name, trade_date, use_cache).result()
+
+    def shutdown(self, wait: bool = True):
+        """Stop the worker processes."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
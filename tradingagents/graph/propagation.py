@@ -11,9 +11,16 @@ from tradingagents.agents.utils.agent_states import (
 class Propagator:
     """Handles state initialization and propagation through the graph."""
 
-    def __init__(self, max_recur_limit=100):
-        """Initialize with configuration parameters."""
+    def __init__(self, max_recur_limit=100, max_concurrency=None):
+        """Initialize with configuration parameters.
+
+        Args:
+            max_recur_limit: Recursion limit of the graph
+            max_concurrency: Maximum number of tasks (e.g. tool calls of one
+                message, which ToolNode runs in parallel) executed at once
+        """
         self.max_recur_limit = max_recur_limit
+        self.max_concurrency = max_concurrency
 
     def create_initial_state(
         self, company_name: str, trade_date: str
@@ -24,21 +31,23 @@ class Propagator:
             "company_of_interest": company_name,
             "trade_date": str(trade_date),
             "investment_debate_state": InvestDebateState(
-                {"history": "", "current_response": "", "count": 0}
+                {"current_response": "", "count": 0}
             ),
+            "investment_debate_turns": [],
             "risk_debate_state": RiskDebateState(
                 {
-                    "history": "",
                     "current_aggressive_response": "",
                     "current_conservative_response": "",
                     "current_neutral_response": "",
                     "count": 0,
                 }
             ),
+            "risk_debate_turns": [],
             "market_report": "",
             "fundamentals_report": "",
             "sentiment_report": "",
             "news_report": "",
+            "analyst_fingerprints": {},
         }
 
     def get_graph_args(self, callbacks: Optional[List] = None) -> Dict[str, Any]:
@@ -49,6 +58,8 @@ class Propagator:
                        Note: LLM callbacks are handled separately via LLM constructor.
         """
         config = {"recursion_limit": self.max_recur_limit}
+        if self.max_concurrency:
+            config["max_concurrency"] = self.max_concurrency
         if callbacks:
             config["callbacks"] = callbacks
         return {
@@ -1,8 +1,20 @@
 # TradingAgents/graph/reflection.py
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any
 from langchain_openai import ChatOpenAI
 
+from tradingagents.agents.utils.debate_transcript import render_turns
+
+# Component type -> function returning the analysis/decision to reflect on
+COMPONENT_REPORTS = {
+    "BULL": lambda state: render_turns(state.get("investment_debate_turns"), "Bull"),
+    "BEAR": lambda state: render_turns(state.get("investment_debate_turns"), "Bear"),
+    "TRADER": lambda state: state["trader_investment_plan"],
+    "INVEST JUDGE": lambda state: state["investment_debate_state"]["judge_decision"],
+    "RISK JUDGE": lambda state: state["risk_debate_state"]["judge_decision"],
+}
+
 
 class Reflector:
     """Handles reflection on decisions and updating memory."""
@@ -72,25 +84,63 @@ Adhere strictly to these instructions, and ensure your output is detailed, accur
         result = self.quick_thinking_llm.invoke(messages).content
         return result
 
+    def reflect_all(
+        self,
+        current_state: Dict[str, Any],
+        returns_losses,
+        memories: Dict[str, Any],
+        max_workers: int = 5,
+    ):
+        """Reflect on several components concurrently and update their memories.
+
+        The situation is extracted once and shared by every reflection. Each
+        memory receives all of its new entries in a single add_situations call.
+
+        Args:
+            current_state: Final state of the run being reflected on
+            returns_losses: Realized returns of the decision
+            memories: Component type (a COMPONENT_REPORTS key) -> memory to update
+            max_workers: Maximum number of concurrent reflection calls
+        """
+        situation = self._extract_current_situation(current_state)
+
+        def reflect(component_type):
+            report = COMPONENT_REPORTS[component_type](current_state)
+            return self._reflect_on_component(
+                component_type, report, situation, returns_losses
+            )
+
+        component_types = list(memories)
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            results = list(executor.map(reflect, component_types))
+
+        # Group by memory so a memory shared by components is indexed once
+        batches: Dict[int, tuple] = {}
+        for component_type, result in zip(component_types, results):
+            memory = memories[component_type]
+            batches.setdefault(id(memory), (memory, []))[1].append((situation, result))
+        for memory, entries in batches.values():
+            memory.add_situations(entries, outcome=returns_losses)
+
     def reflect_bull_researcher(self, current_state, returns_losses, bull_memory):
         """Reflect on bull researcher's analysis and update memory."""
         situation = self._extract_current_situation(current_state)
-        bull_debate_history = current_state["investment_debate_state"]["bull_history"]
+        bull_debate_history = COMPONENT_REPORTS["BULL"](current_state)
 
         result = self._reflect_on_component(
             "BULL", bull_debate_history, situation, returns_losses
         )
-        bull_memory.add_situations([(situation, result)])
+        bull_memory.add_situations([(situation, result)], outcome=returns_losses)
 
     def reflect_bear_researcher(self, current_state, returns_losses, bear_memory):
         """Reflect on bear researcher's analysis and update memory."""
         situation = self._extract_current_situation(current_state)
-        bear_debate_history = current_state["investment_debate_state"]["bear_history"]
+        bear_debate_history = COMPONENT_REPORTS["BEAR"](current_state)
 
         result = self._reflect_on_component(
             "BEAR", bear_debate_history, situation, returns_losses
         )
-        bear_memory.add_situations([(situation, result)])
+        bear_memory.add_situations([(situation, result)], outcome=returns_losses)
 
     def reflect_trader(self, current_state, returns_losses, trader_memory):
         """Reflect on trader's decision and update memory."""
@@ -100,7 +150,7 @@ Adhere strictly to these instructions, and ensure your output is detailed, accur
         result = self._reflect_on_component(
             "TRADER", trader_decision, situation, returns_losses
         )
-        trader_memory.add_situations([(situation, result)])
+        trader_memory.add_situations([(situation, result)], outcome=returns_losses)
 
     def reflect_invest_judge(self, current_state, returns_losses, invest_judge_memory):
         """Reflect on investment judge's decision and update memory."""
@@ -110,7 +160,7 @@ Adhere strictly to these instructions, and ensure your output is detailed, accur
         result = self._reflect_on_component(
             "INVEST JUDGE", judge_decision, situation, returns_losses
         )
-        invest_judge_memory.add_situations([(situation, result)])
+        invest_judge_memory.add_situations([(situation, result)], outcome=returns_losses)
 
     def reflect_risk_manager(self, current_state, returns_losses, risk_manager_memory):
         """Reflect on risk manager's decision and update memory."""
@@ -120,4 +170,4 @@ Adhere strictly to these instructions, and ensure your output is detailed, accur
         result = self._reflect_on_component(
             "RISK JUDGE", judge_decision, situation, returns_losses
         )
-        risk_manager_memory.add_situations([(situation, result)])
+        risk_manager_memory.add_situations([(situation, result)], outcome=returns_losses)
@@ -0,0 +1,157 @@
+# TradingAgents/graph/result_cache.py
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple
+
+from tradingagents.agents.utils.agent_states import STATE_SCHEMA_VERSION
+
+# Config keys that can change the analysis output: models, reasoning,
+# debate length, prompt compaction, memory retrieval, report reuse and data
+# vendors. Only these enter the cache key, and a queue worker takes only these
+# from a job's config; every other (operational) setting is its own.
+RESULT_CONFIG_KEYS = (
+    "llm_provider",
+    "deep_think_llm",
+    "quick_think_llm",
+    "backend_url",
+    "google_thinking_level",
+    "openai_reasoning_effort",
+    "llm_fallback_provider",
+    "llm_fallback_deep_llm",
+    "llm_fallback_quick_llm",
+    "max_debate_rounds",
+    "max_risk_discuss_rounds",
+    "memory_persist",
+    "memory_max_entries",
+    "memory_eviction_policy",
+    "memory_decay_half_life_days",
+    "memory_digest_terms",
+    "memory_digest_chars",
+    "memory_query_terms",
+    "analyst_tool_window",
+    "debate_history_token_budget",
+    "analyst_report_reuse",
+    "analyst_report_staleness_days",
+    "data_vendors",
+    "tool_vendors",
+)
+
+
+class ResultCache:
+    """Persistent cache of propagate() results keyed by ticker, date and config."""
+
+    def __init__(self, db_path: str, ttl_seconds: int = 6 * 60 * 60):
+        """Initialize the cache.
+
+        Args:
+            db_path: Path of the SQLite database file
+            ttl_seconds: How long a cached result stays valid
+        """
+        self.db_path = Path(db_path)
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS results (
+                    cache_key    TEXT PRIMARY KEY,
+                    ticker       TEXT NOT NULL,
+                    trade_date   TEXT NOT NULL,
+                    decision     TEXT NOT NULL,
+                    final_state  TEXT NOT NULL,
+                    created_at   REAL NOT NULL
+                )
+                """
+            )
+
+    @contextmanager
+    def _connect(self):
+        conn = sqlite3.connect(str(self.db_path), timeout=30)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    @staticmethod
+    def make_key(
+        company_name: str,
+        trade_date: str,
+        selected_analysts: List[str],
+        config: Dict[str, Any],
+    ) -> str:
+        """Build the cache key for a run.
+
+        The config part is a hash over the RESULT_CONFIG_KEYS settings, and
+        the state schema version keeps results of an older state shape from
+        being served.
+        """
+        relevant_config = {k: config.get(k) for k in RESULT_CONFIG_KEYS}
+        config_hash = hashlib.sha256(
+            json.dumps(relevant_config, sort_keys=True, default=str).encode("utf-8")
+        ).hexdigest()[:16]
+        analysts = ",".join(selected_analysts)
+        return (
+            f"{company_name.upper()}|{trade_date}|{analysts}|"
+            f"s{STATE_SCHEMA_VERSION}|{config_hash}"
+        )
+
+    def get(self, cache_key: str) -> Optional[Tuple[Dict[str, Any], str]]:
+        """Return (final_state, decision) for a fresh entry, or None."""
+        with self._lock, self._connect() as conn:
+            row = conn.execute(
+                "SELECT final_state, decision, created_at FROM results WHERE cache_key = ?",
+                (cache_key,),
+            ).fetchone()
+        if row is None:
+            return None
+        final_state, decision, created_at = row
+        if time.time() - created_at > self.ttl_seconds:
+            return None
+        return json.loads(final_state), decision
+
+    def put(
+        self,
+        cache_key: str,
+        final_state: Dict[str, Any],
+        decision: str,
+    ):
+        """Store the result of a run.
+
+        The LangGraph message list is dropped since it is not JSON
+        serializable and nothing downstream reads it.
+        """
+        state = {k: v for k, v in final_state.items() if k != "messages"}
+        with self._lock, self._connect() as conn:
+            conn.execute(
+                """
+                INSERT OR REPLACE INTO results
+                    (cache_key, ticker, trade_date, decision, final_state, created_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    cache_key,
+                    str(state.get("company_of_interest", "")),
+                    str(state.get("trade_date", "")),
+                    decision,
+                    json.dumps(state, ensure_ascii=False, default=str),
+                    time.time(),
+                ),
+            )
+            conn.execute(
+                "DELETE FROM results WHERE created_at < ?",
+                (time.time() - self.ttl_seconds,),
+            )
+
+    def clear(self):
+        """Remove all cached results."""
+        with self._lock, self._connect() as conn:
+            conn.execute("DELETE FROM results")
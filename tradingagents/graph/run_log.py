@@ -0,0 +1,159 @@
+# TradingAgents/graph/run_log.py
+
+import gzip
+import json
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows: appends are serialized per process only
+    fcntl = None
+
+# Segments roll over once they reach this size
+DEFAULT_SEGMENT_BYTES = 64 * 1024 * 1024
+
+
+class RunLogStore:
+    """Append-only, compressed log of run states with a SQLite index.
+
+    Each run is appended to the current segment file as its own gzip member
+    holding one JSON line, so a write costs O(run) and a segment is still a
+    valid .jsonl.gz file. The index maps ticker/date/decision to the byte
+    range of the member, so a lookup reads and inflates only that run.
+    """
+
+    def __init__(self, directory: str, max_segment_bytes: int = DEFAULT_SEGMENT_BYTES):
+        """Initialize the store.
+
+        Args:
+            directory: Directory holding the segments and index.db
+            max_segment_bytes: Size at which a new segment is started
+        """
+        self.directory = Path(directory)
+        self.max_segment_bytes = max_segment_bytes
+        self.db_path = self.directory / "index.db"
+        self._lock = threading.Lock()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS runs (
+                    id          INTEGER PRIMARY KEY AUTOINCREMENT,
+                    ticker      TEXT NOT NULL,
+                    trade_date  TEXT NOT NULL,
+                    decision    TEXT,
+                    segment     TEXT NOT NULL,
+                    offset      INTEGER NOT NULL,
+                    length      INTEGER NOT NULL,
+                    created_at  REAL NOT NULL
+                )
+                """
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_runs_ticker_date ON runs(ticker, trade_date)"
+            )
+
+    @contextmanager
+    def _connect(self):
+        conn = sqlite3.connect(str(self.db_path), timeout=30)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def _current_segment(self, conn) -> Path:
+        row = conn.execute("SELECT segment FROM runs ORDER BY id DESC LIMIT 1").fetchone()
+        if row is not None:
+            segment = self.directory / row[0]
+            if segment.exists() and segment.stat().st_size < self.max_segment_bytes:
+                return segment
+        return self.directory / f"runs-{time.strftime('%Y%m%d-%H%M%S')}-{time.time_ns() % 10**6:06d}.jsonl.gz"
+
+    def append(self, ticker: str, trade_date: str, state: Dict[str, Any], decision: Optional[str] = None) -> int:
+        """Append a run and return its id."""
+        line = json.dumps(state, ensure_ascii=False, default=str) + "\n"
+        member = gzip.compress(line.encode("utf-8"))
+        with self._lock, self._connect() as conn:
+            segment = self._current_segment(conn)
+            with open(segment, "ab") as f:
+                # Other processes (pool or queue workers) append to the same
+                # segment; hold its lock so the offset is where the bytes land
+                if fcntl is not None:
+                    fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+                try:
+                    offset = f.seek(0, os.SEEK_END)
+                    f.write(member)
+                    f.flush()
+                finally:
+                    if fcntl is not None:
+                        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            cursor = conn.execute(
+                """
+                INSERT INTO runs (ticker, trade_date, decision, segment, offset, length, created_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                """,
+                (ticker.upper(), str(trade_date), decision, segment.name, offset, len(member), time.time()),
+            )
+            return cursor.lastrowid
+
+    def _read(self, segment: str, offset: int, length: int) -> Dict[str, Any]:
+        with open(self.directory / segment, "rb") as f:
+            f.seek(offset)
+            return json.loads(gzip.decompress(f.read(length)))
+
+    def load(self, run_id: int) -> Optional[Dict[str, Any]]:
+        """Return the state of a run by id."""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT segment, offset, length FROM runs WHERE id = ?", (run_id,)
+            ).fetchone()
+        return self._read(*row) if row else None
+
+    def latest(self, ticker: str, trade_date: str) -> Optional[Dict[str, Any]]:
+        """Return the state of the newest run for a ticker and date."""
+        with self._connect() as conn:
+            row = conn.execute(
+                """
+                SELECT segment, offset, length FROM runs
+                WHERE ticker = ? AND trade_date = ?
+                ORDER BY id DESC LIMIT 1
+                """,
+                (ticker.upper(), str(trade_date)),
+            ).fetchone()
+        return self._read(*row) if row else None
+
+    def query(
+        self,
+        ticker: Optional[str] = None,
+        decision: Optional[str] = None,
+        limit: int = 100,
+    ) -> List[Dict[str, Any]]:
+        """Index entries (id, ticker, trade_date, decision, created_at), newest first."""
+        clauses, params = [], []
+        if ticker:
+            clauses.append("ticker = ?")
+            params.append(ticker.upper())
+        if decision:
+            clauses.append("decision = ?")
+            params.append(decision.upper())
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        with self._connect() as conn:
+            rows = conn.execute(
+                f"""
+                SELECT id, ticker, trade_date, decision, created_at FROM runs
+                {where} ORDER BY id DESC LIMIT ?
+                """,
+                (*params, limit),
+            ).fetchall()
+        return [
+            {"id": r[0], "ticker": r[1], "trade_date": r[2], "decision": r[3], "created_at": r[4]}
+            for r in rows
+        ]
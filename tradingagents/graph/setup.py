@@ -7,6 +7,10 @@ from langgraph.prebuilt import ToolNode
 
 from tradingagents.agents import *
 from tradingagents.agents.utils.agent_states import AgentState
+from tradingagents.agents.utils.report_store import (
+    AnalystReportStore,
+    create_reusable_analyst,
+)
 
 from .conditional_logic import ConditionalLogic
 
@@ -25,6 +29,8 @@ class GraphSetup:
         invest_judge_memory,
         risk_manager_memory,
         conditional_logic: ConditionalLogic,
+        report_store: AnalystReportStore = None,
+        reusable_analysts=(),
     ):
         """Initialize with required components."""
         self.quick_thinking_llm = quick_thinking_llm
@@ -36,6 +42,8 @@ class GraphSetup:
         self.invest_judge_memory = invest_judge_memory
         self.risk_manager_memory = risk_manager_memory
         self.conditional_logic = conditional_logic
+        self.report_store = report_store
+        self.reusable_analysts = reusable_analysts
 
     def setup_graph(
         self, selected_analysts=["market", "social", "news", "fundamentals"]
@@ -85,6 +93,23 @@ class GraphSetup:
             delete_nodes["fundamentals"] = create_msg_delete()
             tool_nodes["fundamentals"] = self.tool_nodes["fundamentals"]
 
+        # Reuse stored reports for analysts whose tool inputs are unchanged
+        if self.report_store is not None:
+            report_keys = {
+                "market": "market_report",
+                "social": "sentiment_report",
+                "news": "news_report",
+                "fundamentals": "fundamentals_report",
+            }
+            for analyst_type in analyst_nodes:
+                if analyst_type in self.reusable_analysts:
+                    analyst_nodes[analyst_type] = create_reusable_analyst(
+                        analyst_nodes[analyst_type],
+                        analyst_type,
+                        report_keys[analyst_type],
+                        self.report_store,
+                    )
+
         # Create researcher and manager nodes
         bull_researcher_node = create_bull_researcher(
             self.quick_thinking_llm, self.bull_memory
@@ -2,6 +2,8 @@
 
 from langchain_openai import ChatOpenAI
 
+from tradingagents.agents.utils.decision_parser import parse_decision
+
 
 class SignalProcessor:
     """Processes trading signals to extract actionable decisions."""
@@ -14,12 +16,19 @@ class SignalProcessor:
         """
         Process a full trading signal to extract the core decision.
 
+        The decision is parsed deterministically from the explicit proposal
+        marker; the LLM is only asked when the text is ambiguous.
+
         Args:
             full_signal: Complete trading signal text
 
         Returns:
             Extracted decision (BUY, SELL, or HOLD)
         """
+        decision = parse_decision(full_signal)
+        if decision is not None:
+            return decision
+
         messages = [
             (
                 "system",
@@ -1,24 +1,34 @@
 # TradingAgents/graph/trading_graph.py
 
 import os
-from pathlib import Path
-import json
+from collections import deque
 from datetime import date
 from typing import Dict, Any, Tuple, List, Optional
 
 from langgraph.prebuilt import ToolNode
 
-from tradingagents.llm_clients import create_llm_client
+from tradingagents.llm_clients import (
+    PRIORITY_DEEP,
+    PRIORITY_QUICK,
+    HedgedChatModel,
+    create_llm_client,
+    get_config_response_cache,
+    get_latency_tracker,
+    get_rate_limit_kwargs,
+)
 
 from tradingagents.agents import *
 from tradingagents.default_config import DEFAULT_CONFIG
 from tradingagents.agents.utils.memory import FinancialSituationMemory
+from tradingagents.agents.utils.report_store import AnalystReportStore
+from tradingagents.agents.utils.debate_transcript import render_turns
 from tradingagents.agents.utils.agent_states import (
     AgentState,
     InvestDebateState,
     RiskDebateState,
 )
-from tradingagents.dataflows.config import set_config
+from tradingagents.dataflows.config import config_scope, set_config
+from tradingagents.dataflows.interface import vendor_call_scope
 
 # Import the new abstract tool methods from agent_utils
 from tradingagents.agents.utils.agent_utils import (
@@ -38,6 +48,8 @@ from .setup import GraphSetup
 from .propagation import Propagator
 from .reflection import Reflector
 from .signal_processing import SignalProcessor
+from .result_cache import ResultCache
+from .run_log import RunLogStore
 
 
 class TradingAgentsGraph:
@@ -60,6 +72,7 @@ class TradingAgentsGraph:
         """
         self.debug = debug
         self.config = config or DEFAULT_CONFIG
+        self.selected_analysts = list(selected_analysts)
         self.callbacks = callbacks or []
 
         # Update the interface's config
@@ -78,21 +91,42 @@ class TradingAgentsGraph:
         if self.callbacks:
             llm_kwargs["callbacks"] = self.callbacks
 
+        # Connection pools shared by every graph in the process
+        if self.config.get("llm_http_pool") is not None:
+            llm_kwargs["http_pool"] = self.config["llm_http_pool"]
+
+        # Persistent LLM response cache (record/replay)
+        response_cache = get_config_response_cache(self.config)
+        if response_cache is not None:
+            llm_kwargs["cache"] = response_cache
+
         deep_client = create_llm_client(
             provider=self.config["llm_provider"],
             model=self.config["deep_think_llm"],
             base_url=self.config.get("backend_url"),
-            **llm_kwargs,
+            **self._with_rate_limit(llm_kwargs, self.config["deep_think_llm"], PRIORITY_DEEP),
         )
         quick_client = create_llm_client(
             provider=self.config["llm_provider"],
             model=self.config["quick_think_llm"],
             base_url=self.config.get("backend_url"),
-            **llm_kwargs,
+            **self._with_rate_limit(llm_kwargs, self.config["quick_think_llm"], PRIORITY_QUICK),
         )
 
-        self.deep_thinking_llm = deep_client.get_llm()
-        self.quick_thinking_llm = quick_client.get_llm()
+        self.deep_thinking_llm = self._with_hedging(
+            deep_client.get_llm(),
+            self.config["deep_think_llm"],
+            self.config.get("llm_fallback_deep_llm"),
+            llm_kwargs,
+            PRIORITY_DEEP,
+        )
+        self.quick_thinking_llm = self._with_hedging(
+            quick_client.get_llm(),
+            self.config["quick_think_llm"],
+            self.config.get("llm_fallback_quick_llm"),
+            llm_kwargs,
+            PRIORITY_QUICK,
+        )
         
         # Initialize memories
         self.bull_memory = FinancialSituationMemory("bull_memory", self.config)
@@ -101,11 +135,22 @@ class TradingAgentsGraph:
         self.invest_judge_memory = FinancialSituationMemory("invest_judge_memory", self.config)
         self.risk_manager_memory = FinancialSituationMemory("risk_manager_memory", self.config)
 
+        # Stored analyst reports for incremental re-analysis
+        self.report_store = None
+        if self.config.get("analyst_report_reuse"):
+            self.report_store = AnalystReportStore(
+                os.path.join(self.config["cache_dir"], "analyst_reports.db"),
+                staleness_days=self.config.get("analyst_report_staleness_days", 3),
+            )
+
         # Create tool nodes
         self.tool_nodes = self._create_tool_nodes()
 
         # Initialize components
-        self.conditional_logic = ConditionalLogic()
+        self.conditional_logic = ConditionalLogic(
+            max_debate_rounds=self.config["max_debate_rounds"],
+            max_risk_discuss_rounds=self.config["max_risk_discuss_rounds"],
+        )
         self.graph_setup = GraphSetup(
             self.quick_thinking_llm,
             self.deep_thinking_llm,
@@ -116,16 +161,35 @@ class TradingAgentsGraph:
             self.invest_judge_memory,
             self.risk_manager_memory,
             self.conditional_logic,
+            report_store=self.report_store,
+            reusable_analysts=self.config.get("analyst_report_reuse", []),
         )
 
-        self.propagator = Propagator()
+        self.propagator = Propagator(
+            self.config["max_recur_limit"],
+            max_concurrency=self.config.get("max_tool_concurrency"),
+        )
         self.reflector = Reflector(self.quick_thinking_llm)
         self.signal_processor = SignalProcessor(self.quick_thinking_llm)
 
-        # State tracking
+        # Persistent run-level result cache
+        self.result_cache = None
+        if self.config.get("result_cache_enabled"):
+            self.result_cache = ResultCache(
+                os.path.join(self.config["cache_dir"], "result_cache.db"),
+                ttl_seconds=self.config.get("result_cache_ttl", 6 * 60 * 60),
+            )
+
+        # State tracking: the latest state (for reflection) plus a bounded
+        # number of recent ones; older states are only kept in the run log
         self.curr_state = None
         self.ticker = None
-        self.log_states_dict = {}  # date to full state dict
+        self.recent_states = deque(maxlen=max(self.config.get("state_retention", 1), 1))
+
+        # Append-only log of every run's final state
+        self.run_log = RunLogStore(
+            self.config.get("run_log_dir", "./eval_results/run_logs")
+        )
 
         # Set up the graph
         self.graph = self.graph_setup.setup_graph(selected_analysts)
@@ -135,6 +199,9 @@ class TradingAgentsGraph:
         kwargs = {}
         provider = self.config.get("llm_provider", "").lower()
 
+        if self.config.get("prompt_caching"):
+            kwargs["prompt_caching"] = True
+
         if provider == "google":
             thinking_level = self.config.get("google_thinking_level")
             if thinking_level:
@@ -147,6 +214,63 @@ class TradingAgentsGraph:
 
         return kwargs
 
+    def _with_rate_limit(
+        self,
+        llm_kwargs: Dict[str, Any],
+        model: str,
+        priority: int,
+        provider: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Route a model's calls through its shared rate governor, if limited."""
+        limit_kwargs = get_rate_limit_kwargs(
+            provider or self.config["llm_provider"],
+            model,
+            self.config.get("llm_rate_limits"),
+            priority,
+        )
+        if not limit_kwargs:
+            return llm_kwargs
+        kwargs = dict(llm_kwargs)
+        kwargs["rate_limiter"] = limit_kwargs["rate_limiter"]
+        kwargs["callbacks"] = list(llm_kwargs.get("callbacks", [])) + limit_kwargs["callbacks"]
+        return kwargs
+
+    def _with_hedging(
+        self,
+        llm,
+        model: str,
+        fallback_model: Optional[str],
+        llm_kwargs: Dict[str, Any],
+        priority: int,
+    ):
+        """Wrap a chat model with hedged requests and failover, if enabled."""
+        if not self.config.get("llm_hedging"):
+            return llm
+
+        provider = self.config["llm_provider"].lower()
+        fallback = None
+        if fallback_model:
+            fallback_provider = (self.config.get("llm_fallback_provider") or provider).lower()
+            # Provider-specific settings (thinking levels, ...) do not carry over
+            fallback_kwargs = {
+                k: v for k, v in llm_kwargs.items() if k in ("callbacks", "cache", "http_pool")
+            }
+            fallback = create_llm_client(
+                provider=fallback_provider,
+                model=fallback_model,
+                base_url=self.config.get("backend_url") if fallback_provider == provider else None,
+                **self._with_rate_limit(fallback_kwargs, fallback_model, priority, fallback_provider),
+            ).get_llm()
+
+        return HedgedChatModel(
+            llm,
+            get_latency_tracker(f"{provider}:{model}"),
+            fallback=fallback,
+            hedge_percentile=self.config.get("llm_hedge_percentile", 95),
+            min_samples=self.config.get("llm_hedge_min_samples", 20),
+            timeout=self.config.get("llm_request_timeout"),
+        )
+
     def _create_tool_nodes(self) -> Dict[str, ToolNode]:
         """Create tool nodes for different data sources using abstract methods."""
         return {
@@ -183,44 +307,92 @@ class TradingAgentsGraph:
             ),
         }
 
-    def propagate(self, company_name, trade_date):
-        """Run the trading agents graph for a company on a specific date."""
+    def propagate(self, company_name, trade_date, use_cache=True):
+        """Run the trading agents graph for a company on a specific date.
+
+        Args:
+            company_name: Ticker symbol to analyze
+            trade_date: Trade date (YYYY-MM-DD)
+            use_cache: Set to False to bypass the result cache and force a fresh run
+        """
 
         self.ticker = company_name
 
+        cache_key = None
+        if self.result_cache is not None:
+            cache_key = ResultCache.make_key(
+                company_name, str(trade_date), self.selected_analysts, self.config
+            )
+            cached = self.result_cache.get(cache_key) if use_cache else None
+            if cached is not None:
+                final_state, signal = cached
+                self._retain_state(final_state)
+                return final_state, signal
+
         # Initialize state
         init_agent_state = self.propagator.create_initial_state(
             company_name, trade_date
         )
         args = self.propagator.get_graph_args()
 
-        if self.debug:
-            # Debug mode with tracing
-            trace = []
-            for chunk in self.graph.stream(init_agent_state, **args):
-                if len(chunk["messages"]) == 0:
-                    pass
-                else:
-                    chunk["messages"][-1].pretty_print()
-                    trace.append(chunk)
-
-            final_state = trace[-1]
-        else:
-            # Standard mode without tracing
-            final_state = self.graph.invoke(init_agent_state, **args)
+        # Tools read this graph's config even when other graphs run
+        # concurrently; identical vendor calls within the run are fetched once
+        with config_scope(self.config), vendor_call_scope():
+            if self.debug:
+                # Debug mode: print each step as it streams; only the latest
+                # snapshot is kept rather than a trace of every step
+                final_state = None
+                for chunk in self.graph.stream(init_agent_state, **args):
+                    if len(chunk["messages"]) == 0:
+                        pass
+                    else:
+                        chunk["messages"][-1].pretty_print()
+                        final_state = chunk
+            else:
+                # Standard mode without tracing
+                final_state = self.graph.invoke(init_agent_state, **args)
 
         # Store current state for reflection
-        self.curr_state = final_state
+        self._retain_state(final_state)
+
+        # The Risk Judge already provides the parsed decision; only fall back
+        # to the signal processor when it was ambiguous
+        signal = final_state.get("final_decision") or self.process_signal(
+            final_state["final_trade_decision"]
+        )
 
         # Log state
-        self._log_state(trade_date, final_state)
+        self._log_state(trade_date, final_state, signal)
+
+        if cache_key is not None:
+            self.result_cache.put(cache_key, final_state, signal)
 
         # Return decision and processed signal
-        return final_state, self.process_signal(final_state["final_trade_decision"])
+        return final_state, signal
 
-    def _log_state(self, trade_date, final_state):
-        """Log the final state to a JSON file."""
-        self.log_states_dict[str(trade_date)] = {
+    def _retain_state(self, final_state):
+        """Keep a finished run's state within the configured retention."""
+        self.curr_state = final_state
+        self.recent_states.append(final_state)
+
+    def get_state(self, company_name, trade_date) -> Optional[Dict[str, Any]]:
+        """Return the final state of a run, from memory or else the run log.
+
+        States loaded from the run log hold the logged fields only.
+        """
+        for state in reversed(self.recent_states):
+            if (
+                state["company_of_interest"] == company_name
+                and state["trade_date"] == str(trade_date)
+            ):
+                return state
+        return self.run_log.latest(company_name, str(trade_date))
+
+    def _log_state(self, trade_date, final_state, decision=None):
+        """Append the final state to the run log."""
+        investment_turns = final_state.get("investment_debate_turns")
+        risk_turns = final_state.get("risk_debate_turns")
+        state_log = {
             "company_of_interest": final_state["company_of_interest"],
             "trade_date": final_state["trade_date"],
             "market_report": final_state["market_report"],
@@ -228,9 +400,9 @@ class TradingAgentsGraph:
             "news_report": final_state["news_report"],
             "fundamentals_report": final_state["fundamentals_report"],
             "investment_debate_state": {
-                "bull_history": final_state["investment_debate_state"]["bull_history"],
-                "bear_history": final_state["investment_debate_state"]["bear_history"],
-                "history": final_state["investment_debate_state"]["history"],
+                "bull_history": render_turns(investment_turns, "Bull"),
+                "bear_history": render_turns(investment_turns, "Bear"),
+                "history": render_turns(investment_turns),
                 "current_response": final_state["investment_debate_state"][
                     "current_response"
                 ],
@@ -240,42 +412,32 @@ class TradingAgentsGraph:
             },
             "trader_investment_decision": final_state["trader_investment_plan"],
             "risk_debate_state": {
-                "aggressive_history": final_state["risk_debate_state"]["aggressive_history"],
-                "conservative_history": final_state["risk_debate_state"]["conservative_history"],
-                "neutral_history": final_state["risk_debate_state"]["neutral_history"],
-                "history": final_state["risk_debate_state"]["history"],
+                "aggressive_history": render_turns(risk_turns, "Aggressive"),
+                "conservative_history": render_turns(risk_turns, "Conservative"),
+                "neutral_history": render_turns(risk_turns, "Neutral"),
+                "history": render_turns(risk_turns),
                 "judge_decision": final_state["risk_debate_state"]["judge_decision"],
             },
             "investment_plan": final_state["investment_plan"],
             "final_trade_decision": final_state["final_trade_decision"],
+            "final_decision": final_state.get("final_decision", ""),
         }
 
-        # Save to file
-        directory = Path(f"eval_results/{self.ticker}/TradingAgentsStrategy_logs/")
-        directory.mkdir(parents=True, exist_ok=True)
-
-        with open(
-            f"eval_results/{self.ticker}/TradingAgentsStrategy_logs/full_states_log_{trade_date}.json",
-            "w",
-        ) as f:
-            json.dump(self.log_states_dict, f, indent=4)
+        self.run_log.append(self.ticker, str(trade_date), state_log, decision)
 
     def reflect_and_remember(self, returns_losses):
         """Reflect on decisions and update memory based on returns."""
-        self.reflector.reflect_bull_researcher(
-            self.curr_state, returns_losses, self.bull_memory
-        )
-        self.reflector.reflect_bear_researcher(
-            self.curr_state, returns_losses, self.bear_memory
-        )
-        self.reflector.reflect_trader(
-            self.curr_state, returns_losses, self.trader_memory
-        )
-        self.reflector.reflect_invest_judge(
-            self.curr_state, returns_losses, self.invest_judge_memory
-        )
-        self.reflector.reflect_risk_manager(
-            self.curr_state, returns_losses, self.risk_manager_memory
+        self.reflector.reflect_all(
+            self.curr_state,
+            returns_losses,
+            {
+                "BULL": self.bull_memory,
+                "BEAR": self.bear_memory,
+                "TRADER": self.trader_memory,
+                "INVEST JUDGE": self.invest_judge_memory,
+                "RISK JUDGE": self.risk_manager_memory,
+            },
+            max_workers=self.config.get("max_reflection_workers", 5),
         )
 
     def process_signal(self, full_signal):
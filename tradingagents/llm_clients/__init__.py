@@ -1,4 +1,33 @@
 from .base_client import BaseLLMClient
 from .factory import create_llm_client
+from .response_cache import (
+    LLMCacheMissError,
+    SQLiteResponseCache,
+    get_config_response_cache,
+    get_response_cache,
+)
+from .hedging import HedgedChatModel, get_latency_tracker, latency_stats
+from .rate_governor import (
+    PRIORITY_DEEP,
+    PRIORITY_QUICK,
+    LLMRateGovernor,
+    get_rate_governor,
+    get_rate_limit_kwargs,
+)
 
-__all__ = ["BaseLLMClient", "create_llm_client"]
+__all__ = [
+    "BaseLLMClient",
+    "create_llm_client",
+    "LLMCacheMissError",
+    "SQLiteResponseCache",
+    "get_response_cache",
+    "get_config_response_cache",
+    "PRIORITY_DEEP",
+    "PRIORITY_QUICK",
+    "LLMRateGovernor",
+    "get_rate_governor",
+    "get_rate_limit_kwargs",
+    "HedgedChatModel",
+    "get_latency_tracker",
+    "latency_stats",
+]
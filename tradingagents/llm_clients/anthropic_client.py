@@ -1,13 +1,58 @@
 from typing import Any, Optional
 
 from langchain_anthropic import ChatAnthropic
+from langchain_core.messages import SystemMessage, convert_to_messages
+from langchain_core.prompt_values import PromptValue
 
 from .base_client import BaseLLMClient
 from .validators import validate_model
 
 
+def _mark_cacheable_prefix(input):
+    """Put an ephemeral cache_control breakpoint on a leading system prompt."""
+    if isinstance(input, PromptValue):
+        input = input.to_messages()
+    if not isinstance(input, list) or not input:
+        return input
+
+    messages = convert_to_messages(input)
+    first = messages[0]
+    if isinstance(first, SystemMessage) and isinstance(first.content, str) and first.content:
+        messages[0] = SystemMessage(
+            content=[
+                {
+                    "type": "text",
+                    "text": first.content,
+                    "cache_control": {"type": "ephemeral"},
+                }
+            ]
+        )
+    return messages
+
+
+class CachingChatAnthropic(ChatAnthropic):
+    """ChatAnthropic that marks the leading system prompt as a cacheable prefix.
+
+    Agents put content shared across calls (analyst system prompts, the
+    analyst reports used by researchers and debaters) in the first system
+    message, so later calls read it from Anthropic's prompt cache.
+    """
+
+    prompt_caching: bool = False
+
+    def invoke(self, input, config=None, **kwargs):
+        if self.prompt_caching:
+            input = _mark_cacheable_prefix(input)
+        return super().invoke(input, config, **kwargs)
+
+
 class AnthropicClient(BaseLLMClient):
-    """Client for Anthropic Claude models."""
+    """Client for Anthropic Claude models.
+
+    ChatAnthropic takes no custom HTTP client; langchain-anthropic already
+    shares one cached httpx client per (base_url, timeout) across instances,
+    so http_pool is not used here.
+    """
 
     def __init__(self, model: str, base_url: Optional[str] = None, **kwargs):
         super().__init__(model, base_url, **kwargs)
@@ -16,11 +61,11 @@ class AnthropicClient(BaseLLMClient):
         """Return configured ChatAnthropic instance."""
         llm_kwargs = {"model": self.model}
 
-        for key in ("timeout", "max_retries", "api_key", "max_tokens", "callbacks"):
+        for key in ("timeout", "max_retries", "api_key", "max_tokens", "callbacks", "prompt_caching", "cache", "rate_limiter"):
             if key in self.kwargs:
                 llm_kwargs[key] = self.kwargs[key]
 
-        return ChatAnthropic(**llm_kwargs)
+        return CachingChatAnthropic(**llm_kwargs)
 
     def validate_model(self) -> bool:
         """Validate model for Anthropic."""
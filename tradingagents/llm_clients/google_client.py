@@ -3,6 +3,7 @@ from typing import Any, Optional
 from langchain_google_genai import ChatGoogleGenerativeAI
 
 from .base_client import BaseLLMClient
+from .http_transport import get_shared_transport
 from .validators import validate_model
 
 
@@ -29,7 +30,12 @@ class NormalizedChatGoogleGenerativeAI(ChatGoogleGenerativeAI):
 
 
 class GoogleClient(BaseLLMClient):
-    """Client for Google Gemini models."""
+    """Client for Google Gemini models.
+
+    Gemini 2.5+ models cache repeated prompt prefixes implicitly, so
+    prompt_caching needs no extra request parameters here; agents only have
+    to keep shared content at the start of the prompt.
+    """
 
     def __init__(self, model: str, base_url: Optional[str] = None, **kwargs):
         super().__init__(model, base_url, **kwargs)
@@ -38,10 +44,17 @@ class GoogleClient(BaseLLMClient):
         """Return configured ChatGoogleGenerativeAI instance."""
         llm_kwargs = {"model": self.model}
 
-        for key in ("timeout", "max_retries", "google_api_key", "callbacks"):
+        for key in ("timeout", "max_retries", "google_api_key", "callbacks", "cache", "rate_limiter"):
             if key in self.kwargs:
                 llm_kwargs[key] = self.kwargs[key]
 
+        # The genai client is rebuilt for every model; a shared transport
+        # keeps its connections alive across graph instances
+        if "http_pool" in self.kwargs:
+            llm_kwargs["client_args"] = {
+                "transport": get_shared_transport("google", self.base_url, self.kwargs["http_pool"])
+            }
+
         # Map thinking_level to appropriate API param based on model
         # Gemini 3 Pro: low, high
         # Gemini 3 Flash: minimal, low, medium, high
@@ -0,0 +1,314 @@
+"""Hedged LLM requests and latency-aware failover.
+
+HedgedChatModel wraps a chat model (and optionally a fallback model) and is a
+drop-in for it in the agents, which only use invoke() and bind_tools().
+
+* Latencies are tracked per (provider, model); attempts abandoned at the
+  timeout are recorded at the timeout, so slow calls are not left out.
+* Once enough samples exist, a call still running after the configured
+  latency percentile gets a duplicate (hedged) request to the same model;
+  whichever finishes first is returned.
+* When every attempt times out or fails with a transient error (timeout,
+  429/5xx), the call is retried once on the fallback model.
+
+Hedged duplicates are real provider calls and count against the rate budget.
+Losing attempts still queued are cancelled; one already running cannot be
+interrupted, but the run's callbacks (token and call statistics, tracing) only
+ever see the events of the attempt whose result is returned, so a call that
+times out or fails over is not counted twice.
+"""
+
+import asyncio
+import contextvars
+import inspect
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Deque, Dict, Optional
+
+import numpy as np
+from langchain_core.callbacks import BaseCallbackManager
+from langchain_core.runnables import Runnable, ensure_config
+
+# Hedged attempts run on a shared pool; the caller's thread only waits
+_executor = ThreadPoolExecutor(max_workers=32, thread_name_prefix="llm-hedge")
+
+
+class LatencyTracker:
+    """Rolling latency samples and hedging/failover counters of one model."""
+
+    def __init__(self, window: int = 200):
+        self._samples: Deque[float] = deque(maxlen=window)
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.hedged = 0
+        self.hedge_wins = 0
+        self.failovers = 0
+
+    def record(self, seconds: float):
+        with self._lock:
+            self._samples.append(seconds)
+
+    def percentile(self, percentile: float, min_samples: int = 1) -> Optional[float]:
+        """Latency percentile in seconds, or None with too few samples."""
+        with self._lock:
+            if len(self._samples) < max(min_samples, 1):
+                return None
+            return float(np.percentile(list(self._samples), percentile))
+
+    def count(self, field: str):
+        with self._lock:
+            setattr(self, field, getattr(self, field) + 1)
+
+    def stats(self) -> Dict[str, Any]:
+        """Tail-latency statistics and counters."""
+        with self._lock:
+            samples = list(self._samples)
+            stats = {
+                "calls": self.calls,
+                "hedged": self.hedged,
+                "hedge_wins": self.hedge_wins,
+                "failovers": self.failovers,
+                "samples": len(samples),
+            }
+        if samples:
+            p50, p95, p99 = (float(p) for p in np.percentile(samples, [50, 95, 99]))
+            stats.update(p50=round(p50, 3), p95=round(p95, 3), p99=round(p99, 3), max=round(max(samples), 3))
+        return stats
+
+
+_trackers: Dict[str, LatencyTracker] = {}
+_trackers_lock = threading.Lock()
+
+
+def get_latency_tracker(key: str) -> LatencyTracker:
+    """Return the process-wide latency tracker of a "provider:model" key."""
+    with _trackers_lock:
+        if key not in _trackers:
+            _trackers[key] = LatencyTracker()
+        return _trackers[key]
+
+
+def latency_stats() -> Dict[str, Dict[str, Any]]:
+    """Latency statistics of every tracked model."""
+    with _trackers_lock:
+        trackers = dict(_trackers)
+    return {key: tracker.stats() for key, tracker in trackers.items()}
+
+
+def is_transient_error(exc: BaseException) -> bool:
+    """Whether a failed call is worth failing over (timeouts, 429 and 5xx)."""
+    if isinstance(exc, TimeoutError) or "Timeout" in type(exc).__name__:
+        return True
+    status = getattr(exc, "status_code", None) or getattr(exc, "code", None)
+    if status is None and getattr(exc, "response", None) is not None:
+        status = getattr(exc.response, "status_code", None)
+    return isinstance(status, int) and (status == 429 or status >= 500)
+
+
+class _AttemptGate:
+    """Holds an attempt's callback events until it is known to be the winner."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._events: list = []
+        self._state = "pending"
+
+    def emit(self, handler, name: str, args, kwargs):
+        with self._lock:
+            if self._state == "pending":
+                self._events.append((handler, name, args, kwargs))
+                return None
+            if self._state == "lost":
+                return None
+        return _call_handler(handler, name, args, kwargs)
+
+    def win(self):
+        with self._lock:
+            events, self._events, self._state = self._events, [], "won"
+        for handler, name, args, kwargs in events:
+            _call_handler(handler, name, args, kwargs)
+
+    def lose(self):
+        with self._lock:
+            self._events, self._state = [], "lost"
+
+
+def _call_handler(handler, name: str, args, kwargs):
+    result = getattr(handler, name)(*args, **kwargs)
+    if inspect.isawaitable(result):
+        asyncio.run(result)
+    return result
+
+
+class _GatedHandler:
+    """Callback handler proxy routing on_* events through an _AttemptGate."""
+
+    def __init__(self, handler, gate: _AttemptGate):
+        self._handler = handler
+        self._gate = gate
+
+    def __getattr__(self, name):
+        attr = getattr(self._handler, name)
+        if not name.startswith("on_") or not callable(attr):
+            return attr
+        return lambda *args, **kwargs: self._gate.emit(self._handler, name, args, kwargs)
+
+
+def _gated_config(config: Dict[str, Any], gate: _AttemptGate) -> Dict[str, Any]:
+    callbacks = config.get("callbacks")
+    if isinstance(callbacks, BaseCallbackManager):
+        wrapped = {id(h): _GatedHandler(h, gate) for h in callbacks.handlers}
+        for h in callbacks.inheritable_handlers:
+            wrapped.setdefault(id(h), _GatedHandler(h, gate))
+        manager = callbacks.copy()
+        manager.handlers = [wrapped[id(h)] for h in callbacks.handlers]
+        manager.inheritable_handlers = [wrapped[id(h)] for h in callbacks.inheritable_handlers]
+        callbacks = manager
+    elif callbacks:
+        callbacks = [_GatedHandler(h, gate) for h in callbacks]
+    return {**config, "callbacks": callbacks}
+
+
+class HedgedChatModel(Runnable):
+    """Chat model wrapper issuing hedged requests and failing over on errors."""
+
+    def __init__(
+        self,
+        primary: Runnable,
+        tracker: LatencyTracker,
+        fallback: Optional[Runnable] = None,
+        hedge_percentile: float = 95,
+        min_samples: int = 20,
+        timeout: Optional[float] = None,
+        max_hedges: int = 1,
+    ):
+        """Initialize the wrapper.
+
+        Args:
+            primary: Chat model (or tool-bound model) to call
+            tracker: Latency tracker of the primary model
+            fallback: Model used when the primary attempts fail transiently
+            hedge_percentile: Latency percentile after which a duplicate is sent
+            min_samples: Samples required before hedging starts
+            timeout: Seconds before the primary attempts are abandoned, None to wait
+            max_hedges: Maximum number of duplicate requests per call
+        """
+        self.primary = primary
+        self.tracker = tracker
+        self.fallback = fallback
+        self.hedge_percentile = hedge_percentile
+        self.min_samples = min_samples
+        self.timeout = timeout
+        self.max_hedges = max_hedges
+
+    def bind_tools(self, tools, **kwargs) -> "HedgedChatModel":
+        return HedgedChatModel(
+            self.primary.bind_tools(tools, **kwargs),
+            self.tracker,
+            fallback=self.fallback.bind_tools(tools, **kwargs) if self.fallback else None,
+            hedge_percentile=self.hedge_percentile,
+            min_samples=self.min_samples,
+            timeout=self.timeout,
+            max_hedges=self.max_hedges,
+        )
+
+    def _submit(self, input, config, gate: Optional[_AttemptGate], **kwargs):
+        # Copy the context so tracing and run-scoped state follow the call
+        context = contextvars.copy_context()
+        if gate is not None:
+            config = _gated_config(config, gate)
+        started = time.monotonic()
+        future = _executor.submit(context.run, self.primary.invoke, input, config, **kwargs)
+        return future, started
+
+    def _invoke_primary(self, input, config, **kwargs):
+        hedge_after = self.tracker.percentile(self.hedge_percentile, self.min_samples)
+        deadline = time.monotonic() + self.timeout if self.timeout else None
+        # Whenever another call may stand in for an attempt (a hedge, the
+        # timeout or the fallback), attempts report their callbacks through
+        # gates, so only the events of the call whose outcome is returned
+        # reach the handlers and an abandoned attempt is never counted
+        gated = hedge_after is not None or deadline is not None or self.fallback is not None
+        config = ensure_config(config) if gated else config
+        gates: Dict[Any, _AttemptGate] = {}
+
+        def submit():
+            gate = _AttemptGate() if gated else None
+            future, attempt_started = self._submit(input, config, gate, **kwargs)
+            if gate is not None:
+                gates[future] = gate
+            return future, attempt_started
+
+        def abandon(futures):
+            for pending in futures:
+                pending.cancel()
+                if pending in gates:
+                    gates[pending].lose()
+
+        future, started = submit()
+        attempts = {future: started}
+        hedges = 0
+        error: Optional[BaseException] = None
+
+        while attempts:
+            now = time.monotonic()
+            wait_for = None
+            if hedge_after is not None and hedges < self.max_hedges:
+                wait_for = max(started + hedge_after * (hedges + 1) - now, 0)
+            if deadline is not None:
+                remaining = max(deadline - now, 0)
+                wait_for = remaining if wait_for is None else min(wait_for, remaining)
+
+            done, _ = wait(attempts, timeout=wait_for, return_when=FIRST_COMPLETED)
+            for finished in done:
+                attempt_started = attempts.pop(finished)
+                try:
+                    result = finished.result()
+                except Exception as exc:
+                    error = exc
+                    if is_transient_error(exc):
+                        self.tracker.record(time.monotonic() - attempt_started)
+                    if finished in gates:
+                        # The last attempt's error is what the caller sees,
+                        # unless the fallback takes over the call
+                        fails_over = self.fallback is not None and is_transient_error(exc)
+                        if attempts or fails_over:
+                            gates[finished].lose()
+                        else:
+                            gates[finished].win()
+                    continue
+                self.tracker.record(time.monotonic() - attempt_started)
+                if attempt_started != started:
+                    self.tracker.count("hedge_wins")
+                abandon(attempts)
+                if finished in gates:
+                    gates[finished].win()
+                return result
+
+            if done:
+                continue
+            if deadline is not None and time.monotonic() >= deadline:
+                # Censored samples: these calls took at least the timeout
+                for _ in attempts:
+                    self.tracker.record(self.timeout)
+                abandon(attempts)
+                raise TimeoutError(f"LLM call did not finish within {self.timeout}s")
+            if hedges < self.max_hedges and hedge_after is not None:
+                hedges += 1
+                self.tracker.count("hedged")
+                hedge, hedge_started = submit()
+                attempts[hedge] = hedge_started
+
+        raise error
+
+    def invoke(self, input, config=None, **kwargs):
+        self.tracker.count("calls")
+        try:
+            return self._invoke_primary(input, config, **kwargs)
+        except Exception as exc:
+            if self.fallback is None or not is_transient_error(exc):
+                raise
+            self.tracker.count("failovers")
+            return self.fallback.invoke(input, config, **kwargs)
@@ -0,0 +1,81 @@
+"""Shared, connection-pooled HTTP transports for LLM clients.
+
+Chat models are rebuilt for every TradingAgentsGraph, and the bot builds a new
+graph per ticker. Without sharing, each graph opens fresh connections (and
+pays the TLS handshake again) to the same provider endpoint. Transports here
+are created once per (provider, base_url) and outlive the clients using them,
+so keep-alive connections are reused across graph instances.
+"""
+
+import threading
+from types import ModuleType
+from typing import Dict, Optional, Tuple
+
+import httpx
+
+# Defaults for the "llm_http_pool" config entry
+DEFAULT_POOL_LIMITS = {
+    "max_connections": 100,
+    "max_keepalive_connections": 20,
+    "keepalive_expiry": 30.0,
+}
+
+
+class SharedTransport:
+    """Pooled sync and async transport shared by many httpx clients.
+
+    Clients close their transport when they are closed or collected; since
+    this one is shared, close() and aclose() leave the pools open.
+    """
+
+    def __init__(self, limits: dict, httpx_module: ModuleType = httpx):
+        """Initialize the transport.
+
+        Args:
+            limits: httpx.Limits arguments
+            httpx_module: httpx implementation used by the SDK the transport
+                is handed to (openai>=3 and anthropic use the httpx2 fork)
+        """
+        pool_limits = httpx_module.Limits(**limits)
+        self._sync = httpx_module.HTTPTransport(limits=pool_limits)
+        self._async = httpx_module.AsyncHTTPTransport(limits=pool_limits)
+
+    def handle_request(self, request):
+        return self._sync.handle_request(request)
+
+    async def handle_async_request(self, request):
+        return await self._async.handle_async_request(request)
+
+    def close(self) -> None:
+        pass
+
+    async def aclose(self) -> None:
+        pass
+
+
+_transports: Dict[Tuple[str, Optional[str], str], SharedTransport] = {}
+_transports_lock = threading.Lock()
+
+
+def get_shared_transport(
+    provider: str,
+    base_url: Optional[str] = None,
+    pool: Optional[dict] = None,
+    httpx_module: ModuleType = httpx,
+) -> SharedTransport:
+    """Return the process-wide transport of (provider, base_url).
+
+    Args:
+        provider: LLM provider
+        base_url: API endpoint, None for the provider default
+        pool: max_connections, max_keepalive_connections and keepalive_expiry
+            overrides; only applied when the transport is first created
+        httpx_module: httpx implementation used by the provider SDK
+    """
+    key = (provider.lower(), base_url, httpx_module.__name__)
+    with _transports_lock:
+        transport = _transports.get(key)
+        if transport is None:
+            limits = {**DEFAULT_POOL_LIMITS, **(pool or {})}
+            transport = _transports[key] = SharedTransport(limits, httpx_module)
+        return transport
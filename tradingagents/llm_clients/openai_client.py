@@ -1,9 +1,12 @@
 import os
 from typing import Any, Optional
 
+import openai
 from langchain_openai import ChatOpenAI
+from langchain_openai._compat import httpx as openai_httpx
 
 from .base_client import BaseLLMClient
+from .http_transport import get_shared_transport
 from .validators import validate_model
 
 
@@ -61,10 +64,26 @@ class OpenAIClient(BaseLLMClient):
         elif self.base_url:
             llm_kwargs["base_url"] = self.base_url
 
-        for key in ("timeout", "max_retries", "reasoning_effort", "api_key", "callbacks"):
+        for key in ("timeout", "max_retries", "reasoning_effort", "api_key", "callbacks", "cache", "rate_limiter"):
             if key in self.kwargs:
                 llm_kwargs[key] = self.kwargs[key]
 
+        # Reuse pooled connections to the endpoint across graph instances
+        if "http_pool" in self.kwargs:
+            transport = get_shared_transport(
+                self.provider,
+                llm_kwargs.get("base_url"),
+                self.kwargs["http_pool"],
+                httpx_module=openai_httpx,
+            )
+            llm_kwargs["http_client"] = openai.DefaultHttpxClient(transport=transport)
+            llm_kwargs["http_async_client"] = openai.DefaultAsyncHttpxClient(transport=transport)
+
+        # OpenAI caches prompt prefixes automatically; a stable cache key
+        # routes requests sharing a prefix to the same cache
+        if self.provider == "openai" and self.kwargs.get("prompt_caching"):
+            llm_kwargs["extra_body"] = {"prompt_cache_key": f"tradingagents-{self.model}"}
+
         return UnifiedChatOpenAI(**llm_kwargs)
 
     def validate_model(self) -> bool:
@@ -0,0 +1,304 @@
+"""Provider-aware concurrency governor for LLM calls.
+
+Every chat model created for the same (provider, model) shares one governor,
+so graphs running in parallel threads draw from a single requests-per-minute
+and tokens-per-minute budget instead of each tripping the provider's 429s.
+Calls that would exceed the budget wait in a priority queue: deep-think calls
+(research manager, trader, risk judge) are admitted before quick-think ones
+(analysts, debaters), and calls of equal priority are admitted in FIFO order.
+
+The governor plugs into LangChain through the chat models' ``rate_limiter``
+argument, which is consulted after the response cache, so cache hits are never
+throttled. Token usage is reserved up front from a running estimate and
+corrected with the actual usage reported to the callback handler. Each
+reservation belongs to the LangChain run that made it: the handler announces
+the run when the model starts, the rate limiter reserves under that run id,
+and the run's end or error settles or releases exactly that reservation.
+"""
+
+import asyncio
+import heapq
+import itertools
+import threading
+import time
+from collections import deque
+from contextvars import ContextVar
+from typing import Any, Deque, Dict, Hashable, Optional, Tuple
+from uuid import UUID
+
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.outputs import LLMResult
+from langchain_core.rate_limiters import BaseRateLimiter
+
+PRIORITY_DEEP = 0
+PRIORITY_QUICK = 1
+
+# Token reservation for the first calls, before any usage has been observed
+_INITIAL_TOKEN_ESTIMATE = 4000
+
+# Runs started in this context that have not reached the rate limiter yet.
+# LangChain starts a model's callbacks, checks its cache and only then calls
+# the rate limiter, all in the caller's context.
+_pending_runs: ContextVar[Tuple[UUID, ...]] = ContextVar("governor_pending_runs", default=())
+
+
+def _take_pending_run() -> Optional[UUID]:
+    pending = _pending_runs.get()
+    if not pending:
+        return None
+    _pending_runs.set(pending[1:])
+    return pending[0]
+
+
+def _discard_pending_run(run_id: UUID):
+    pending = _pending_runs.get()
+    if run_id in pending:
+        _pending_runs.set(tuple(r for r in pending if r != run_id))
+
+
+class LLMRateGovernor:
+    """Sliding-window RPM/TPM budget with a priority admission queue."""
+
+    def __init__(
+        self,
+        rpm: Optional[int] = None,
+        tpm: Optional[int] = None,
+        window_seconds: float = 60.0,
+    ):
+        """Initialize the governor.
+
+        Args:
+            rpm: Requests per window, None for unlimited
+            tpm: Tokens per window, None for unlimited
+            window_seconds: Length of the sliding window
+        """
+        self.rpm = rpm
+        self.tpm = tpm
+        self.window_seconds = window_seconds
+
+        self._cond = threading.Condition()
+        self._waiters: list = []
+        self._sequence = itertools.count()
+        self._requests: Deque[float] = deque()
+        self._tokens: Deque[Tuple[float, int]] = deque()
+        self._token_total = 0
+        self._reservations: Dict[Hashable, int] = {}
+        self._token_estimate = float(_INITIAL_TOKEN_ESTIMATE)
+
+        self.total_requests = 0
+        self.total_tokens = 0
+        self.total_wait_seconds = 0.0
+
+    def _prune(self, now: float):
+        horizon = now - self.window_seconds
+        while self._requests and self._requests[0] <= horizon:
+            self._requests.popleft()
+        while self._tokens and self._tokens[0][0] <= horizon:
+            self._token_total -= self._tokens.popleft()[1]
+
+    def _wait_time(self, now: float, tokens: int) -> float:
+        """Seconds until a call reserving tokens fits the budget."""
+        wait = 0.0
+        if self.rpm and len(self._requests) >= self.rpm:
+            oldest_to_expire = self._requests[len(self._requests) - self.rpm]
+            wait = max(wait, oldest_to_expire + self.window_seconds - now)
+        if self.tpm and self._token_total + tokens > self.tpm:
+            excess = self._token_total + tokens - self.tpm
+            for timestamp, count in self._tokens:
+                excess -= count
+                if excess <= 0:
+                    wait = max(wait, timestamp + self.window_seconds - now)
+                    break
+        return wait
+
+    def acquire(
+        self,
+        priority: int = PRIORITY_QUICK,
+        blocking: bool = True,
+        run_id: Optional[Hashable] = None,
+    ) -> bool:
+        """Wait for a slot in the budget and reserve it.
+
+        Args:
+            priority: Lower values are admitted first (PRIORITY_DEEP, PRIORITY_QUICK)
+            blocking: When False, return immediately if no slot is free
+            run_id: Call whose usage or failure later settles the reservation;
+                without one the reservation simply ages out of the window
+
+        Returns:
+            True when the call was admitted
+        """
+        started = time.monotonic()
+        ticket = (priority, next(self._sequence))
+        with self._cond:
+            heapq.heappush(self._waiters, ticket)
+            admitted = False
+            try:
+                while True:
+                    now = time.monotonic()
+                    self._prune(now)
+                    tokens = int(self._token_estimate)
+                    if self.tpm:
+                        tokens = min(tokens, self.tpm)
+
+                    timeout = None
+                    if self._waiters[0] == ticket:
+                        timeout = self._wait_time(now, tokens)
+                        if timeout <= 0:
+                            heapq.heappop(self._waiters)
+                            self._requests.append(now)
+                            self._tokens.append((now, tokens))
+                            self._token_total += tokens
+                            if run_id is not None:
+                                self._reservations[run_id] = tokens
+                            self.total_requests += 1
+                            self.total_wait_seconds += now - started
+                            admitted = True
+                            return True
+
+                    if not blocking:
+                        return False
+                    self._cond.wait(timeout)
+            finally:
+                if not admitted:
+                    self._waiters.remove(ticket)
+                    heapq.heapify(self._waiters)
+                # The next waiter may be admissible now
+                self._cond.notify_all()
+
+    def record_usage(self, run_id: Hashable, tokens: int):
+        """Replace the reservation of a finished call with its actual usage.
+
+        Calls without a reservation (e.g. response cache hits) are ignored.
+        """
+        with self._cond:
+            reserved = self._reservations.pop(run_id, None)
+            if reserved is None:
+                return
+            if tokens:
+                now = time.monotonic()
+                self._tokens.append((now, tokens - reserved))
+                self._token_total += tokens - reserved
+                self.total_tokens += tokens
+                self._token_estimate = 0.8 * self._token_estimate + 0.2 * tokens
+            self._cond.notify_all()
+
+    def release(self, run_id: Hashable):
+        """Give back the tokens reserved by a call that failed."""
+        with self._cond:
+            reserved = self._reservations.pop(run_id, None)
+            if reserved is None:
+                return
+            self._tokens.append((time.monotonic(), -reserved))
+            self._token_total -= reserved
+            self._cond.notify_all()
+
+    def stats(self) -> Dict[str, Any]:
+        """Usage counters of the governor."""
+        with self._cond:
+            return {
+                "requests": self.total_requests,
+                "tokens": self.total_tokens,
+                "wait_seconds": round(self.total_wait_seconds, 3),
+                "queued": len(self._waiters),
+                "token_estimate": int(self._token_estimate),
+                "reserved_calls": len(self._reservations),
+            }
+
+
+class GovernedRateLimiter(BaseRateLimiter):
+    """LangChain rate limiter that admits calls through an LLMRateGovernor."""
+
+    def __init__(self, governor: LLMRateGovernor, priority: int = PRIORITY_QUICK):
+        self.governor = governor
+        self.priority = priority
+
+    def acquire(self, *, blocking: bool = True) -> bool:
+        return self.governor.acquire(self.priority, blocking, _take_pending_run())
+
+    async def aacquire(self, *, blocking: bool = True) -> bool:
+        return await asyncio.to_thread(
+            self.governor.acquire, self.priority, blocking, _take_pending_run()
+        )
+
+
+class GovernorUsageHandler(BaseCallbackHandler):
+    """Ties reservations to runs and reports their outcome to the governor."""
+
+    # Run in the caller's context so the rate limiter sees the started run
+    run_inline = True
+
+    def __init__(self, governor: LLMRateGovernor):
+        self.governor = governor
+
+    def on_chat_model_start(self, serialized: Any, messages: Any, *, run_id: UUID, **kwargs: Any) -> None:
+        _pending_runs.set(_pending_runs.get() + (run_id,))
+
+    def on_llm_start(self, serialized: Any, prompts: Any, *, run_id: UUID, **kwargs: Any) -> None:
+        _pending_runs.set(_pending_runs.get() + (run_id,))
+
+    def on_llm_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any) -> None:
+        _discard_pending_run(run_id)
+        self.governor.release(run_id)
+
+    def on_llm_end(self, response: LLMResult, *, run_id: UUID, **kwargs: Any) -> None:
+        # A cache hit ends without reaching the rate limiter
+        _discard_pending_run(run_id)
+        tokens = 0
+        usage = (response.llm_output or {}).get("token_usage") or {}
+        if usage.get("total_tokens"):
+            tokens = usage["total_tokens"]
+        else:
+            for generations in response.generations:
+                for generation in generations:
+                    message = getattr(generation, "message", None)
+                    usage_metadata = getattr(message, "usage_metadata", None) or {}
+                    tokens += usage_metadata.get("total_tokens", 0)
+        self.governor.record_usage(run_id, tokens)
+
+
+_governors: Dict[str, LLMRateGovernor] = {}
+_governors_lock = threading.Lock()
+
+
+def get_rate_governor(
+    provider: str, model: str, rpm: Optional[int] = None, tpm: Optional[int] = None
+) -> LLMRateGovernor:
+    """Return the process-wide governor of (provider, model).
+
+    The limits of an existing governor are updated to the given values.
+    """
+    key = f"{provider.lower()}:{model}"
+    with _governors_lock:
+        governor = _governors.get(key)
+        if governor is None:
+            governor = _governors[key] = LLMRateGovernor(rpm, tpm)
+        else:
+            governor.rpm, governor.tpm = rpm, tpm
+        return governor
+
+
+def get_rate_limit_kwargs(
+    provider: str, model: str, limits: Dict[str, Dict[str, int]], priority: int
+) -> Dict[str, Any]:
+    """Client kwargs that route a model's calls through its shared governor.
+
+    Args:
+        provider: LLM provider
+        model: Model name
+        limits: "provider:model" -> {"rpm": ..., "tpm": ...}
+        priority: PRIORITY_DEEP or PRIORITY_QUICK
+
+    Returns:
+        {"rate_limiter": ..., "callbacks": [...]}, or {} when the model has no limits
+    """
+    model_limits = (limits or {}).get(f"{provider.lower()}:{model}")
+    if not model_limits:
+        return {}
+    governor = get_rate_governor(
+        provider, model, model_limits.get("rpm"), model_limits.get("tpm")
+    )
+    return {
+        "rate_limiter": GovernedRateLimiter(governor, priority),
+        "callbacks": [GovernorUsageHandler(governor)],
+    }
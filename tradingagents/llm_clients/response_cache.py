@@ -0,0 +1,206 @@
+"""Persistent LLM response cache with record/replay modes.
+
+Implements LangChain's BaseCache on top of a local SQLite file and is passed to
+the chat models through the ``cache`` constructor argument. LangChain looks the
+cache up before every provider call using the serialized messages (message ids
+stripped) and an ``llm_string`` describing the provider class, model, request
+parameters and bound tools, so the key covers
+(provider, model, normalized messages, params).
+
+Modes:
+    off          No caching (the cache object is not created at all)
+    read-write   Serve hits from the cache, record misses after the live call
+    replay-only  Serve hits from the cache, raise LLMCacheMissError on a miss
+                 instead of calling the provider
+
+The same file records the vendor data results (route_to_vendor) a run used.
+Live tool output changes every prompt that quotes it, so in replay-only mode
+vendor calls are also served from the recording and a call that was never
+recorded raises LLMCacheMissError instead of reaching yfinance or Alpha
+Vantage. A recorded run can therefore be replayed entirely offline.
+"""
+
+import hashlib
+import os
+import re
+import sqlite3
+import threading
+import time
+import warnings
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from langchain_core.caches import RETURN_VAL_TYPE, BaseCache
+from langchain_core.load import dumps, loads
+
+CACHE_MODES = ("off", "read-write", "replay-only")
+
+# Tool outputs carry fetch timestamps that would make every prompt unique
+_VOLATILE_LINE = re.compile(r"# Data retrieved on: [0-9: -]+(\\n|\n)")
+
+
+class LLMCacheMissError(RuntimeError):
+    """Raised in replay-only mode when an LLM or vendor call has no recorded response."""
+    pass
+
+
+class SQLiteResponseCache(BaseCache):
+    """SQLite-backed LangChain cache for chat model responses."""
+
+    def __init__(self, db_path: str, mode: str = "read-write"):
+        """Initialize the cache.
+
+        Args:
+            db_path: Path of the SQLite database file
+            mode: "read-write" or "replay-only"
+        """
+        if mode not in CACHE_MODES or mode == "off":
+            raise ValueError(f"Unsupported LLM cache mode: {mode}")
+        self.db_path = Path(db_path)
+        self.mode = mode
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS llm_responses (
+                    cache_key    TEXT PRIMARY KEY,
+                    llm_string   TEXT NOT NULL,
+                    generations  TEXT NOT NULL,
+                    created_at   REAL NOT NULL
+                )
+                """
+            )
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS vendor_results (
+                    cache_key    TEXT PRIMARY KEY,
+                    method       TEXT NOT NULL,
+                    result       TEXT NOT NULL,
+                    created_at   REAL NOT NULL
+                )
+                """
+            )
+
+    @contextmanager
+    def _connect(self):
+        conn = sqlite3.connect(str(self.db_path), timeout=30)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _make_key(prompt: str, llm_string: str) -> str:
+        normalized_prompt = _VOLATILE_LINE.sub("", prompt)
+        digest = hashlib.sha256()
+        digest.update(llm_string.encode("utf-8"))
+        digest.update(b"\x00")
+        digest.update(normalized_prompt.encode("utf-8"))
+        return digest.hexdigest()
+
+    def lookup(self, prompt: str, llm_string: str) -> Optional[RETURN_VAL_TYPE]:
+        """Return recorded generations for the call, if any."""
+        cache_key = self._make_key(prompt, llm_string)
+        with self._lock, self._connect() as conn:
+            row = conn.execute(
+                "SELECT generations FROM llm_responses WHERE cache_key = ?",
+                (cache_key,),
+            ).fetchone()
+
+        if row is not None:
+            self.hits += 1
+            with warnings.catch_warnings():
+                # loads() is flagged beta; the records are our own output
+                warnings.simplefilter("ignore")
+                return loads(row[0])
+
+        self.misses += 1
+        if self.mode == "replay-only":
+            raise LLMCacheMissError(
+                f"No recorded LLM response for this call (key {cache_key[:12]}) in {self.db_path}. "
+                "Record it first with llm_cache_mode='read-write'."
+            )
+        return None
+
+    def update(self, prompt: str, llm_string: str, return_val: RETURN_VAL_TYPE) -> None:
+        """Record the generations of a live call."""
+        if self.mode != "read-write":
+            return
+        cache_key = self._make_key(prompt, llm_string)
+        generations = dumps(list(return_val))
+        with self._lock, self._connect() as conn:
+            conn.execute(
+                """
+                INSERT OR REPLACE INTO llm_responses
+                    (cache_key, llm_string, generations, created_at)
+                VALUES (?, ?, ?, ?)
+                """,
+                (cache_key, llm_string, generations, time.time()),
+            )
+
+    def lookup_vendor_result(self, cache_key: str, method: str) -> Optional[str]:
+        """Recorded result of a vendor call; raises on a miss in replay-only mode.
+
+        Only replay-only runs read the recording; read-write runs fetch live
+        data and record it again.
+        """
+        with self._lock, self._connect() as conn:
+            row = conn.execute(
+                "SELECT result FROM vendor_results WHERE cache_key = ?", (cache_key,)
+            ).fetchone()
+        if row is not None:
+            return row[0]
+        if self.mode == "replay-only":
+            raise LLMCacheMissError(
+                f"No recorded {method} result for this call (key {cache_key}) in {self.db_path}. "
+                "Record it first with llm_cache_mode='read-write'."
+            )
+        return None
+
+    def record_vendor_result(self, cache_key: str, method: str, result: Any) -> None:
+        """Record the result a live vendor call returned to the run."""
+        if self.mode != "read-write" or not isinstance(result, str):
+            return
+        with self._lock, self._connect() as conn:
+            conn.execute(
+                """
+                INSERT OR REPLACE INTO vendor_results (cache_key, method, result, created_at)
+                VALUES (?, ?, ?, ?)
+                """,
+                (cache_key, method, result, time.time()),
+            )
+
+    def clear(self, **kwargs) -> None:
+        """Remove all recorded responses."""
+        with self._lock, self._connect() as conn:
+            conn.execute("DELETE FROM llm_responses")
+            conn.execute("DELETE FROM vendor_results")
+
+
+_shared_caches: Dict[tuple, SQLiteResponseCache] = {}
+_shared_caches_lock = threading.Lock()
+
+
+def get_response_cache(db_path: str, mode: str) -> Optional[SQLiteResponseCache]:
+    """Return the process-wide cache for (db_path, mode), or None when mode is "off"."""
+    if mode == "off":
+        return None
+    key = (str(Path(db_path).resolve()), mode)
+    with _shared_caches_lock:
+        if key not in _shared_caches:
+            _shared_caches[key] = SQLiteResponseCache(db_path, mode)
+        return _shared_caches[key]
+
+
+def get_config_response_cache(config: Dict[str, Any]) -> Optional[SQLiteResponseCache]:
+    """Return the response cache a config selects (llm_cache_mode/llm_cache_path)."""
+    return get_response_cache(
+        config.get("llm_cache_path") or os.path.join(config["cache_dir"], "llm_responses.db"),
+        config.get("llm_cache_mode", "off"),
+    )